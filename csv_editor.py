@@ -1,6 +1,7 @@
 import sys
 import csv
 import os
+import io
 import json
 import requests
 import subprocess
@@ -9,6 +10,14 @@ import time
 import chardet
 import re
 import random
+import threading
+import bisect
+import queue
+import multiprocessing
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from collections import deque, OrderedDict, Counter
 from pathlib import Path
 from enum import Enum
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
@@ -17,9 +26,12 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QMessageBox, QStatusBar, QInputDialog, QDialog, QLabel,
                              QComboBox, QLineEdit, QPushButton, QFormLayout, QProgressDialog,
                              QTextEdit, QGroupBox, QCheckBox, QSpinBox, QDoubleSpinBox,
-                             QListWidget, QListWidgetItem, QHBoxLayout)
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QThreadPool, QRunnable
-from PyQt6.QtGui import QAction, QKeySequence, QColor
+                             QListWidget, QListWidgetItem, QHBoxLayout, QDockWidget,
+                             QProgressBar, QAbstractItemView, QDateTimeEdit,
+                             QTableView, QHeaderView, QStyledItemDelegate)
+from PyQt6.QtCore import (Qt, QTimer, QThread, pyqtSignal, QThreadPool, QRunnable, QObject, QDateTime,
+                          QAbstractTableModel, QModelIndex, QEventLoop)
+from PyQt6.QtGui import QAction, QActionGroup, QKeySequence, QColor, QBrush, QUndoStack, QUndoCommand
 
 # New imports for translation services
 try:
@@ -34,12 +46,2372 @@ try:
 except ImportError:
     TENACITY_AVAILABLE = False
 
+def read_csv_file(file_path):
+    """Read a CSV file with encoding and dialect detection; returns (rows, encoding)"""
+    # Step 1: Detect file encoding
+    encoding = 'utf-8'  # Default
+    try:
+        with open(file_path, 'rb') as f:
+            raw_data = f.read()
+            result = chardet.detect(raw_data)
+            if result['encoding']:
+                encoding = result['encoding']
+                print(f"Detected encoding: {encoding} (confidence: {result['confidence']})")
+    except Exception as e:
+        print(f"Encoding detection failed, using UTF-8: {e}")
+    
+    # Step 2: Read sample to detect CSV dialect
+    dialect = None
+    try:
+        with open(file_path, 'r', encoding=encoding, newline='') as f:
+            sample = f.read(8192)  # Read first 8KB
+            sniffer = csv.Sniffer()
+            dialect = sniffer.sniff(sample)
+            print(f"Detected delimiter: '{dialect.delimiter}'")
+    except Exception as e:
+        print(f"Dialect detection failed, using default: {e}")
+    
+    # Step 3: Load CSV data with detected settings
+    rows = []
+    encodings_to_try = [encoding, 'utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+    
+    for enc in encodings_to_try:
+        try:
+            with open(file_path, 'r', encoding=enc, newline='') as f:
+                if dialect:
+                    reader = csv.reader(f, dialect=dialect)
+                else:
+                    reader = csv.reader(f)
+                
+                rows = []
+                for row in reader:
+                    rows.append(row)
+            
+            # Successfully loaded
+            print(f"Successfully loaded with encoding: {enc}")
+            break
+            
+        except UnicodeDecodeError:
+            if enc == encodings_to_try[-1]:
+                raise  # Re-raise if last encoding fails
+            continue
+        except Exception as e:
+            if enc == encodings_to_try[-1]:
+                raise
+            print(f"Loading with encoding {enc} failed, trying the next one: {e}")
+            continue
+    
+    return rows, encoding
+
+
+def detect_lang_code(name):
+    """Guess a language code from a column name"""
+    name_lower = name.lower()
+    if "english" in name_lower or name_lower == "en":
+        return "EN"
+    elif "chinese" in name_lower or name_lower == "zh":
+        return "ZH"
+    elif "japanese" in name_lower or name_lower == "ja":
+        return "JA"
+    elif "korean" in name_lower or name_lower == "ko":
+        return "KO"
+    return ""
+
+
+class AhoCorasick:
+    """
+    Finds every occurrence of a fixed set of terms in one pass over the text
+    (an Aho-Corasick automaton). Matching ignores case. Terms that start or end
+    with an ASCII letter or digit only match as whole words there, so "Hit"
+    does not match inside "White"; other scripts (e.g. Korean with attached
+    particles) match anywhere.
+    """
+    
+    def __init__(self, terms):
+        self.terms = [term.lower() for term in terms]
+        self.goto = [{}]  # state -> {char: next state}
+        self.fail = [0]
+        self.output = [[]]  # state -> term indexes ending there, longest first
+        
+        for index, term in enumerate(self.terms):
+            if not term:
+                continue
+            state = 0
+            for char in term:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = next_state
+            self.output[state].append(index)
+        
+        # Breadth-first, so a state's failure link is finished before its children's
+        level = list(self.goto[0].values())
+        while level:
+            next_level = []
+            for state in level:
+                for char, child in self.goto[state].items():
+                    fallback = self.fail[state]
+                    while fallback and char not in self.goto[fallback]:
+                        fallback = self.fail[fallback]
+                    target = self.goto[fallback].get(char, 0)
+                    self.fail[child] = target if target != child else 0
+                    self.output[child] = self.output[child] + self.output[self.fail[child]]
+                    next_level.append(child)
+            level = next_level
+    
+    def find_all(self, text):
+        """Every (start, end, term index) in text, overlapping matches included"""
+        matches = []
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        terms = self.terms
+        folded = text.lower()
+        if len(folded) != len(text):
+            # A few characters lowercase to two ('İ'); keep positions aligned with text
+            folded = "".join(char.lower()[:1] for char in text)
+        state = 0
+        for position, char in enumerate(folded):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                start = position + 1 - len(terms[index])
+                if self._is_whole(text, start, position + 1):
+                    matches.append((start, position + 1, index))
+        return matches
+    
+    def find(self, text):
+        """Non-overlapping (start, end, term index) matches, leftmost and then longest first"""
+        matches = sorted(self.find_all(text), key=lambda match: (match[0], -match[1]))
+        selected = []
+        covered = 0
+        for match in matches:
+            if match[0] >= covered:
+                selected.append(match)
+                covered = match[1]
+        return selected
+    
+    @staticmethod
+    def _is_whole(text, start, end):
+        def is_word(char):
+            return char.isascii() and (char.isalnum() or char == "_")
+        if is_word(text[start]) and start > 0 and is_word(text[start - 1]):
+            return False
+        if is_word(text[end - 1]) and end < len(text) and is_word(text[end]):
+            return False
+        return True
+
+
+class Glossary:
+    """
+    Fixed translations of game terms, one entry per row of a glossary CSV
+    whose columns are languages ("English", "Korean", or codes like "EN").
+    An automaton per language is built when the glossary is loaded, so each
+    lookup is a single pass over the text.
+    """
+    
+    def __init__(self, entries, path=""):
+        self.entries = entries  # [{lang code: term}]
+        self.path = path
+        self.matchers = {}  # lang code -> (AhoCorasick, entry indexes of its terms)
+        for lang in {lang for entry in entries for lang in entry}:
+            indexes = [idx for idx, entry in enumerate(entries) if entry.get(lang)]
+            self.matchers[lang] = (AhoCorasick([entries[idx][lang] for idx in indexes]), indexes)
+    
+    @classmethod
+    def load(cls, file_path):
+        """Read a glossary CSV; columns that are not languages (e.g. "Notes") are ignored"""
+        rows, _ = read_csv_file(file_path)
+        if not rows:
+            raise ValueError("The glossary file is empty")
+        columns = []
+        for idx, header in enumerate(rows[0]):
+            lang = detect_lang_code(str(header).strip())
+            if lang:
+                columns.append((idx, lang))
+        if len(columns) < 2:
+            raise ValueError("The glossary needs at least two language columns, e.g. English and Korean")
+        
+        entries = []
+        for row_data in rows[1:]:
+            entry = {lang: row_data[idx].strip() for idx, lang in columns if idx < len(row_data) and row_data[idx].strip()}
+            if len(entry) >= 2:
+                entries.append(entry)
+        return cls(entries, file_path)
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def languages(self):
+        return sorted(self.matchers)
+    
+    def find_terms(self, text, source_lang, target_lang):
+        """Glossary terms in text as [(start, end, fixed translation)]"""
+        matcher = self.matchers.get(source_lang.upper())
+        target_lang = target_lang.upper()
+        if matcher is None or target_lang not in self.matchers:
+            return []
+        automaton, indexes = matcher
+        found = []
+        for start, end, index in automaton.find(text):
+            translation = self.entries[indexes[index]].get(target_lang)
+            if translation:
+                found.append((start, end, translation))
+        return found
+    
+    def protect(self, text, source_lang, target_lang, mode="protect"):
+        """
+        Prepare text for a translation service. In "protect" mode each glossary
+        term becomes a placeholder token that restore() turns into the fixed
+        translation; in "substitute" mode the fixed translation is inserted
+        directly. Returns (text, translations of the placeholders).
+        """
+        found = self.find_terms(text, source_lang, target_lang)
+        if not found:
+            return text, []
+        parts = []
+        protected = []
+        position = 0
+        for start, end, translation in found:
+            parts.append(text[position:start])
+            if mode == "substitute":
+                parts.append(translation)
+            else:
+                parts.append(f"XQ{len(protected)}QX")
+                protected.append(translation)
+            position = end
+        parts.append(text[position:])
+        return "".join(parts), protected
+    
+    PLACEHOLDER_RE = re.compile(r"X\s*Q\s*(\d+)\s*Q\s*X", re.IGNORECASE)
+    
+    def restore(self, text, protected):
+        """Put the fixed translations back in place of protect()'s placeholders"""
+        if not protected:
+            return text
+        
+        def fixed(match):
+            index = int(match.group(1))
+            return protected[index] if index < len(protected) else match.group()
+        
+        return self.PLACEHOLDER_RE.sub(fixed, text)
+    
+    def violations(self, source, translation, source_lang, target_lang):
+        """Glossary terms of source whose fixed translation is missing from translation, as [(term, fixed)]"""
+        found = self.find_terms(source, source_lang, target_lang)
+        if not found:
+            return []
+        translation_lower = translation.lower()
+        missing = []
+        for start, end, fixed in found:
+            if fixed.lower() not in translation_lower:
+                missing.append((source[start:end], fixed))
+        return missing
+
+
 class TranslationService(Enum):
     GOOGLE = "google"
     MYMEMORY = "mymemory"
 
 
+class DeferredRetryQueue:
+    """Failed segments waiting for another attempt, bounded by a job-wide retry budget"""
+    
+    def __init__(self, budget, max_attempts):
+        self.budget = budget
+        self.max_attempts = max_attempts
+        self.retries_used = 0
+        self.dropped = 0
+        self._items = deque()
+    
+    def __len__(self):
+        return len(self._items)
+    
+    def push(self, key, text, attempts):
+        """Queue a segment for later; returns False if it has used up its attempts"""
+        if attempts >= self.max_attempts:
+            self.dropped += 1
+            return False
+        self._items.append((key, text, attempts))
+        return True
+    
+    def pop(self):
+        """Take the next segment and charge one retry to the budget"""
+        self.retries_used += 1
+        return self._items.popleft()
+    
+    def has_budget(self):
+        return self.retries_used < self.budget
+    
+    def abandon(self):
+        """Drop everything still queued and return it"""
+        remaining = list(self._items)
+        self.dropped += len(remaining)
+        self._items.clear()
+        return remaining
+
+
+class SingleFlight:
+    """Coalesces identical calls so only one of them runs while the others wait for its result"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}  # key -> [done_event, result, exception]
+        self.coalesced = 0
+    
+    def reset_coalesced(self):
+        with self._lock:
+            self.coalesced = 0
+    
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = [threading.Event(), None, None]
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+        
+        if not leader:
+            call[0].wait()
+            if call[2] is not None:
+                raise call[2]
+            return call[1]
+        
+        try:
+            call[1] = fn()
+            return call[1]
+        except Exception as e:
+            call[2] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call[0].set()
+
+
+class TranslationJob:
+    """
+    One queued translation of a file: a whole column, or a fixed set of cells.
+    
+    Columns may be given as data column indexes or header names; segments are
+    built from the file's data store when the job starts, so files that are not
+    displayed (or not even loaded yet) can be translated in the background.
+    
+    The worker reports results by segment index; keys holds each segment's
+    current (row, data_col) and is remapped by the editor when rows or columns
+    of the file are inserted, removed or moved while the job is pending.
+    """
+    
+    def __init__(self, file_path, source_lang, target_lang, services, label,
+                 source_column=None, target_column=None, segments=None, unit="row", notify=False):
+        self.file_path = file_path
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.services = list(services)
+        self.label = label
+        self.source_column = source_column
+        self.target_column = target_column
+        self.segments = segments  # [((row, data_col), text)]
+        self.keys = [key for key, _ in segments] if segments is not None else []  # None once the cell is gone
+        self.unit = unit
+        self.notify = notify  # Show a summary dialog when done
+        self.status = "Queued"
+        self.message = ""
+        self.total = len(segments) if segments is not None else 0
+        self.position = 0
+        self.translated = 0
+        self.cached = 0  # Part of translated that reused an earlier result in the job
+        self.failed = 0
+        self.rate = None  # Segments per second, moving average
+        self.eta = None  # Seconds remaining
+        self.worker = None
+        self.changes = {}  # (row, data_col) -> (old, new) written so far, for the job's undo step
+    
+    def is_finished(self):
+        return self.status not in ("Queued", "Running", "Paused")
+    
+    def remap(self, map_key):
+        """Move segment keys and recorded changes through map_key((row, data_col)) -> key or None"""
+        self.keys = [map_key(key) if key is not None else None for key in self.keys]
+        changes = {}
+        for key, change in self.changes.items():
+            new_key = map_key(key)
+            if new_key is not None:
+                changes[new_key] = change
+        self.changes = changes
+    
+    def build_segments(self, rows):
+        """Collect non-empty source cells from a file's rows (rows[0] is the header)"""
+        headers = [str(h).strip() for h in rows[0]] if rows else []
+        source_col = self._resolve_column(self.source_column, headers)
+        target_col = self._resolve_column(self.target_column, headers)
+        
+        segments = []
+        for row_idx, row_data in enumerate(rows[1:]):
+            if source_col < len(row_data) and str(row_data[source_col]).strip():
+                segments.append(((row_idx, target_col), row_data[source_col]))
+        self.segments = segments
+        self.keys = [key for key, _ in segments]
+        self.total = len(segments)
+    
+    @staticmethod
+    def _resolve_column(column, headers):
+        if isinstance(column, int):
+            return column
+        name = str(column).strip().lower()
+        for idx, header in enumerate(headers):
+            if header.lower() == name:
+                return idx
+        raise ValueError(f"No '{column}' column")
+
+
+class TranslationLog:
+    """
+    Fixed-capacity ring buffer of translation log entries plus running per-service
+    counters, so logging and statistics are O(1) per event. Safe to use from
+    translation worker threads.
+    
+    Latencies go into a fixed log-scale histogram per service, from which
+    p50/p95/p99 are read; throughput counts successful segments over the last
+    THROUGHPUT_WINDOW seconds.
+    """
+    # Upper bounds of the latency buckets in seconds: 10 ms growing by 25% per bucket up to ~2 min
+    LATENCY_BUCKETS = [0.01 * 1.25 ** i for i in range(43)]
+    THROUGHPUT_WINDOW = 300
+    
+    def __init__(self, capacity=1000):
+        self._lock = threading.Lock()
+        self._entries = deque(maxlen=capacity)
+        self._by_service = {}
+    
+    @classmethod
+    def _new_counters(cls):
+        return {
+            'total': 0, 'successful': 0, 'failed': 0, 'latency_sum': 0.0, 'timed': 0,
+            'max_latency': 0.0, 'histogram': [0] * (len(cls.LATENCY_BUCKETS) + 1),
+            'chars': 0, 'attempt_sum': 0, 'completed': deque()
+        }
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def append(self, entry):
+        with self._lock:
+            self._entries.append(entry)
+            counters = self._by_service.get(entry['service'])
+            if counters is None:
+                counters = self._new_counters()
+                self._by_service[entry['service']] = counters
+            counters['total'] += 1
+            counters['chars'] += entry.get('chars') or 0
+            counters['attempt_sum'] += entry.get('attempt') or 1
+            if entry['success']:
+                counters['successful'] += 1
+                completed = counters['completed']
+                completed.append(entry['timestamp'])
+                while completed[0] < entry['timestamp'] - self.THROUGHPUT_WINDOW:
+                    completed.popleft()
+            else:
+                counters['failed'] += 1
+            latency = entry.get('latency')
+            if latency is not None:
+                counters['latency_sum'] += latency
+                counters['timed'] += 1
+                counters['max_latency'] = max(counters['max_latency'], latency)
+                counters['histogram'][bisect.bisect_left(self.LATENCY_BUCKETS, latency)] += 1
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_service = {}
+    
+    def _percentile(self, counters, fraction):
+        """Approximate latency percentile (seconds) from a service's histogram"""
+        if not counters['timed']:
+            return None
+        wanted = fraction * counters['timed']
+        seen = 0
+        for bucket, count in enumerate(counters['histogram']):
+            seen += count
+            if seen >= wanted:
+                if bucket < len(self.LATENCY_BUCKETS):
+                    return min(self.LATENCY_BUCKETS[bucket], counters['max_latency'])
+                break
+        return counters['max_latency']
+    
+    def _segments_per_minute(self, completed, now):
+        while completed and completed[0] < now - self.THROUGHPUT_WINDOW:
+            completed.popleft()
+        if not completed:
+            return 0.0
+        # Rate over the part of the window that actually saw traffic, at least a minute
+        minutes = max(1.0, min(self.THROUGHPUT_WINDOW, now - completed[0]) / 60)
+        return len(completed) / minutes
+    
+    def stats(self):
+        """Totals and per-service counters accumulated since the last clear"""
+        now = time.time()
+        with self._lock:
+            by_service = {}
+            for service, counters in self._by_service.items():
+                snapshot = dict(counters)
+                snapshot['histogram'] = list(counters['histogram'])
+                snapshot['p50'] = self._percentile(counters, 0.50)
+                snapshot['p95'] = self._percentile(counters, 0.95)
+                snapshot['p99'] = self._percentile(counters, 0.99)
+                snapshot['segments_per_minute'] = self._segments_per_minute(counters['completed'], now)
+                del snapshot['completed']
+                by_service[service] = snapshot
+        
+        for counters in by_service.values():
+            counters['success_rate'] = counters['successful'] / counters['total'] * 100 if counters['total'] else 0
+            counters['avg_latency'] = counters['latency_sum'] / counters['timed'] if counters['timed'] else None
+            counters['avg_attempt'] = counters['attempt_sum'] / counters['total'] if counters['total'] else None
+        
+        total = sum(c['total'] for c in by_service.values())
+        successful = sum(c['successful'] for c in by_service.values())
+        return {
+            'total': total,
+            'successful': successful,
+            'failed': total - successful,
+            'success_rate': (successful / total * 100) if total > 0 else 0,
+            'chars': sum(c['chars'] for c in by_service.values()),
+            'segments_per_minute': sum(c['segments_per_minute'] for c in by_service.values()),
+            'by_service': by_service
+        }
+
+
+class TranslationLogStore:
+    """
+    Append-only on-disk translation log made of rotating JSONL segments.
+    
+    Entries are handed to a writer thread, so appending never waits for disk.
+    index.json keeps per-segment time ranges and service counts, which lets
+    filtered reads and exports skip whole segments; reads stream line by line.
+    The index is kept in memory and written on rotation and close; the
+    active segment is rescanned on start if it grew past its indexed size.
+    """
+    INDEX_NAME = "index.json"
+    
+    def __init__(self, directory, segment_bytes=4 * 1024 * 1024, max_segments=50):
+        self.directory = Path(directory)
+        self.segment_bytes = segment_bytes
+        self.max_segments = max_segments
+        self._lock = threading.Lock()  # Guards the active file and the index
+        self._queue = queue.Queue()
+        self._file = None
+        self._index = {}  # segment name -> {'first_ts', 'last_ts', 'count', 'services', 'size'}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+        self._writer = threading.Thread(target=self._write_loop, name="TranslationLogWriter", daemon=True)
+        self._writer.start()
+    
+    # --- writing
+    
+    def append(self, entry):
+        self._queue.put(entry)
+    
+    def flush(self):
+        """Block until every appended entry is on disk"""
+        self._queue.join()
+    
+    def close(self):
+        self._queue.put(None)
+        self._writer.join(5)
+    
+    def clear(self):
+        """Delete all segments"""
+        self.flush()
+        with self._lock:
+            self._close_active()
+            for name in list(self._index):
+                try:
+                    (self.directory / name).unlink()
+                except OSError:
+                    pass
+            self._index = {}
+            self._save_index()
+    
+    def _write_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < 500:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = False
+            try:
+                with self._lock:
+                    for entry in batch:
+                        if entry is None:
+                            stop = True
+                            continue
+                        self._write_entry(entry)
+                    if self._file:
+                        self._file.flush()
+            except Exception as e:
+                print(f"Error writing translation log: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            
+            if stop:
+                with self._lock:
+                    self._close_active()
+                    self._save_index()
+                return
+    
+    def _write_entry(self, entry):
+        name = self._active_segment()
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        data = line.encode('utf-8')
+        self._file.write(data)
+        
+        meta = self._index[name]
+        ts = entry['timestamp']
+        meta['first_ts'] = ts if meta['first_ts'] is None else min(meta['first_ts'], ts)
+        meta['last_ts'] = ts if meta['last_ts'] is None else max(meta['last_ts'], ts)
+        meta['count'] += 1
+        meta['services'][entry['service']] = meta['services'].get(entry['service'], 0) + 1
+        meta['size'] += len(data)
+    
+    def _active_segment(self):
+        """Name of the segment to append to, rotating when the current one is full"""
+        names = self.segment_names()
+        if names and self._index[names[-1]]['size'] < self.segment_bytes:
+            name = names[-1]
+        else:
+            sequence = int(names[-1][12:18]) + 1 if names else 1
+            name = f"translation-{sequence:06d}.jsonl"
+            self._close_active()
+            self._index[name] = {'first_ts': None, 'last_ts': None, 'count': 0, 'services': {}, 'size': 0}
+            self._prune()
+            self._save_index()
+        
+        if self._file is None or self._file.name != str(self.directory / name):
+            self._close_active()
+            self._file = open(self.directory / name, 'ab')
+        return name
+    
+    def _prune(self):
+        """Drop the oldest segments beyond max_segments"""
+        names = self.segment_names()
+        for name in names[:max(0, len(names) - self.max_segments)]:
+            try:
+                (self.directory / name).unlink()
+            except OSError:
+                pass
+            del self._index[name]
+    
+    def _close_active(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+    
+    # --- index
+    
+    def segment_names(self):
+        return sorted(self._index)
+    
+    def _load_index(self):
+        try:
+            with open(self.directory / self.INDEX_NAME, 'r', encoding='utf-8') as f:
+                self._index = json.load(f)
+        except (OSError, ValueError):
+            self._index = {}
+        
+        # Reconcile with what is actually on disk (e.g. after a crash)
+        on_disk = {p.name for p in self.directory.glob("translation-*.jsonl")}
+        for name in list(self._index):
+            if name not in on_disk:
+                del self._index[name]
+        for name in on_disk:
+            meta = self._index.get(name)
+            if meta is None or meta.get('size') != (self.directory / name).stat().st_size:
+                self._index[name] = self._scan_segment(name)
+    
+    def _scan_segment(self, name):
+        meta = {'first_ts': None, 'last_ts': None, 'count': 0, 'services': {}, 'size': 0}
+        with open(self.directory / name, 'rb') as f:
+            for line in f:
+                meta['size'] += len(line)
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                ts = entry.get('timestamp', 0)
+                meta['first_ts'] = ts if meta['first_ts'] is None else min(meta['first_ts'], ts)
+                meta['last_ts'] = ts if meta['last_ts'] is None else max(meta['last_ts'], ts)
+                meta['count'] += 1
+                service = entry.get('service', '')
+                meta['services'][service] = meta['services'].get(service, 0) + 1
+        return meta
+    
+    def _save_index(self):
+        path = self.directory / self.INDEX_NAME
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, path)
+    
+    # --- reading
+    
+    def count(self):
+        self.flush()
+        with self._lock:
+            return sum(meta['count'] for meta in self._index.values())
+    
+    def services(self):
+        self.flush()
+        with self._lock:
+            return sorted({s for meta in self._index.values() for s in meta['services']})
+    
+    def matching_segments(self, start_ts=None, end_ts=None, services=None):
+        """Segments whose index entry can contain matching entries, oldest first"""
+        self.flush()
+        with self._lock:
+            index = {name: dict(meta) for name, meta in self._index.items()}
+        names = []
+        for name in sorted(index):
+            meta = index[name]
+            if not meta['count']:
+                continue
+            if start_ts is not None and meta['last_ts'] < start_ts:
+                continue
+            if end_ts is not None and meta['first_ts'] > end_ts:
+                continue
+            if services and not any(s in meta['services'] for s in services):
+                continue
+            names.append(name)
+        return names
+    
+    @staticmethod
+    def entry_matches(entry, start_ts=None, end_ts=None, services=None, status=None, text=""):
+        """status is None, 'success' or 'failed'; text is matched case-insensitively"""
+        if start_ts is not None and entry['timestamp'] < start_ts:
+            return False
+        if end_ts is not None and entry['timestamp'] > end_ts:
+            return False
+        if services and entry['service'] not in services:
+            return False
+        if status and entry['success'] != (status == 'success'):
+            return False
+        if text:
+            haystack = f"{entry['source']}\n{entry['target']}\n{entry.get('error') or ''}".lower()
+            if text.lower() not in haystack:
+                return False
+        return True
+    
+    def iter_entries(self, start_ts=None, end_ts=None, services=None, status=None, text=""):
+        """Stream matching entries, oldest first, in constant memory"""
+        for name in self.matching_segments(start_ts, end_ts, services):
+            try:
+                with open(self.directory / name, 'rb') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue
+                        if self.entry_matches(entry, start_ts, end_ts, services, status, text):
+                            yield entry
+            except OSError:
+                continue  # Segment pruned while reading
+
+
+class LogScanTask(QRunnable):
+    """
+    Finds the log lines matching a filter off the GUI thread. Segments are
+    scanned newest first; each segment's matches are emitted through batch as
+    (scan_id, segment_id, offsets newest first, finished) unless cancel is set.
+    """
+    
+    def __init__(self, scan_id, directory, segments, filters, batch, cancel):
+        super().__init__()
+        self.scan_id = scan_id
+        self.directory = directory
+        self.segments = segments
+        self.filters = filters
+        self.batch = batch  # Bound pyqtSignal(int, int, object, bool)
+        self.cancel = cancel
+    
+    def run(self):
+        filters = self.filters
+        text = filters.get('text', "")
+        needle = text.lower()
+        need_parse = any(filters.get(key) for key in ('start_ts', 'end_ts', 'services', 'status')) or needle
+        
+        for segment_id in range(len(self.segments) - 1, -1, -1):
+            offsets = array('Q')
+            try:
+                f = open(self.directory / self.segments[segment_id], 'rb')
+            except OSError:
+                continue
+            with f:
+                offset = 0
+                for count, line in enumerate(f):
+                    if count % 1000 == 0 and self.cancel.is_set():
+                        return
+                    line_offset = offset
+                    offset += len(line)
+                    # Cheap text check on the raw line before paying for json parsing
+                    if needle and needle not in line.decode('utf-8', 'replace').lower():
+                        continue
+                    if need_parse:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue
+                        if not TranslationLogStore.entry_matches(
+                            entry, filters.get('start_ts'), filters.get('end_ts'), filters.get('services'),
+                            filters.get('status'), text
+                        ):
+                            continue
+                    elif not line.strip():
+                        continue
+                    offsets.append(line_offset)
+            if self.cancel.is_set():
+                return
+            offsets.reverse()
+            self.batch.emit(self.scan_id, segment_id, offsets, False)
+        if not self.cancel.is_set():
+            self.batch.emit(self.scan_id, -1, array('Q'), True)
+
+
+class TranslationLogModel(QAbstractTableModel):
+    """
+    Lazy table model over a TranslationLogStore, newest entries first.
+    
+    Filtering keeps only the segment and byte offset of each matching line;
+    entries are parsed when a row is actually shown and kept in a small cache.
+    The matching lines are found by a LogScanTask and appended as each
+    segment is scanned; a new filter cancels the scan in progress.
+    """
+    COLUMNS = ["Time", "Status", "Service", "Source", "Target"]
+    CACHE_SIZE = 512
+    
+    scan_progress = pyqtSignal(bool)  # Rows were added; True once the scan is complete
+    _scan_batch = pyqtSignal(int, int, object, bool)  # From LogScanTask
+    
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.filters = {}
+        self._segments = []  # Segment names referenced by _segment_ids
+        self._segment_ids = array('I')  # In row order, newest first
+        self._offsets = array('Q')
+        self._cache = OrderedDict()  # (segment id, offset) -> entry
+        self.scanning = False
+        self._scan_id = 0
+        self._scan_cancel = threading.Event()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._scan_batch.connect(self._on_scan_batch)
+    
+    def set_filters(self, start_ts=None, end_ts=None, services=None, status=None, text=""):
+        """Start rescanning the store for matching lines. status is None, 'success' or 'failed'."""
+        self.filters = {'start_ts': start_ts, 'end_ts': end_ts, 'services': services}
+        
+        self._scan_cancel.set()
+        self._scan_cancel = threading.Event()
+        self._scan_id += 1
+        self.beginResetModel()
+        self._segments = self.store.matching_segments(start_ts, end_ts, services)
+        self._segment_ids = array('I')
+        self._offsets = array('Q')
+        self._cache.clear()
+        self.endResetModel()
+        
+        self.scanning = True
+        filters = {'start_ts': start_ts, 'end_ts': end_ts, 'services': services, 'status': status, 'text': text}
+        self._pool.start(LogScanTask(
+            self._scan_id, self.store.directory, list(self._segments), filters, self._scan_batch, self._scan_cancel
+        ))
+    
+    def stop(self):
+        """Cancel the scan in progress and wait for it to end"""
+        self._scan_cancel.set()
+        self._pool.waitForDone(5000)
+        self.scanning = False
+    
+    def _on_scan_batch(self, scan_id, segment_id, offsets, finished):
+        if scan_id != self._scan_id:
+            return
+        if offsets:
+            first = len(self._offsets)
+            self.beginInsertRows(QModelIndex(), first, first + len(offsets) - 1)
+            self._segment_ids.extend(array('I', [segment_id]) * len(offsets))
+            self._offsets.extend(offsets)
+            self.endInsertRows()
+        if finished:
+            self.scanning = False
+        self.scan_progress.emit(finished)
+    
+    def entry(self, row):
+        """Full log entry for a row, read from disk on demand"""
+        if row < 0 or row >= len(self._offsets):
+            return None
+        key = (self._segment_ids[row], self._offsets[row])
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        
+        try:
+            with open(self.store.directory / self._segments[key[0]], 'rb') as f:
+                f.seek(key[1])
+                entry = json.loads(f.readline())
+        except (OSError, ValueError):
+            entry = None  # Segment rotated away since the scan
+        
+        self._cache[key] = entry
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return entry
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._offsets)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole):
+            return None
+        
+        entry = self.entry(index.row())
+        if entry is None:
+            return "(unavailable)" if role == Qt.ItemDataRole.DisplayRole and index.column() == 0 else None
+        
+        if role == Qt.ItemDataRole.ForegroundRole:
+            # Color code by status
+            return QColor(0, 128, 0) if entry['success'] else QColor(200, 0, 0)
+        
+        column = index.column()
+        if column == 0:
+            return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['timestamp']))
+        if column == 1:
+            return "✓" if entry['success'] else "✗"
+        if column == 2:
+            return entry['service']
+        text = entry['source'] if column == 3 else entry['target']
+        text = text or ""
+        return text[:80] + "..." if len(text) > 80 else text
+
+
+class TranslationWorker(QThread):
+    """
+    Runs one TranslationJob off the GUI thread.
+    
+    If the job has no segments yet its file is read from disk first, and the
+    editor builds the segments on the GUI thread before translation starts.
+    Each segment is attempted once; failures go to a DeferredRetryQueue that is
+    drained when the circuit breaker closes again and after the last segment,
+    until the job-wide retry budget is spent.
+    
+    Pausing holds the worker between requests until it is resumed or canceled.
+    Repeated source texts within the job are served from a job-local memo.
+    Progress is reported as snapshots (counts, throughput, ETA), at most every
+    PROGRESS_INTERVAL seconds.
+    """
+    PROGRESS_INTERVAL = 0.5
+    THROUGHPUT_WINDOW = 60  # Seconds of completions averaged for throughput
+    
+    data_loaded = pyqtSignal(object)  # rows read from disk
+    progress_changed = pyqtSignal(object)  # snapshot dict built by report() in run
+    result_ready = pyqtSignal(int, str)  # segment index, translated text
+    job_error = pyqtSignal(str)
+    job_finished = pyqtSignal(int, int)  # translated, failed
+    
+    def __init__(self, editor, job, parent=None):
+        super().__init__(parent)
+        self.editor = editor
+        self.job = job
+        self.source_lang = job.source_lang
+        self.target_lang = job.target_lang
+        self.services = job.services
+        self.unit = job.unit
+        self._cancel = threading.Event()
+        self._resume = threading.Event()  # Cleared while paused
+        self._resume.set()
+        self._segments_ready = threading.Event()
+        self._segments_error = None
+    
+    def cancel(self):
+        self._cancel.set()
+    
+    def set_segments_ready(self, error=None):
+        """Let run continue after data_loaded, once job.segments is built (or failed to build)"""
+        self._segments_error = error
+        self._segments_ready.set()
+    
+    def is_canceled(self):
+        return self._cancel.is_set()
+    
+    def pause(self):
+        self._resume.clear()
+    
+    def resume(self):
+        self._resume.set()
+    
+    def _wait(self, seconds):
+        """Sleep, then hold while paused; returns False if the job was canceled meanwhile"""
+        if self._cancel.wait(max(0.0, seconds)):
+            return False
+        while not self._resume.wait(0.1):
+            if self.is_canceled():
+                return False
+        return True
+    
+    def run(self):
+        editor = self.editor
+        job = self.job
+        
+        if job.segments is None:
+            try:
+                rows, _ = read_csv_file(job.file_path)
+            except Exception as e:
+                self.job_error.emit(str(e))
+                return
+            self.data_loaded.emit(rows)
+            while not self._segments_ready.wait(0.1):
+                if self.is_canceled():
+                    self.job_finished.emit(0, 0)
+                    return
+            if self._segments_error:
+                self.job_error.emit(self._segments_error)
+                return
+        
+        segments = job.segments
+        unit = self.unit
+        total = len(segments)
+        retry_queue = DeferredRetryQueue(editor.config['retry_budget'], editor.config['retry_count'])
+        base_delay = editor.config['base_delay']
+        max_delay = 60.0
+        state = {
+            'delay': base_delay, 'position': 0, 'network': 0, 'cached': 0,
+            'message': "", 'last_emit': 0.0
+        }
+        memo = {}  # source text -> translation, for repeated texts within this job
+        completed_at = deque()  # Completion times within THROUGHPUT_WINDOW
+        
+        def report(message=None, force=False):
+            if message is not None:
+                state['message'] = message
+            now = time.monotonic()
+            if not force and now - state['last_emit'] < self.PROGRESS_INTERVAL:
+                return
+            state['last_emit'] = now
+            
+            while completed_at and completed_at[0] < now - self.THROUGHPUT_WINDOW:
+                completed_at.popleft()
+            span = now - completed_at[0] if completed_at else 0
+            rate = len(completed_at) / span if span > 1 else None  # segments per second
+            done = state['network'] + state['cached']
+            failed = len(retry_queue) + retry_queue.dropped
+            remaining = max(0, total - done - retry_queue.dropped)
+            self.progress_changed.emit({
+                'position': state['position'],
+                'message': state['message'],
+                'network': state['network'],
+                'cached': state['cached'],
+                'failed': failed,
+                'rate': rate,
+                'eta': remaining / rate if rate else None
+            })
+        
+        def complete(index, result, cached):
+            self.result_ready.emit(index, result)
+            state['cached' if cached else 'network'] += 1
+            completed_at.append(time.monotonic())
+        
+        def attempt(index, text, attempts_made, label):
+            if text in memo:
+                complete(index, memo[text], True)
+                report(f"Translating {unit} {label} of {total}... (reused an earlier translation)")
+                return True
+            
+            try:
+                result, service_used = editor.translate_text(
+                    text, self.source_lang, self.target_lang, attempts=1, services=self.services,
+                    first_attempt=attempts_made + 1
+                )
+            except Exception as e:
+                # Back off the pacing and try this segment again later
+                state['delay'] = min(max_delay, state['delay'] * 1.5)
+                if retry_queue.push(index, text, attempts_made + 1):
+                    report(f"⚠️ Failed {unit} {label}, queued for retry ({len(retry_queue)} queued): {e}", True)
+                return False
+            memo[text] = result
+            complete(index, result, False)
+            state['delay'] = max(base_delay, state['delay'] * 0.9)
+            report(
+                f"Translating {unit} {label} of {total}... "
+                f"(service: {service_used}, delay: {state['delay']:.1f}s, retry queue: {len(retry_queue)})"
+            )
+            return False
+        
+        def pace():
+            # Rate limiting with jitter
+            delay = state['delay']
+            return self._wait(delay + random.uniform(0, delay * 0.1))
+        
+        def wait_for_circuit():
+            while editor.is_circuit_open(self.services):
+                delay = editor.circuit_reopen_delay()
+                report(
+                    f"All services paused by the circuit breaker. Resuming in {delay:.0f}s... "
+                    f"({len(retry_queue)} {unit}(s) queued for retry)"
+                )
+                if not self._wait(min(max(delay, 0.1), 1.0)):
+                    return False
+            return True
+        
+        def drain():
+            while len(retry_queue) and retry_queue.has_budget():
+                if not wait_for_circuit():
+                    return False
+                index, text, attempts_made = retry_queue.pop()
+                if attempt(index, text, attempts_made, f"(retry {attempts_made + 1})"):
+                    continue  # Served from the memo, no request to pace
+                if not pace():
+                    return False
+            return True
+        
+        completed = True
+        for idx, (_, text) in enumerate(segments):
+            if not self._wait(0):  # Holds here while paused
+                completed = False
+                break
+            
+            state['position'] = idx
+            
+            if editor.is_circuit_open(self.services):
+                # Circuit closing again gives the deferred segments their turn first
+                if not wait_for_circuit() or not drain():
+                    completed = False
+                    break
+            
+            if attempt(idx, text, 0, idx + 1):
+                continue
+            if not pace():
+                completed = False
+                break
+        
+        if completed:
+            state['position'] = total
+            report(f"Retrying {len(retry_queue)} failed {unit}(s)...", True)
+            drain()
+        
+        # Whatever is still queued has run out of budget (or the job was canceled)
+        retry_queue.abandon()
+        report(force=True)
+        self.job_finished.emit(state['network'] + state['cached'], retry_queue.dropped)
+
+
+class CellUpdateBuffer(QObject):
+    """
+    Collects cell updates (e.g. translation results) and hands them to a callback
+    in timed batches, grouped per file, instead of touching the UI once per result.
+    """
+    
+    def __init__(self, apply_batch, interval_ms=100, parent=None):
+        super().__init__(parent)
+        self.apply_batch = apply_batch  # callable(file_path, [(row, data_col, text), ...])
+        self._pending = {}  # file_path -> {(row, data_col): text}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+    
+    def add(self, file_path, row, data_col, text):
+        self._pending.setdefault(file_path, {})[(row, data_col)] = text
+        if not self._timer.isActive():
+            self._timer.start()
+    
+    def discard(self, file_path, cells=None):
+        """Drop pending updates for [(row, data_col)] of a file, or all of them"""
+        if cells is None:
+            self._pending.pop(file_path, None)
+            return
+        pending = self._pending.get(file_path)
+        if pending:
+            for cell in cells:
+                pending.pop(cell, None)
+    
+    def flush(self):
+        """Apply everything collected so far"""
+        self._timer.stop()
+        pending, self._pending = self._pending, {}
+        for file_path, cells in pending.items():
+            self.apply_batch(file_path, [(row, col, text) for (row, col), text in cells.items()])
+
+
+class EndpointProbe(QRunnable):
+    """
+    Checks that one service's host answers and reports latency and error
+    class. A HEAD request is sent instead of a translation, so probing does
+    not use up the rate limit the translation jobs need.
+    """
+    PROBE_URLS = {
+        'google': "https://translate.google.com/m",
+        'mymemory': "https://api.mymemory.translated.net/",
+    }
+    
+    def __init__(self, editor, service):
+        super().__init__()
+        self.editor = editor
+        self.service = service
+    
+    def run(self):
+        started = time.perf_counter()
+        error_class = ""
+        try:
+            if not DEEP_TRANSLATOR_AVAILABLE:
+                raise ImportError("deep-translator not available")
+            url = self.PROBE_URLS.get(self.service)
+            if url is None:
+                raise ValueError(f"Unknown translation service: {self.service}")
+            response = requests.head(url, timeout=self.editor.config['request_timeout'], allow_redirects=True)
+            if response.status_code == 429 or response.status_code >= 500:
+                error_class = f"HTTP {response.status_code}"
+        except Exception as e:
+            error_class = type(e).__name__
+        latency = time.perf_counter() - started
+        self.editor.record_probe_result(self.service, not error_class, latency, error_class)
+
+
+@lru_cache(maxsize=128)
+def compile_search_regex(search_text, case_sensitive, whole_word, use_regex):
+    """Compiled pattern for a search, cached across Find Next / Replace calls; raises re.error"""
+    if not use_regex:
+        # Escape special regex characters
+        search_text = re.escape(search_text)
+        if whole_word:
+            search_text = r'\b' + search_text + r'\b'
+    return re.compile(search_text, 0 if case_sensitive else re.IGNORECASE)
+
+
+def literal_replacement(text):
+    """re.sub template that inserts text as-is (unlike a lambda, it can be sent to the regex sandbox)"""
+    return text.replace('\\', '\\\\')
+
+
+def substitute_text(pattern, replacement, text):
+    return pattern.sub(replacement, text)
+
+
+# Single cells up to this length are substituted in-process; starting a sandbox
+# worker costs far more than the regex can take on text this short
+INLINE_REGEX_MAX_LENGTH = 200
+
+
+class RegexTimeout(Exception):
+    """A regular expression ran past its time budget and its worker process was stopped"""
+
+
+class RegexSandbox:
+    """
+    Runs regex work in worker processes so a pattern with catastrophic
+    backtracking can be stopped. re holds the GIL while it matches, so a
+    runaway search on a thread would still freeze the GUI. Each call checks
+    out its own single-process pool and only that process is killed on
+    timeout or cancel; idle pools are kept warm for the next call.
+    
+    A file's rows stay loaded in the worker that last searched it. The editor
+    reports edited rows (rows_changed) and files whose rows were inserted,
+    removed or reloaded (forget), so the next search of that file only sends
+    the rows edited since.
+    """
+    
+    def __init__(self, max_idle=2):
+        self.max_idle = max_idle
+        self.idle = []  # Warm pools
+        self.resident = {}  # pool -> [key, data rows edited since they were sent, row count]
+        self.lock = threading.Lock()
+        self.closed = False
+        self.context = multiprocessing.get_context("spawn")
+    
+    def _acquire(self, key=None):
+        with self.lock:
+            for position, pool in enumerate(self.idle):
+                if key is not None and self.resident.get(pool, (None,))[0] == key:
+                    del self.idle[position]
+                    return pool, None
+            if self.idle:
+                return self.idle.pop(), None
+        pool = self.context.Pool(1)
+        return pool, pool.apply_async(os.getpid)  # Ready once the worker process is up
+    
+    def _release(self, pool):
+        with self.lock:
+            if not self.closed and len(self.idle) < self.max_idle:
+                self.idle.append(pool)
+                return
+            self.resident.pop(pool, None)
+        pool.terminate()
+    
+    def _discard(self, pool):
+        """Forget a pool that was terminated"""
+        with self.lock:
+            self.resident.pop(pool, None)
+    
+    def rows_changed(self, key, data_rows):
+        """Note edited rows of key, to be sent again to the workers holding it"""
+        with self.lock:
+            for resident in self.resident.values():
+                if resident[0] == key:
+                    resident[1].update(data_rows)
+    
+    def forget(self, key):
+        """Rows of key were inserted, removed or reloaded; workers holding it get all rows again"""
+        with self.lock:
+            for pool in [pool for pool, resident in self.resident.items() if resident[0] == key]:
+                del self.resident[pool]
+    
+    def run(self, func, args, budget, is_canceled=None, poll=None, rows=None, key=None):
+        """
+        Return func(*args) computed in a worker process; exceptions raised by
+        func are re-raised here. Returns None once is_canceled() is true and
+        raises RegexTimeout after budget seconds. poll is called between
+        checks, e.g. to keep processing GUI events.
+        
+        With rows (rows[0] is the header) func is called as func(rows, *args).
+        key names the rows (e.g. the file path); if the worker already holds
+        rows under that key only the changed rows are sent. The budget starts
+        once the rows have arrived.
+        """
+        pool, started = self._acquire(key)
+        try:
+            if rows is not None:
+                with self.lock:
+                    resident = self.resident.pop(pool, None)
+                if resident is not None and resident[0] == key and resident[2] == len(rows):
+                    changed = sorted(resident[1])
+                    loaded = pool.apply_async(load_sandbox_rows, pack_rows(rows, changed)) if changed else None
+                else:
+                    loaded = pool.apply_async(load_sandbox_rows, pack_rows(rows))
+                # Edits from here on (e.g. translation results applied while
+                # GUI events are processed) are sent with the next call
+                with self.lock:
+                    self.resident[pool] = [key, set(), len(rows)]
+                if loaded is not None:
+                    if not self._wait(pool, loaded, None, is_canceled, poll):
+                        self._discard(pool)
+                        return None
+                    loaded.get()
+                started = None  # The worker is up and holds the rows
+                result = pool.apply_async(call_with_sandbox_rows, (func, args))
+            else:
+                result = pool.apply_async(func, args)
+            # The budget covers the regex, not starting a worker or sending data
+            if not self._wait(pool, result, budget, is_canceled, poll, started):
+                self._discard(pool)
+                return None
+        except BaseException:
+            pool.terminate()
+            self._discard(pool)
+            raise
+        self._release(pool)
+        return result.get()
+    
+    @staticmethod
+    def _wait(pool, result, budget, is_canceled, poll, started=None):
+        """
+        Wait for an async result; False (and the pool terminated) if canceled.
+        budget None waits without a limit; otherwise the budget starts once
+        started (the startup ping of a new worker) is ready.
+        """
+        deadline = None
+        while not result.ready():
+            if is_canceled and is_canceled():
+                pool.terminate()
+                return False
+            if budget is not None and deadline is None and (started is None or started.ready()):
+                deadline = time.monotonic() + budget
+            if deadline is not None and time.monotonic() >= deadline:
+                raise RegexTimeout(f"Regular expression timed out after {budget:g} s")
+            if poll:
+                poll()
+            result.wait(0.02)
+        return True
+    
+    def close(self):
+        with self.lock:
+            self.closed = True
+            idle, self.idle = self.idle, []
+            self.resident = {}
+        for pool in idle:
+            pool.terminate()
+
+
+def pack_rows(rows, row_numbers=None):
+    """
+    Arguments for load_sandbox_rows sending rows (default: all of them,
+    header included). Cells are joined into one string, which pickles far
+    faster than lists of strings; if a cell contains a separator the rows are
+    sent as lists instead.
+    """
+    if row_numbers is None:
+        numbers = None
+        selected = rows
+    else:
+        numbers = array('I', row_numbers)
+        selected = [rows[data_row] for data_row in numbers]
+    packed = "\x1e".join("\x1f".join(row_data) for row_data in selected)
+    if (packed.count("\x1e") != max(len(selected) - 1, 0)
+            or packed.count("\x1f") != sum(max(len(row_data) - 1, 0) for row_data in selected)):
+        # Copied, since the pool pickles arguments later on its own thread
+        return numbers, None, [list(row_data) for row_data in selected]
+    return numbers, packed, None
+
+
+_sandbox_rows = None  # Rows held by a sandbox worker process between calls
+
+
+def load_sandbox_rows(numbers, packed, plain):
+    """Store rows sent by pack_rows in a sandbox worker; with numbers, replace just those rows"""
+    global _sandbox_rows
+    if plain is not None:
+        selected = plain
+    elif not packed and (numbers is None or len(numbers) == 0):
+        selected = []
+    else:
+        selected = [cells.split("\x1f") if cells else [] for cells in packed.split("\x1e")]
+    if numbers is None:
+        _sandbox_rows = selected
+    else:
+        for data_row, row_data in zip(numbers, selected):
+            _sandbox_rows[data_row] = row_data
+
+
+def call_with_sandbox_rows(func, args):
+    """func(rows, *args) on the rows held by this worker"""
+    return func(_sandbox_rows, *args)
+
+
+def regex_literal_prefix(pattern):
+    """
+    Literal text every match of a regex must start with, or "" if there is none
+    we can be sure of (alternation, a leading group or class, and so on).
+    """
+    if '|' in pattern:
+        return ""
+    i = 1 if pattern.startswith('^') else 0
+    literal = []
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            if i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+                literal.append(pattern[i + 1])  # Escaped punctuation is literal
+                i += 2
+                continue
+            break
+        if char in '.^$*+?{}[]()':
+            break
+        literal.append(char)
+        i += 1
+    
+    # A quantifier that allows zero repetitions makes the last character optional
+    if i < len(pattern) and pattern[i] in '*?{' and literal:
+        literal.pop()
+    return "".join(literal)
+
+
+class TrigramIndex:
+    """
+    Row-level trigram index over a file's rows (rows[0] is the header).
+    
+    Maps each lowercased 3-character substring to the sorted rows containing it,
+    so a search only verifies rows that contain every trigram of the query.
+    Edits are folded in incrementally: a changed row is added to the postings of
+    its new trigrams, and stale postings only produce candidates that fail
+    verification. The index is rebuilt once enough edits have piled up.
+    """
+    
+    def __init__(self, rows):
+        self.row_count = len(rows)
+        self.postings = {}  # trigram -> array('I') of rows, sorted
+        self.added = {}  # trigram -> set of rows, from edits since the build
+        self.edits = 0
+        self.rebuild_after = max(1000, self.row_count // 4)  # Edits before a rebuild is cheaper
+        
+        building = {}
+        for row_idx in range(1, len(rows)):
+            for gram in self.row_trigrams(rows[row_idx]):
+                posting = building.get(gram)
+                if posting is None:
+                    building[gram] = [row_idx]
+                else:
+                    posting.append(row_idx)
+        self.postings = {gram: array('I', posting) for gram, posting in building.items()}
+    
+    @staticmethod
+    def trigrams(text):
+        text = text.lower()
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    @classmethod
+    def row_trigrams(cls, row_data):
+        # Cells are joined with a separator no query contains, so one pass covers
+        # the whole row; trigrams spanning two cells are never looked up
+        return cls.trigrams("\x00".join(map(str, row_data)))
+    
+    def update_cell(self, row_idx, text):
+        """Record that a cell in row_idx now holds text"""
+        self.edits += 1
+        if self.edits > self.rebuild_after:
+            return  # Stale anyway; rebuilt before the next search
+        for gram in self.trigrams(text):
+            self.added.setdefault(gram, set()).add(row_idx)
+    
+    def is_stale(self, rows):
+        """Whether the index should be rebuilt for rows"""
+        return len(rows) != self.row_count or self.edits > self.rebuild_after
+    
+    def _has_row(self, gram, row_idx):
+        posting = self.postings.get(gram)
+        if posting is not None:
+            pos = bisect.bisect_left(posting, row_idx)
+            if pos < len(posting) and posting[pos] == row_idx:
+                return True
+        return row_idx in self.added.get(gram, ())
+    
+    def candidates(self, literal):
+        """
+        Sorted rows that may contain literal (case-insensitively), or None when
+        the literal is too short to narrow the search.
+        """
+        grams = self.trigrams(literal)
+        if not grams:
+            return None
+        
+        # Start from the rarest trigram and check the rest per candidate
+        sized = sorted(grams, key=lambda g: len(self.postings.get(g, ())) + len(self.added.get(g, ())))
+        rarest = sized[0]
+        rows = set(self.postings.get(rarest, ())) | self.added.get(rarest, set())
+        for gram in sized[1:]:
+            if not rows:
+                break
+            rows = {row_idx for row_idx in rows if self._has_row(gram, row_idx)}
+        return sorted(rows)
+
+
+def search_file_rows(rows, pattern, candidate_rows=None, is_canceled=None):
+    """
+    Cells of rows (rows[0] is the header) whose text matches pattern, as
+    [(data_row, data_col, column_name, text)]. candidate_rows limits the rows
+    that are checked; is_canceled is polled every 1000 rows.
+    """
+    headers = rows[0] if rows else []
+    matches = []
+    for count, data_row in enumerate(candidate_rows if candidate_rows is not None else range(1, len(rows))):
+        if is_canceled and count % 1000 == 0 and is_canceled():
+            break
+        if data_row >= len(rows):
+            continue
+        for data_col, text in enumerate(rows[data_row]):
+            if text and pattern.search(text):
+                column_name = headers[data_col] if data_col < len(headers) else f"Column {data_col + 1}"
+                matches.append((data_row, data_col, column_name, text))
+    return matches
+
+
+class FileSearchTask(QRunnable):
+    """
+    Searches one file's rows off the GUI thread; a file that is not loaded
+    (rows is None) is read from disk. Results are emitted through done as
+    (search_id, file_path, matches, error) unless cancel is set first. With a
+    sandbox the matching runs in a worker process limited to budget seconds.
+    """
+    
+    def __init__(self, search_id, file_path, pattern, done, cancel, rows=None, candidate_rows=None,
+                 sandbox=None, budget=None):
+        super().__init__()
+        self.search_id = search_id
+        self.file_path = file_path
+        self.pattern = pattern
+        self.done = done  # Bound pyqtSignal(int, str, object, str)
+        self.cancel = cancel  # threading.Event set when the search is superseded
+        self.rows = rows
+        self.candidate_rows = candidate_rows
+        self.sandbox = sandbox
+        self.budget = budget
+    
+    def is_canceled(self):
+        return self.cancel.is_set()
+    
+    def run(self):
+        if self.is_canceled():
+            return
+        matches = []
+        error = ""
+        try:
+            rows = self.rows
+            if rows is None:
+                rows, _ = read_csv_file(self.file_path)
+            if self.sandbox is not None:
+                matches = self.sandbox.run(
+                    search_file_rows, (self.pattern, self.candidate_rows), self.budget, self.is_canceled,
+                    rows=rows, key=self.file_path
+                )
+                if matches is None:
+                    return
+            else:
+                matches = search_file_rows(rows, self.pattern, self.candidate_rows, self.is_canceled)
+        except Exception as e:
+            error = str(e)
+        if not self.is_canceled():
+            self.done.emit(self.search_id, self.file_path, matches, error)
+
+
+def compute_replacements(rows, pattern, replacement, candidate_rows=None):
+    """
+    Replace pattern in every cell of rows (rows[0] is the header) without
+    modifying them. Returns ([(data_row, data_col, old, new)], occurrences).
+    replacement is a re.sub template or a callable.
+    """
+    changes = []
+    occurrences = 0
+    for data_row in candidate_rows if candidate_rows is not None else range(1, len(rows)):
+        if data_row >= len(rows):
+            continue
+        for data_col, text in enumerate(rows[data_row]):
+            if not text:
+                continue
+            new_text, count = pattern.subn(replacement, text)
+            if count and new_text != text:
+                changes.append((data_row, data_col, text, new_text))
+                occurrences += count
+    return changes, occurrences
+
+
+class FileReplaceTask(QRunnable):
+    """
+    Computes the replacements for one file off the GUI thread. A file that
+    is not loaded (rows is None) is read from disk and its rows are returned
+    with the result, so the changes can be applied to exactly what was read.
+    Emits done(search_id, file_path, (changes, occurrences, rows_read), error).
+    With a sandbox the replacing runs in a worker process limited to budget seconds.
+    """
+    
+    def __init__(self, search_id, file_path, pattern, replacement, done, cancel, rows=None,
+                 sandbox=None, budget=None):
+        super().__init__()
+        self.search_id = search_id
+        self.file_path = file_path
+        self.pattern = pattern
+        self.replacement = replacement
+        self.done = done
+        self.cancel = cancel
+        self.rows = rows
+        self.sandbox = sandbox
+        self.budget = budget
+    
+    def run(self):
+        if self.cancel.is_set():
+            return
+        result = ([], 0, None)
+        error = ""
+        try:
+            rows_read = None
+            rows = self.rows
+            if rows is None:
+                rows, _ = read_csv_file(self.file_path)
+                rows_read = rows
+            if self.sandbox is not None:
+                computed = self.sandbox.run(
+                    compute_replacements, (self.pattern, self.replacement), self.budget, self.cancel.is_set,
+                    rows=rows, key=self.file_path
+                )
+                if computed is None:
+                    return
+                changes, occurrences = computed
+            else:
+                changes, occurrences = compute_replacements(rows, self.pattern, self.replacement)
+            result = (changes, occurrences, rows_read)
+        except Exception as e:
+            error = str(e)
+        if not self.cancel.is_set():
+            self.done.emit(self.search_id, self.file_path, result, error)
+
+
+class CellChangesCommand(QUndoCommand):
+    """
+    Undoable batch of cell edits in one file, stored as deltas
+    [(data_row, data_col, old, new)]. Pass done=True for edits that are
+    already applied, so pushing the command does not apply them again.
+    """
+    
+    def __init__(self, editor, file_path, changes, text, done=False, parent=None):
+        super().__init__(text, parent)
+        self.editor = editor
+        self.file_path = file_path
+        self.changes = changes
+        self._skip_redo = done
+    
+    def redo(self):
+        self.editor.release_translation_job_cells(
+            self.file_path, [(data_row - 1, data_col) for data_row, data_col, _, _ in self.changes]
+        )
+        if self._skip_redo:
+            self._skip_redo = False
+            return
+        self.editor.apply_cell_updates(
+            self.file_path, [(data_row - 1, data_col, new) for data_row, data_col, _, new in self.changes]
+        )
+    
+    def undo(self):
+        self.editor.release_translation_job_cells(
+            self.file_path, [(data_row - 1, data_col) for data_row, data_col, _, _ in self.changes]
+        )
+        self.editor.apply_cell_updates(
+            self.file_path, [(data_row - 1, data_col, old) for data_row, data_col, old, _ in self.changes]
+        )
+
+
+class RowsCommand(QUndoCommand):
+    """
+    Undoable insertion (insert=True) or removal of whole rows in one file,
+    stored as [(data_row, values)] in ascending order. Only the affected rows
+    are kept, so memory follows the size of the edit, not of the file.
+    """
+    
+    def __init__(self, editor, file_path, rows, text, insert, done=False, parent=None):
+        super().__init__(text, parent)
+        self.editor = editor
+        self.file_path = file_path
+        self.rows = rows
+        self.insert = insert
+        self._skip_redo = done
+    
+    def _insert(self):
+        self.editor.insert_data_rows(self.file_path, self.rows)
+    
+    def _remove(self):
+        self.editor.remove_data_rows(self.file_path, [data_row for data_row, _ in self.rows])
+    
+    def redo(self):
+        if self._skip_redo:
+            self._skip_redo = False
+            return
+        self._insert() if self.insert else self._remove()
+    
+    def undo(self):
+        self._remove() if self.insert else self._insert()
+
+
+class ColumnsCommand(QUndoCommand):
+    """
+    Undoable insertion (insert=True) or removal of whole columns in one file,
+    stored as [(data_col, values)] in ascending order; values[0] is the header.
+    """
+    
+    def __init__(self, editor, file_path, columns, text, insert, done=False, parent=None):
+        super().__init__(text, parent)
+        self.editor = editor
+        self.file_path = file_path
+        self.columns = columns
+        self.insert = insert
+        self._skip_redo = done
+    
+    def _insert(self):
+        self.editor.insert_data_columns(self.file_path, self.columns)
+    
+    def _remove(self):
+        self.editor.remove_data_columns(self.file_path, [data_col for data_col, _ in self.columns])
+    
+    def redo(self):
+        if self._skip_redo:
+            self._skip_redo = False
+            return
+        self._insert() if self.insert else self._remove()
+    
+    def undo(self):
+        self._remove() if self.insert else self._insert()
+
+
+class ColumnMoveCommand(QUndoCommand):
+    """Undoable column reorder in one file: the column at data_col from_col moves to to_col"""
+    
+    def __init__(self, editor, file_path, from_col, to_col, text, done=False, parent=None):
+        super().__init__(text, parent)
+        self.editor = editor
+        self.file_path = file_path
+        self.from_col = from_col
+        self.to_col = to_col
+        self._skip_redo = done
+    
+    def redo(self):
+        if self._skip_redo:
+            self._skip_redo = False
+            return
+        self.editor.move_data_column(self.file_path, self.from_col, self.to_col)
+    
+    def undo(self):
+        self.editor.move_data_column(self.file_path, self.to_col, self.from_col)
+
+
+def move_column(rows, from_col, to_col):
+    """Move one column of rows (in place) from index from_col to to_col"""
+    width = max(from_col, to_col) + 1
+    for row in rows:
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+        row.insert(to_col, row.pop(from_col))
+
+
+def index_blocks(indexes):
+    """Group sorted, distinct indexes into contiguous blocks [(first, count)]"""
+    blocks = []
+    for index in indexes:
+        if blocks and blocks[-1][0] + blocks[-1][1] == index:
+            blocks[-1][1] += 1
+        else:
+            blocks.append([index, 1])
+    return [(first, count) for first, count in blocks]
+
+
+def index_after_insert(index, inserted):
+    """Where an index ends up after inserting at the given final indexes (ascending)"""
+    for position in inserted:
+        if position <= index:
+            index += 1
+    return index
+
+
+def index_after_remove(index, removed):
+    """Where an index ends up after removing the given indexes (sorted), or None if removed"""
+    position = bisect.bisect_left(removed, index)
+    if position < len(removed) and removed[position] == index:
+        return None
+    return index - position
+
+
+def index_after_move(index, from_index, to_index):
+    """Where an index ends up after moving the item at from_index to to_index"""
+    if index == from_index:
+        return to_index
+    if from_index < index <= to_index:
+        return index - 1
+    if to_index <= index < from_index:
+        return index + 1
+    return index
+
+
+def rows_to_tsv(rows):
+    """Serialize rows as tab-separated text, quoted the way spreadsheets expect"""
+    buffer = io.StringIO()
+    csv.writer(buffer, delimiter='\t', lineterminator='\n').writerows(rows)
+    return buffer.getvalue()
+
+
+def parse_clipboard_block(text):
+    """
+    Rows of a pasted block: tab-separated (as spreadsheets copy it) or, without
+    tabs, quoted CSV when every row has the same number of fields. Anything
+    else is one cell per row; quoted cells keep their line breaks either way.
+    """
+    if text.endswith("\r\n"):
+        text = text[:-2]
+    elif text.endswith("\n"):
+        text = text[:-1]
+    if not text:
+        return []
+    if '\t' in text:
+        return list(csv.reader(io.StringIO(text), delimiter='\t'))
+    rows = list(csv.reader(io.StringIO(text)))
+    if all(len(row) == 1 for row in rows):
+        return rows
+    # Plain prose has commas too; only split on them if fields are quoted
+    if re.search(r'(^|,)"', text, re.MULTILINE) and all(len(row) == len(rows[0]) for row in rows):
+        return rows
+    return list(csv.reader(io.StringIO(text), delimiter='\t'))
+
+
+def header_issues(headers):
+    """Empty and duplicate headers as [(0, data_col, message)]"""
+    issues = []
+    seen = {}
+    for idx, header in enumerate(headers):
+        header_str = str(header).strip()
+        if not header_str:
+            issues.append((0, idx, f"Column {idx + 1} has an empty header"))
+        if header_str in seen:
+            issues.append((0, idx, f"Duplicate header '{header_str}' found in columns {seen[header_str] + 1} and {idx + 1}"))
+        else:
+            seen[header_str] = idx
+    return issues
+
+
+def row_has_issue(row_data, expected_col_count):
+    return len(row_data) != expected_col_count or not any(str(cell).strip() for cell in row_data)
+
+
+def row_issues(data_row, row_data, expected_col_count):
+    """Ragged and completely empty row issues as [(data_row, data_col, message)]"""
+    issues = []
+    if len(row_data) != expected_col_count:
+        issues.append((
+            data_row, max(0, min(len(row_data), expected_col_count) - 1),
+            f"Row {data_row} has {len(row_data)} columns, expected {expected_col_count}"
+        ))
+    if not any(str(cell).strip() for cell in row_data):
+        issues.append((data_row, 0, f"Row {data_row} is completely empty"))
+    return issues
+
+
+def validate_rows(rows):
+    """
+    Run every validation rule over rows (rows[0] is the header) in a single
+    pass. Returns [(data_row, data_col, message)]; data_row 0 is the header.
+    """
+    if not rows:
+        return [(0, 0, "CSV data is empty")]
+    headers = rows[0]
+    if not headers:
+        return [(0, 0, "No column headers found")]
+    
+    issues = header_issues(headers)
+    expected_col_count = len(headers)
+    for data_row in range(1, len(rows)):
+        row_data = rows[data_row]
+        if row_has_issue(row_data, expected_col_count):
+            issues.extend(row_issues(data_row, row_data, expected_col_count))
+    return issues
+
+
+def validate_file(file_path):
+    """
+    Read a CSV file from disk and run every validation rule on it (a worker
+    process job for Validate All). Returns (issues, row_count, seconds, error).
+    """
+    started = time.perf_counter()
+    try:
+        rows, _ = read_csv_file(file_path)
+        issues = validate_rows(rows)
+        return issues, max(len(rows) - 1, 0), time.perf_counter() - started, ""
+    except Exception as e:
+        return [], 0, time.perf_counter() - started, str(e)
+
+
+class CSVValidator:
+    """
+    Keeps the validation result of one file's rows up to date as they change.
+    Header issues are recomputed with the header row; rows with issues are
+    tracked by data row, so an edit only re-checks the rows it touched.
+    Messages are built when issues() is called, so row numbers stay right
+    after rows are inserted or removed.
+    """
+    
+    def __init__(self, rows):
+        self.rows = rows
+        self.recheck_all()
+    
+    def recheck_all(self):
+        rows = self.rows
+        self.row_count = len(rows)
+        self.expected_col_count = len(rows[0]) if rows else 0
+        self.problem_rows = {
+            data_row for data_row in range(1, len(rows))
+            if row_has_issue(rows[data_row], self.expected_col_count)
+        }
+    
+    def is_stale(self, rows):
+        """Whether rows changed in a way the validator was not told about"""
+        return rows is not self.rows or len(rows) != self.row_count
+    
+    def check_rows(self, data_rows):
+        """Re-check rows after their cells changed"""
+        rows = self.rows
+        for data_row in data_rows:
+            if data_row == 0:
+                if len(rows[0]) != self.expected_col_count:
+                    self.recheck_all()  # Every row is measured against the header
+                    return
+            elif data_row < len(rows) and row_has_issue(rows[data_row], self.expected_col_count):
+                self.problem_rows.add(data_row)
+            else:
+                self.problem_rows.discard(data_row)
+    
+    def rows_inserted(self, first, count):
+        """count rows were inserted at data row first"""
+        self.problem_rows = {row + count if row >= first else row for row in self.problem_rows}
+        self.row_count += count
+        self.check_rows(range(first, first + count))
+    
+    def rows_removed(self, first, count):
+        """count rows were removed starting at data row first"""
+        self.problem_rows = {
+            row - count if row >= first + count else row
+            for row in self.problem_rows
+            if not first <= row < first + count
+        }
+        self.row_count -= count
+    
+    def issues(self):
+        """[(data_row, data_col, message)] in row order; data_row 0 is the header"""
+        if not self.rows:
+            return [(0, 0, "CSV data is empty")]
+        if not self.rows[0]:
+            return [(0, 0, "No column headers found")]
+        issues = header_issues(self.rows[0])
+        for data_row in sorted(self.problem_rows):
+            issues.extend(row_issues(data_row, self.rows[data_row], self.expected_col_count))
+        return issues
+
+
+# Tags (<b>, <color=#FFD700>, </color>), format placeholders ({0}, %d, &a)
+# and numbers, matched in one pass; tags and placeholders come first so the
+# digits inside them are not counted as numbers
+MARKUP_TOKEN_RE = re.compile(
+    r"(?P<tag></?[A-Za-z][^<>]*>)"
+    r"|(?P<placeholder>\{[^{}\s]*\}|%(?:\d+\$)?[-+#0]*\d*(?:\.\d+)?[sdifxXeEgGcu]|&[A-Za-z0-9]+;?)"
+    r"|(?P<number>\d+(?:[.,]\d+)*)"
+    r"|(?P<newline>\r\n|\n|\\n)"
+)
+
+
+def markup_tokens(text):
+    """
+    Markup of one cell as (tags, tags_nested, placeholders, numbers,
+    line_breaks); tags, placeholders and numbers are Counters.
+    """
+    tags = Counter()
+    placeholders = Counter()
+    numbers = Counter()
+    line_breaks = 0
+    tag_sequence = []
+    for match in MARKUP_TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == "tag":
+            tag = re.sub(r"\s+", "", match.group().lower())
+            tags[tag] += 1
+            tag_sequence.append(tag)
+        elif kind == "placeholder":
+            placeholders[match.group()] += 1
+        elif kind == "number":
+            numbers[match.group().replace(",", ".")] += 1
+        else:
+            line_breaks += 1
+    return tags, tags_nested(tag_sequence), placeholders, numbers, line_breaks
+
+
+def tags_nested(tag_sequence):
+    """Whether closing tags match their opening tags; tags never closed (<br>) are ignored"""
+    closed = {tag[2:-1].split("=")[0] for tag in tag_sequence if tag.startswith("</")}
+    stack = []
+    for tag in tag_sequence:
+        if tag.startswith("</"):
+            if not stack or stack.pop() != tag[2:-1]:
+                return False
+        else:
+            name = re.match(r"<([a-z0-9_-]*)", tag).group(1)
+            if name in closed and not tag.endswith("/>"):
+                stack.append(name)
+    return not stack
+
+
+def counter_difference(source, target):
+    """Describe what target lacks and adds compared to source (two Counters)"""
+    missing = ", ".join(sorted((source - target).elements()))
+    extra = ", ".join(sorted((target - source).elements()))
+    parts = []
+    if missing:
+        parts.append(f"missing {missing}")
+    if extra:
+        parts.append(f"extra {extra}")
+    return "; ".join(parts)
+
+
+def compare_markup(source_tokens, target_tokens):
+    """Messages for every way a translation's markup_tokens differ from its source's"""
+    source_tags, source_nested, source_placeholders, source_numbers, source_breaks = source_tokens
+    target_tags, target_nested, target_placeholders, target_numbers, target_breaks = target_tokens
+    messages = []
+    if source_tags != target_tags:
+        messages.append(f"Tags differ: {counter_difference(source_tags, target_tags)}")
+    elif source_nested and not target_nested:
+        messages.append("Tags are not properly nested")
+    if source_placeholders != target_placeholders:
+        messages.append(f"Placeholders differ: {counter_difference(source_placeholders, target_placeholders)}")
+    if source_numbers != target_numbers:
+        messages.append(f"Numbers differ: {counter_difference(source_numbers, target_numbers)}")
+    if source_breaks != target_breaks:
+        messages.append(f"Line breaks: {source_breaks} in source, {target_breaks} in translation")
+    return messages
+
+
+def check_translation_markup(rows, source_column, target_columns=None, is_canceled=None, glossary=None):
+    """
+    Compare the tags, placeholders, numbers and line breaks of each translated
+    cell with its source cell. Columns are header names (case-insensitive);
+    target_columns defaults to every language column other than the source.
+    With a Glossary, cells missing the fixed translation of a source term are
+    reported too (for columns whose language detect_lang_code recognizes).
+    Returns [(data_row, data_col, column_name, message)]; rows without the
+    source column are skipped, and is_canceled is polled every 1000 rows.
+    """
+    headers = [str(h).strip() for h in rows[0]] if rows else []
+    lowered = [h.lower() for h in headers]
+    source_name = source_column.strip().lower()
+    if source_name not in lowered:
+        raise ValueError(f"No '{source_column}' column")
+    source_col = lowered.index(source_name)
+    
+    if target_columns:
+        wanted = {name.strip().lower() for name in target_columns}
+        target_cols = [idx for idx, name in enumerate(lowered) if name in wanted and idx != source_col]
+    else:
+        target_cols = [idx for idx, name in enumerate(headers) if detect_lang_code(name) and idx != source_col]
+    source_lang = detect_lang_code(headers[source_col])
+    target_langs = {data_col: detect_lang_code(headers[data_col]) for data_col in target_cols}
+    if glossary is None or not source_lang:
+        glossary = None
+    
+    # Game text repeats a lot; tokenize each distinct string once
+    tokens = {}
+    
+    def tokens_of(text):
+        result = tokens.get(text)
+        if result is None:
+            result = tokens[text] = markup_tokens(text)
+        return result
+    
+    issues = []
+    for data_row in range(1, len(rows)):
+        if is_canceled and data_row % 1000 == 0 and is_canceled():
+            break
+        row_data = rows[data_row]
+        if source_col >= len(row_data):
+            continue
+        source = row_data[source_col]
+        if not source:
+            continue
+        source_tokens = None
+        for data_col in target_cols:
+            if data_col >= len(row_data):
+                continue
+            target = row_data[data_col]
+            if not target or target == source:
+                continue
+            if source_tokens is None:
+                source_tokens = tokens_of(source)
+            for message in compare_markup(source_tokens, tokens_of(target)):
+                issues.append((data_row, data_col, headers[data_col], message))
+            if glossary is not None and target_langs[data_col]:
+                for term, fixed in glossary.violations(source, target, source_lang, target_langs[data_col]):
+                    issues.append((data_row, data_col, headers[data_col], f"Glossary: '{term}' should be '{fixed}'"))
+    return issues
+
+
+class MarkupCheckTask(QRunnable):
+    """
+    Runs check_translation_markup over one file off the GUI thread; a file
+    that is not loaded (rows is None) is read from disk. Results are emitted
+    through done as (check_id, file_path, issues, error) unless cancel is set.
+    """
+    
+    def __init__(self, check_id, file_path, source_column, target_columns, done, cancel, rows=None,
+                 glossary=None):
+        super().__init__()
+        self.check_id = check_id
+        self.file_path = file_path
+        self.source_column = source_column
+        self.target_columns = target_columns
+        self.done = done  # Bound pyqtSignal(int, str, object, str)
+        self.cancel = cancel  # threading.Event set when the check is superseded
+        self.rows = rows
+        self.glossary = glossary
+    
+    def is_canceled(self):
+        return self.cancel.is_set()
+    
+    def run(self):
+        if self.is_canceled():
+            return
+        issues = []
+        error = ""
+        try:
+            rows = self.rows
+            if rows is None:
+                rows, _ = read_csv_file(self.file_path)
+            issues = check_translation_markup(
+                rows, self.source_column, self.target_columns, self.is_canceled, self.glossary
+            )
+        except Exception as e:
+            error = str(e)
+        if not self.is_canceled():
+            self.done.emit(self.check_id, self.file_path, issues, error)
+
+
+def collect_translation_pairs(rows, source_column, target_column):
+    """
+    Group the translations in rows (rows[0] is the header) by source text as
+    {source: {translation: [data_row, ...]}}, comparing texts without
+    surrounding whitespace; rows with an empty source or translation are
+    skipped. Columns are header names (case-insensitive). Returns
+    (pairs, target data_col).
+    """
+    lowered = [str(h).strip().lower() for h in rows[0]] if rows else []
+    for column in (source_column, target_column):
+        if column.strip().lower() not in lowered:
+            raise ValueError(f"No '{column}' column")
+    source_col = lowered.index(source_column.strip().lower())
+    target_col = lowered.index(target_column.strip().lower())
+    
+    pairs = {}
+    for data_row in range(1, len(rows)):
+        row_data = rows[data_row]
+        if source_col >= len(row_data) or target_col >= len(row_data):
+            continue
+        source = row_data[source_col].strip()
+        translation = row_data[target_col].strip()
+        if source and translation:
+            pairs.setdefault(source, {}).setdefault(translation, []).append(data_row)
+    return pairs, target_col
+
+
+def find_translation_conflicts(file_pairs):
+    """
+    Merge collect_translation_pairs results {file_path: (pairs, target_col)}
+    and return the sources translated more than one way, as
+    [(source, [(translation, [(file_path, data_row, data_col)])])]. The most
+    used translation of a source comes first, and sources with the most
+    cells come first.
+    """
+    # Only references to the per-file row lists are merged; cells are
+    # expanded for conflicting sources alone
+    merged = {}
+    for file_path, (pairs, target_col) in file_pairs.items():
+        for source, translations in pairs.items():
+            variants = merged.setdefault(source, {})
+            for translation, data_rows in translations.items():
+                variants.setdefault(translation, []).append((file_path, target_col, data_rows))
+    
+    conflicts = []
+    for source, variants in merged.items():
+        if len(variants) < 2:
+            continue
+        expanded = [
+            (translation, [
+                (file_path, data_row, target_col)
+                for file_path, target_col, data_rows in refs
+                for data_row in data_rows
+            ])
+            for translation, refs in variants.items()
+        ]
+        expanded.sort(key=lambda variant: (-len(variant[1]), variant[0]))
+        conflicts.append((source, expanded))
+    conflicts.sort(key=lambda conflict: (-sum(len(cells) for _, cells in conflict[1]), conflict[0]))
+    return conflicts
+
+
+class ConsistencyScanTask(QRunnable):
+    """
+    Runs collect_translation_pairs over one file off the GUI thread. A file
+    that is not loaded (rows is None) is read from disk and its rows are
+    returned too, so unifying can write into them. Results are emitted
+    through done as (scan_id, file_path, (pairs, target_col, rows_read), error).
+    """
+    
+    def __init__(self, scan_id, file_path, source_column, target_column, done, cancel, rows=None):
+        super().__init__()
+        self.scan_id = scan_id
+        self.file_path = file_path
+        self.source_column = source_column
+        self.target_column = target_column
+        self.done = done  # Bound pyqtSignal(int, str, object, str)
+        self.cancel = cancel
+        self.rows = rows
+    
+    def run(self):
+        if self.cancel.is_set():
+            return
+        result = ({}, 0, None)
+        error = ""
+        try:
+            rows = self.rows
+            rows_read = None
+            if rows is None:
+                rows, _ = read_csv_file(self.file_path)
+                rows_read = rows
+            pairs, target_col = collect_translation_pairs(rows, self.source_column, self.target_column)
+            result = (pairs, target_col, rows_read)
+        except Exception as e:
+            error = str(e)
+        if not self.cancel.is_set():
+            self.done.emit(self.scan_id, self.file_path, result, error)
+
+
+class SearchHighlightDelegate(QStyledItemDelegate):
+    """
+    Paints search match backgrounds from a set of (row, col) cells, so
+    highlighting and moving between matches never touch the table items.
+    """
+    MATCH_BRUSH = QBrush(QColor(255, 255, 0, 100))  # Light yellow
+    CURRENT_BRUSH = QBrush(QColor(255, 165, 0, 150))  # Orange
+    
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+        self.matches = set()
+        self.current = None
+        self.source = None  # The result list matches was built from
+    
+    def set_matches(self, results):
+        self.matches = set(results)
+        self.current = None
+        self.source = results
+        self.view.viewport().update()
+    
+    def clear(self):
+        if self.matches or self.current:
+            self.matches = set()
+            self.current = None
+            self.source = None
+            self.view.viewport().update()
+    
+    def set_current(self, cell):
+        """Move the current-match highlight, repainting only the two affected cells"""
+        previous, self.current = self.current, cell
+        model = self.view.model()
+        for row_col in (previous, cell):
+            if row_col is not None:
+                self.view.viewport().update(self.view.visualRect(model.index(*row_col)))
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        cell = (index.row(), index.column())
+        if cell == self.current:
+            option.backgroundBrush = self.CURRENT_BRUSH
+        elif cell in self.matches:
+            option.backgroundBrush = self.MATCH_BRUSH
+
+
 class CSVEditorWindow(QMainWindow):
+    endpoint_status_changed = pyqtSignal()
+    file_search_finished = pyqtSignal(int, str, object, str)  # search id, file, matches, error
+    incremental_search_finished = pyqtSignal(int, str, object, str)  # Same, for search-as-you-type
+    file_replace_computed = pyqtSignal(int, str, object, str)  # search id, file, (changes, count, rows), error
+    file_validated = pyqtSignal(int, str, object)  # run id, file, validate_file result
+    markup_check_finished = pyqtSignal(int, str, object, str)  # check id, file, issues, error
+    consistency_scanned = pyqtSignal(int, str, object, str)  # scan id, file, (pairs, target_col, rows), error
+    
     def __init__(self):
         super().__init__()
         self.current_file = None
@@ -48,16 +2420,73 @@ class CSVEditorWindow(QMainWindow):
         self.search_results = []  # Store search results
         self.current_search_index = -1  # Current position in search results
         self.search_active = False  # Flag to prevent clearing during navigation
+        self.search_indexes = {}  # Lazily built TrigramIndex per file {file_path: index}
+        self.validators = {}  # Lazily built CSVValidator per file {file_path: validator}
+        self.validation_run_id = 0  # Latest Validate All run; results of older runs are dropped
+        self.markup_check_id = 0  # Latest Translation Quality check, same idea
+        self.markup_check_cancel = threading.Event()
+        self.markup_check_pending = set()
+        self.markup_check_issues = 0
+        self.markup_check_started = 0.0
+        self.file_search_id = 0  # Bumped per Find in Files search; results of older ones are ignored
+        self.file_search_cancel = threading.Event()  # Set to stop the Find in Files tasks in flight
+        self.incremental_search_id = 0  # Same for search-as-you-type in the Find dialog
+        self.incremental_search_cancel = threading.Event()
+        self.incremental_search_pending = False
+        self.file_search_pending = set()  # Files the current Find in Files search still waits on
+        self.file_search_matches = 0
+        self.file_search_started = 0.0
+        self.file_search_pool = QThreadPool(self)
+        self.file_search_pool.setMaxThreadCount(max(2, min(8, os.cpu_count() or 2)))
+        self.probe_pool = QThreadPool(self)  # Endpoint health probes; waited for on close
+        self.probe_pool.setMaxThreadCount(2)
+        self.regex_sandbox = RegexSandbox()  # Regex searches run here so a runaway pattern can be stopped
         self.file_data_cache = {}  # Cache data for all imported files {file_path: csv_data}
         self.modified_files = set()  # Track which files have been modified
         self.config = {}
-        self.translation_log = []
-        self.endpoint_status = {}
+        self.translation_log = None  # TranslationLog, created once config is loaded
+        self.translation_log_store = None  # TranslationLogStore, persistent history on disk
+        self.endpoint_status = {}  # {service: {'available', 'latency', 'error', 'checked_at', 'traffic'}} from probes and requests
+        self.endpoint_lock = threading.Lock()
+        self.probes_in_flight = set()
         self.circuit_breaker = {}  # Track failures per endpoint
+        self.circuit_trials = set()  # Half-open endpoints whose single trial request is in flight
+        self.circuit_lock = threading.Lock()  # Breaker state is shared with translation workers
+        self.translation_flight = SingleFlight()  # Coalesces identical in-flight translation requests
+        self.translation_workers = []  # Running TranslationWorker threads
+        self.translation_jobs = []  # TranslationJob queue shown in the jobs panel
+        self.translation_buffer = CellUpdateBuffer(self.apply_cell_updates, 100, self)
         self.last_successful_translation = None
+        self.undo_stack = QUndoStack(self)  # Undo history of data edits across files
         self.load_config()
+        self.translation_log = TranslationLog(self.config['log_capacity'])
+        self.translation_log_store = TranslationLogStore(
+            Path.home() / ".csv_editor" / "logs",
+            self.config['log_segment_bytes'],
+            self.config['log_max_segments']
+        )
+        self.glossary = None
         self.init_ui()
-        
+        if self.config['glossary_path']:
+            self.load_glossary(self.config['glossary_path'], quiet=True)
+        
+    def closeEvent(self, event):
+        """Stop background translation jobs and searches before the window goes away"""
+        self.health_timer.stop()
+        self.file_search_cancel.set()
+        self.incremental_search_cancel.set()
+        self.markup_check_cancel.set()
+        self.file_search_pool.waitForDone(5000)
+        # A probe reports back to this window; it is bounded by the request timeout
+        self.probe_pool.waitForDone(int(self.config['request_timeout'] * 1000))
+        self.regex_sandbox.close()
+        for worker in list(self.translation_workers):
+            worker.cancel()
+        for worker in list(self.translation_workers):
+            worker.wait(5000)
+        self.translation_log_store.close()
+        super().closeEvent(event)
+    
     def load_config(self):
         config_path = Path.home() / ".csv_editor" / "config.json"
         if config_path.exists():
@@ -79,6 +2508,15 @@ class CSVEditorWindow(QMainWindow):
         self.config.setdefault('last_successful_endpoints', {})
         self.config.setdefault('circuit_breaker_threshold', 5)
         self.config.setdefault('circuit_breaker_timeout', 300)  # 5 minutes
+        self.config.setdefault('retry_budget', 50)  # Deferred retries allowed per translation job
+        self.config.setdefault('max_concurrent_jobs', 2)  # Translation jobs running at once
+        self.config.setdefault('health_check_interval', 120)  # Seconds between endpoint probes
+        self.config.setdefault('log_capacity', 1000)  # Translation log entries kept in memory
+        self.config.setdefault('log_segment_bytes', 4 * 1024 * 1024)  # Rotate on-disk log segments at this size
+        self.config.setdefault('log_max_segments', 50)  # Oldest on-disk log segments are deleted beyond this
+        self.config.setdefault('regex_time_budget', 5.0)  # Seconds a regex find/replace may run before it is stopped
+        self.config.setdefault('glossary_path', "")  # Glossary CSV applied to translations
+        self.config.setdefault('glossary_mode', "protect")  # "protect", "substitute" or "off"
         
         # Clean up invalid services from config
         valid_services = [s.value for s in TranslationService]
@@ -132,6 +2570,10 @@ class CSVEditorWindow(QMainWindow):
         # Disable auto column resizing for better horizontal scroll performance
         self.csv_table.horizontalHeader().setStretchLastSection(False)
         
+        # Search matches are painted by the delegate instead of item backgrounds
+        self.search_highlighter = SearchHighlightDelegate(self.csv_table)
+        self.csv_table.setItemDelegate(self.search_highlighter)
+        
         # Enable multi-selection
         self.csv_table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
         
@@ -164,11 +2606,33 @@ class CSVEditorWindow(QMainWindow):
         
         layout.addWidget(splitter)
         
+        # Background translation jobs
+        self.create_translation_jobs_panel()
+        self.settings_menu.addAction(self.jobs_dock.toggleViewAction())
+        
+        # Find in Files results
+        self.create_find_in_files_panel()
+        
+        # Live validation issues of the displayed file
+        self.create_validation_panel()
+        
+        # Markup checks of translated columns against their source
+        self.create_markup_check_panel()
+        self.file_search_finished.connect(self.on_file_search_finished)
+        self.markup_check_finished.connect(self.on_markup_check_finished)
+        self.incremental_search_finished.connect(self.on_incremental_search_finished)
+        
         # Status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
         
+        # Periodic background probing of translation endpoints
+        self.health_timer = QTimer(self)
+        self.health_timer.timeout.connect(lambda: self.probe_endpoints(force=True))
+        self.health_timer.start(self.config['health_check_interval'] * 1000)
+        QTimer.singleShot(0, self.probe_endpoints)
+        
     def create_menu_bar(self):
         menubar = self.menuBar()
         
@@ -212,6 +2676,28 @@ class CSVEditorWindow(QMainWindow):
         # Edit menu
         edit_menu = menubar.addMenu("Edit")
         
+        undo_action = self.undo_stack.createUndoAction(self, "Undo")
+        undo_action.setShortcut(QKeySequence.StandardKey.Undo)
+        edit_menu.addAction(undo_action)
+        
+        redo_action = self.undo_stack.createRedoAction(self, "Redo")
+        redo_action.setShortcuts([QKeySequence("Ctrl+Y"), QKeySequence("Ctrl+Shift+Z")])
+        edit_menu.addAction(redo_action)
+        
+        edit_menu.addSeparator()
+        
+        self.copy_action = QAction("Copy", self)
+        self.copy_action.setShortcut(QKeySequence.StandardKey.Copy)
+        self.copy_action.triggered.connect(self.copy_selection)
+        edit_menu.addAction(self.copy_action)
+        
+        self.paste_action = QAction("Paste", self)
+        self.paste_action.setShortcut(QKeySequence.StandardKey.Paste)
+        self.paste_action.triggered.connect(self.paste_cells)
+        edit_menu.addAction(self.paste_action)
+        
+        edit_menu.addSeparator()
+        
         add_column_action = QAction("Add Column...", self)
         add_column_action.setShortcut("Ctrl+Shift+C")
         add_column_action.triggered.connect(self.add_column)
@@ -251,6 +2737,24 @@ class CSVEditorWindow(QMainWindow):
         validate_action.triggered.connect(self.show_validation_dialog)
         edit_menu.addAction(validate_action)
         
+        validate_all_action = QAction("Validate All Files...", self)
+        validate_all_action.triggered.connect(self.show_validate_all_dialog)
+        edit_menu.addAction(validate_all_action)
+        
+        markup_check_action = QAction("Check Translation Markup...", self)
+        markup_check_action.triggered.connect(self.show_markup_check_panel)
+        edit_menu.addAction(markup_check_action)
+        
+        consistency_action = QAction("Check Translation Consistency...", self)
+        consistency_action.triggered.connect(self.show_consistency_dialog)
+        edit_menu.addAction(consistency_action)
+        
+        edit_menu.addSeparator()
+        
+        translate_files_action = QAction("Translate Files in Background...", self)
+        translate_files_action.triggered.connect(self.show_translate_files_dialog)
+        edit_menu.addAction(translate_files_action)
+        
         # Find menu
         find_menu = menubar.addMenu("Find")
         
@@ -269,6 +2773,11 @@ class CSVEditorWindow(QMainWindow):
         find_prev_action.triggered.connect(self.find_previous)
         find_menu.addAction(find_prev_action)
         
+        find_in_files_action = QAction("Find in All Files...", self)
+        find_in_files_action.setShortcut("Ctrl+Shift+F")
+        find_in_files_action.triggered.connect(self.show_find_in_files)
+        find_menu.addAction(find_in_files_action)
+        
         find_menu.addSeparator()
         
         replace_action = QAction("Replace...", self)
@@ -276,8 +2785,14 @@ class CSVEditorWindow(QMainWindow):
         replace_action.triggered.connect(self.show_replace_dialog)
         find_menu.addAction(replace_action)
         
+        replace_in_files_action = QAction("Replace in All Files...", self)
+        replace_in_files_action.setShortcut("Ctrl+Shift+H")
+        replace_in_files_action.triggered.connect(self.show_replace_in_files_dialog)
+        find_menu.addAction(replace_in_files_action)
+        
         # Settings menu
         settings_menu = menubar.addMenu("Settings")
+        self.settings_menu = settings_menu
         
         translation_config_action = QAction("Translation Services Configuration...", self)
         translation_config_action.triggered.connect(self.show_translation_config_dialog)
@@ -287,6 +2802,28 @@ class CSVEditorWindow(QMainWindow):
         view_log_action.triggered.connect(self.show_translation_log)
         settings_menu.addAction(view_log_action)
         
+        # Glossary of fixed term translations
+        glossary_menu = settings_menu.addMenu("Glossary")
+        load_glossary_action = QAction("Load Glossary...", self)
+        load_glossary_action.triggered.connect(self.choose_glossary)
+        glossary_menu.addAction(load_glossary_action)
+        
+        self.unload_glossary_action = QAction("Unload Glossary", self)
+        self.unload_glossary_action.triggered.connect(self.unload_glossary)
+        self.unload_glossary_action.setEnabled(False)
+        glossary_menu.addAction(self.unload_glossary_action)
+        
+        glossary_menu.addSeparator()
+        glossary_mode_group = QActionGroup(self)
+        for mode, label in (("protect", "Protect Terms with Placeholders"),
+                            ("substitute", "Substitute Terms before Translating"),
+                            ("off", "Don't Apply during Translation")):
+            mode_action = QAction(label, self, checkable=True)
+            mode_action.setChecked(self.config['glossary_mode'] == mode)
+            mode_action.triggered.connect(lambda checked, mode=mode: self.set_glossary_mode(mode))
+            glossary_mode_group.addAction(mode_action)
+            glossary_menu.addAction(mode_action)
+        
     def import_file(self):
         """Import CSV file(s) into the application"""
         file_paths, _ = QFileDialog.getOpenFileNames(
@@ -315,6 +2852,21 @@ class CSVEditorWindow(QMainWindow):
             file_path = current_item.data(0, Qt.ItemDataRole.UserRole)
             if file_path in self.imported_files:
                 self.imported_files.remove(file_path)
+            self.invalidate_search_index(file_path)
+            
+            # Stop its translation jobs; results still in flight are dropped
+            self.remap_translation_jobs(file_path, lambda key: None)
+            self.translation_buffer.discard(file_path)
+            for job in self.translation_jobs:
+                if job.file_path == file_path:
+                    self.cancel_translation_job(job)
+            
+            # Undo steps would write into the removed file's data again
+            if self.undo_stack_touches(file_path):
+                self.undo_stack.clear()
+            self.file_data_cache.pop(file_path, None)
+            self.validators.pop(file_path, None)
+            self.modified_files.discard(file_path)
             
             index = self.file_tree.indexOfTopLevelItem(current_item)
             self.file_tree.takeTopLevelItem(index)
@@ -325,15 +2877,27 @@ class CSVEditorWindow(QMainWindow):
                 self.csv_table.setRowCount(0)
                 self.csv_table.setColumnCount(0)
                 self.current_file = None
+                self.csv_data = []
             
             self.status_bar.showMessage("File removed from list")
         
+    def undo_stack_touches(self, file_path):
+        """Whether any command on the undo stack (or one of its children) edits file_path"""
+        pending = [self.undo_stack.command(i) for i in range(self.undo_stack.count())]
+        while pending:
+            command = pending.pop()
+            if getattr(command, 'file_path', None) == file_path:
+                return True
+            pending.extend(command.child(i) for i in range(command.childCount()))
+        return False
+    
     def on_file_selected(self, item, column):
         """Handle file selection from tree"""
-        # Save current file data to cache before switching
+        # Keep the current file's data in the cache before switching; csv_data is
+        # kept in step with every edit, only pending translation results must land
         if self.current_file and self.csv_data:
-            self.sync_csv_data_from_table()
-            self.file_data_cache[self.current_file] = self.csv_data.copy()
+            self.translation_buffer.flush()
+            self.file_data_cache[self.current_file] = self.csv_data
         
         file_path = item.data(0, Qt.ItemDataRole.UserRole)
         self.load_csv_file(file_path)
@@ -344,70 +2908,21 @@ class CSVEditorWindow(QMainWindow):
             # Check if we have cached data for this file
             if file_path in self.file_data_cache:
                 print(f"Loading from cache: {file_path}")
-                self.csv_data = self.file_data_cache[file_path].copy()
+                self.csv_data = self.file_data_cache[file_path]
                 self.current_file = file_path
                 self.display_csv_data()
                 self.status_bar.showMessage(f"Loaded: {Path(file_path).name} (from cache)")
                 return
             
-            # Step 1: Detect file encoding
-            encoding = 'utf-8'  # Default
-            try:
-                with open(file_path, 'rb') as f:
-                    raw_data = f.read()
-                    result = chardet.detect(raw_data)
-                    if result['encoding']:
-                        encoding = result['encoding']
-                        print(f"Detected encoding: {encoding} (confidence: {result['confidence']})")
-            except Exception as e:
-                print(f"Encoding detection failed, using UTF-8: {e}")
-            
-            # Step 2: Read sample to detect CSV dialect
-            dialect = None
-            try:
-                with open(file_path, 'r', encoding=encoding, newline='') as f:
-                    sample = f.read(8192)  # Read first 8KB
-                    sniffer = csv.Sniffer()
-                    dialect = sniffer.sniff(sample)
-                    print(f"Detected delimiter: '{dialect.delimiter}'")
-            except Exception as e:
-                print(f"Dialect detection failed, using default: {e}")
-            
-            # Step 3: Load CSV data with detected settings
-            self.csv_data = []
-            encodings_to_try = [encoding, 'utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-            
-            for enc in encodings_to_try:
-                try:
-                    with open(file_path, 'r', encoding=enc, newline='') as f:
-                        if dialect:
-                            reader = csv.reader(f, dialect=dialect)
-                        else:
-                            reader = csv.reader(f)
-                        
-                        self.csv_data = []
-                        for row in reader:
-                            self.csv_data.append(row)
-                    
-                    # Successfully loaded
-                    print(f"Successfully loaded with encoding: {enc}")
-                    break
-                    
-                except UnicodeDecodeError:
-                    if enc == encodings_to_try[-1]:
-                        raise  # Re-raise if last encoding fails
-                    continue
-                except Exception as e:
-                    if enc == encodings_to_try[-1]:
-                        raise
-                    continue
+            self.csv_data, encoding = read_csv_file(file_path)
+            self.invalidate_search_index(file_path)
             
             if not self.csv_data:
                 QMessageBox.warning(self, "Empty File", "The CSV file is empty.")
                 return
             
             # Cache the loaded data
-            self.file_data_cache[file_path] = self.csv_data.copy()
+            self.file_data_cache[file_path] = self.csv_data
             
             self.current_file = file_path
             self.display_csv_data()
@@ -445,8 +2960,9 @@ class CSVEditorWindow(QMainWindow):
                 QMessageBox.warning(self, "Invalid CSV", "CSV file has no columns.")
                 return
             
-            # Validate and normalize all data rows
-            normalized_data = [headers]
+            # Normalize data rows in place, so the cache, validator and search
+            # index keep referring to the same rows
+            normalized = False
             for row_idx, row_data in enumerate(self.csv_data[1:], start=1):
                 # Ensure row_data is a list
                 if not isinstance(row_data, list):
@@ -460,10 +2976,12 @@ class CSVEditorWindow(QMainWindow):
                     # Truncate extra columns
                     row_data = row_data[:expected_col_count]
                 
-                normalized_data.append(row_data)
-            
-            # Update csv_data with normalized data
-            self.csv_data = normalized_data
+                if row_data is not self.csv_data[row_idx]:
+                    self.csv_data[row_idx] = row_data
+                    normalized = True
+            if normalized and self.current_file:
+                self.validators.pop(self.current_file, None)
+                self.invalidate_search_index(self.current_file)
             
             # Set table dimensions (exclude header row from row count)
             self.csv_table.setRowCount(len(self.csv_data) - 1)
@@ -472,6 +2990,16 @@ class CSVEditorWindow(QMainWindow):
             # Set headers (first row)
             self.csv_table.setHorizontalHeaderLabels(headers)
             
+            # csv_data is already in visual order; drop column moves left over from the previous file
+            header = self.csv_table.horizontalHeader()
+            if header.sectionsMoved():
+                header.blockSignals(True)
+                try:
+                    for col in range(expected_col_count):
+                        header.moveSection(header.visualIndex(col), col)
+                finally:
+                    header.blockSignals(False)
+            
             # Temporarily disconnect itemChanged signal to avoid triggering during load
             self.csv_table.itemChanged.disconnect(self.on_cell_changed)
             
@@ -502,6 +3030,8 @@ class CSVEditorWindow(QMainWindow):
             )
             return
         
+        self.schedule_validation_refresh()
+        
         # Adjust column widths with minimum width for better scrolling
         self.csv_table.resizeColumnsToContents()
         
@@ -520,30 +3050,26 @@ class CSVEditorWindow(QMainWindow):
         try:
             print(f"Column moved: logical={logical_index}, from={old_visual_index}, to={new_visual_index}")
             
-            # Get the current visual order of columns
-            header = self.csv_table.horizontalHeader()
-            col_count = self.csv_table.columnCount()
-            
-            # Create a mapping of visual position to logical index
-            visual_to_logical = []
-            for visual_pos in range(col_count):
-                logical_pos = header.logicalIndex(visual_pos)
-                visual_to_logical.append(logical_pos)
-            
-            print(f"Visual to logical mapping: {visual_to_logical}")
-            
-            # Reorder csv_data based on the new visual order
-            new_csv_data = []
-            for row_data in self.csv_data:
-                new_row = [row_data[logical_idx] for logical_idx in visual_to_logical]
-                new_csv_data.append(new_row)
+            # csv_data is in visual order, so the move is the same single-column move
+            self.translation_buffer.flush()
+            move_column(self.csv_data, old_visual_index, new_visual_index)
+            self.remap_translation_jobs(
+                self.current_file,
+                lambda key: (key[0], index_after_move(key[1], old_visual_index, new_visual_index))
+            )
+            self.invalidate_search_index(self.current_file)
+            self.revalidate_all(self.current_file)
             
-            self.csv_data = new_csv_data
+            # The header has already moved; the command only records it
+            self.undo_stack.push(ColumnMoveCommand(
+                self, self.current_file, old_visual_index, new_visual_index,
+                f"Move column '{self.csv_data[0][new_visual_index]}'", done=True
+            ))
             
             # Mark as modified
             if self.current_file:
                 self.modified_files.add(self.current_file)
-                self.file_data_cache[self.current_file] = self.csv_data.copy()
+                self.file_data_cache[self.current_file] = self.csv_data
                 self.update_file_tree_indicators()
             
             self.status_bar.showMessage(f"Column reordered: {self.csv_data[0][new_visual_index]}")
@@ -568,7 +3094,8 @@ class CSVEditorWindow(QMainWindow):
         
         try:
             row = item.row()
-            col = item.column()
+            # csv_data is kept in visual column order (see on_column_moved)
+            col = self.csv_table.horizontalHeader().visualIndex(item.column())
             
             # Update csv_data (row + 1 because csv_data[0] is headers)
             data_row = row + 1
@@ -583,146 +3110,640 @@ class CSVEditorWindow(QMainWindow):
                 self.csv_data[data_row].append("")
             
             # Update the specific cell
+            old_text = self.csv_data[data_row][col]
             self.csv_data[data_row][col] = item.text()
+            self.update_search_index(self.current_file, data_row, item.text())
+            self.regex_sandbox.rows_changed(self.current_file, [data_row])
+            self.revalidate_rows(self.current_file, [data_row])
+            
+            # Already applied by the edit itself; the command only records it
+            if old_text != item.text() and self.current_file:
+                self.undo_stack.push(CellChangesCommand(
+                    self, self.current_file, [(data_row, col, old_text, item.text())], "Edit cell", done=True
+                ))
             
             # Mark current file as modified and update cache
             if self.current_file:
                 self.modified_files.add(self.current_file)
-                self.file_data_cache[self.current_file] = self.csv_data.copy()
+                self.file_data_cache[self.current_file] = self.csv_data
                 self.update_file_tree_indicators()
             
         except Exception as e:
             print(f"Error updating cell data: {e}")
     
     def validate_csv_data(self):
-        """Validate CSV data integrity and return issues"""
-        issues = []
+        """
+        Validation issues of the displayed file. They come from its incrementally
+        maintained validator, so this only scans the rows if nothing was tracked yet.
+        """
+        validator = self.get_validator(self.current_file) if self.current_file else None
+        issues = validator.issues() if validator is not None else validate_rows(self.csv_data)
+        return [message for _, _, message in issues]
+    
+    def get_validator(self, file_path):
+        """Validator for a file's rows, rebuilt (one pass) if missing or out of step"""
+        rows = self.get_file_data(file_path)
+        if rows is None:
+            return None
+        validator = self.validators.get(file_path)
+        if validator is None or validator.is_stale(rows):
+            validator = CSVValidator(rows)
+            self.validators[file_path] = validator
+        return validator
+    
+    def get_current_validator(self, file_path):
+        """The file's validator if it is in step with the data, else None (it is rebuilt on next use)"""
+        validator = self.validators.get(file_path)
+        rows = self.get_file_data(file_path)
+        if validator is None or rows is None or validator.is_stale(rows):
+            return None
+        return validator
+    
+    def revalidate_rows(self, file_path, data_rows):
+        """Re-check rows whose cells changed"""
+        validator = self.get_current_validator(file_path)
+        if validator is not None:
+            validator.check_rows(data_rows)
+        if file_path == self.current_file:
+            self.schedule_validation_refresh()
+    
+    def revalidate_all(self, file_path):
+        """Re-check every row after the columns changed"""
+        validator = self.get_current_validator(file_path)
+        if validator is not None:
+            validator.recheck_all()
+    
+    def show_validate_all_dialog(self):
+        """Validate every imported file from disk in a process pool and show one report"""
+        if not self.imported_files:
+            QMessageBox.warning(self, "No Files", "Please import CSV files first.")
+            return
         
-        if not self.csv_data or len(self.csv_data) == 0:
-            issues.append("CSV data is empty")
-            return issues
+        files = list(self.imported_files)
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Validate All Files")
+        dialog.setMinimumWidth(800)
+        dialog.setMinimumHeight(500)
         
-        # Check headers
-        headers = self.csv_data[0]
-        if not headers or len(headers) == 0:
-            issues.append("No column headers found")
-            return issues
+        layout = QVBoxLayout()
+        status_label = QLabel(f"Validating {len(files)} file(s)...")
+        layout.addWidget(status_label)
+        
+        tree = QTreeWidget()
+        tree.setHeaderLabels(["File / Issue", "Issues", "Rows", "Time"])
+        tree.setColumnWidth(0, 480)
+        tree.itemActivated.connect(self.open_find_in_files_result)
+        tree.itemDoubleClicked.connect(self.open_find_in_files_result)
+        layout.addWidget(tree)
+        
+        # One row per file in import order, filled in as results arrive
+        file_items = {}
+        for file_path in files:
+            name = Path(file_path).name
+            if file_path in self.modified_files:
+                name += " (unsaved edits not included)"
+            item = QTreeWidgetItem([name, "", "", "pending"])
+            item.setToolTip(0, file_path)
+            item.setData(0, Qt.ItemDataRole.UserRole, (file_path, None, None))
+            tree.addTopLevelItem(item)
+            file_items[file_path] = item
         
-        # Check for empty headers
-        for idx, header in enumerate(headers):
-            if not header or not str(header).strip():
-                issues.append(f"Column {idx + 1} has an empty header")
+        button_layout = QHBoxLayout()
+        copy_btn = QPushButton("Copy Report")
+        copy_btn.setEnabled(False)
+        close_btn = QPushButton("Close")
+        button_layout.addWidget(copy_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+        dialog.setLayout(layout)
         
-        # Check for duplicate headers
-        header_counts = {}
-        for idx, header in enumerate(headers):
-            header_str = str(header).strip()
-            if header_str in header_counts:
-                issues.append(f"Duplicate header '{header_str}' found in columns {header_counts[header_str] + 1} and {idx + 1}")
+        self.validation_run_id += 1
+        run_id = self.validation_run_id
+        results = {}
+        started = time.perf_counter()
+        
+        def on_validated(result_run_id, file_path, result):
+            if result_run_id != run_id or file_path not in file_items:
+                return
+            results[file_path] = result
+            issues, row_count, seconds, error = result
+            item = file_items[file_path]
+            item.setText(2, str(row_count))
+            item.setText(3, f"{seconds * 1000:.0f} ms")
+            if error:
+                item.setText(1, "error")
+                item.addChild(QTreeWidgetItem([f"Could not read file: {error}"]))
+                item.setForeground(0, QColor(200, 0, 0))
+            elif issues:
+                item.setText(1, str(len(issues)))
+                item.setForeground(0, QColor(200, 0, 0))
+                limit = 200
+                for data_row, data_col, message in issues[:limit]:
+                    child = QTreeWidgetItem([message])
+                    child.setData(0, Qt.ItemDataRole.UserRole, (file_path, data_row, data_col))
+                    item.addChild(child)
+                if len(issues) > limit:
+                    item.addChild(QTreeWidgetItem([f"... and {len(issues) - limit} more"]))
             else:
-                header_counts[header_str] = idx
-        
-        # Check column count consistency
-        expected_col_count = len(headers)
-        for row_idx, row_data in enumerate(self.csv_data[1:], start=1):
-            if len(row_data) != expected_col_count:
-                issues.append(
-                    f"Row {row_idx} has {len(row_data)} columns, expected {expected_col_count}"
-                )
+                item.setText(1, "0")
+            
+            if len(results) < len(files):
+                status_label.setText(f"Validating... {len(results)} of {len(files)} file(s) done")
+                return
+            
+            elapsed = time.perf_counter() - started
+            with_issues = sum(1 for r in results.values() if r[0] or r[3])
+            total_rows = sum(r[1] for r in results.values())
+            worker_time = sum(r[2] for r in results.values())
+            status_label.setText(
+                f"Validated {len(files)} file(s), {total_rows} rows, in {elapsed:.2f}s "
+                f"({worker_time:.2f}s of worker time). {with_issues} file(s) with issues."
+            )
+            copy_btn.setEnabled(True)
+        
+        def copy_report():
+            lines = [status_label.text(), ""]
+            for file_path in files:
+                issues, row_count, seconds, error = results[file_path]
+                lines.append(f"{file_path}: {len(issues)} issue(s), {row_count} rows, {seconds * 1000:.0f} ms")
+                if error:
+                    lines.append(f"    Could not read file: {error}")
+                lines.extend(f"    {message}" for _, _, message in issues)
+            QApplication.clipboard().setText("\n".join(lines))
+        
+        copy_btn.clicked.connect(copy_report)
+        close_btn.clicked.connect(dialog.close)
+        self.file_validated.connect(on_validated)
         
-        # Check for completely empty rows
-        for row_idx, row_data in enumerate(self.csv_data[1:], start=1):
-            if all(not str(cell).strip() for cell in row_data):
-                issues.append(f"Row {row_idx} is completely empty")
+        # Worker processes read straight from disk, so large batches don't touch the GUI thread
+        executor = ProcessPoolExecutor(
+            max_workers=max(1, min(os.cpu_count() or 2, len(files), 8)),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        for file_path in files:
+            def report(future, file_path=file_path):
+                if future.cancelled():
+                    return
+                error = future.exception()
+                result = future.result() if error is None else ([], 0, 0.0, str(error))
+                self.file_validated.emit(run_id, file_path, result)
+            executor.submit(validate_file, file_path).add_done_callback(report)
         
-        return issues
+        dialog.exec()
+        executor.shutdown(wait=False, cancel_futures=True)
+        self.file_validated.disconnect(on_validated)
     
-    def sync_csv_data_from_table(self):
-        """Synchronize self.csv_data with current table contents in visual order"""
-        if not self.csv_table.rowCount() or not self.csv_table.columnCount():
+    def create_validation_panel(self):
+        """Create the dockable panel listing the displayed file's validation issues"""
+        self.issues_dock = QDockWidget("Validation Issues", self)
+        self.issues_dock.setObjectName("ValidationIssuesDock")
+        
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
+        layout.setContentsMargins(4, 4, 4, 4)
+        
+        self.issues_summary = QLabel("")
+        layout.addWidget(self.issues_summary)
+        
+        self.issues_list = QListWidget()
+        self.issues_list.itemActivated.connect(self.open_validation_issue)
+        self.issues_list.itemClicked.connect(self.open_validation_issue)
+        layout.addWidget(self.issues_list)
+        
+        self.issues_dock.setWidget(panel)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.issues_dock)
+        self.tabifyDockWidget(self.jobs_dock, self.issues_dock)
+        self.issues_dock.hide()
+        self.settings_menu.addAction(self.issues_dock.toggleViewAction())
+        
+        # Edits come in bursts (typing, pastes, translation batches); refresh once they settle
+        self.issues_refresh_timer = QTimer(self)
+        self.issues_refresh_timer.setSingleShot(True)
+        self.issues_refresh_timer.setInterval(300)
+        self.issues_refresh_timer.timeout.connect(self.refresh_validation_panel)
+        self.issues_dock.visibilityChanged.connect(
+            lambda visible: self.refresh_validation_panel() if visible else None
+        )
+    
+    def schedule_validation_refresh(self):
+        if self.issues_dock.isVisible():
+            self.issues_refresh_timer.start()
+    
+    def refresh_validation_panel(self):
+        """List the displayed file's current issues in the panel"""
+        self.issues_list.clear()
+        validator = self.get_validator(self.current_file) if self.current_file else None
+        if validator is None:
+            self.issues_summary.setText("No file loaded.")
+            self.issues_dock.setWindowTitle("Validation Issues")
             return
         
-        header = self.csv_table.horizontalHeader()
-        col_count = self.csv_table.columnCount()
+        issues = validator.issues()
+        self.issues_dock.setWindowTitle(f"Validation Issues ({len(issues)})" if issues else "Validation Issues")
+        if not issues:
+            rows = validator.rows
+            self.issues_summary.setText(
+                f"No issues found. {max(len(rows) - 1, 0)} rows, {len(rows[0]) if rows else 0} columns."
+            )
+            return
+        
+        self.issues_summary.setText(f"{len(issues)} issue(s) in {Path(self.current_file).name}")
+        limit = 1000  # Keep the list responsive for badly broken files
+        for data_row, data_col, message in issues[:limit]:
+            item = QListWidgetItem(message)
+            item.setData(Qt.ItemDataRole.UserRole, (data_row, data_col))
+            self.issues_list.addItem(item)
+        if len(issues) > limit:
+            self.issues_list.addItem(QListWidgetItem(f"... and {len(issues) - limit} more"))
+    
+    def open_validation_issue(self, item):
+        """Select the cell (or header column) an issue refers to"""
+        target = item.data(Qt.ItemDataRole.UserRole)
+        if not target:
+            return
+        data_row, data_col = target
+        col = self.csv_table.horizontalHeader().logicalIndex(data_col)
+        if col < 0:
+            col = 0
+        if data_row == 0:
+            self.csv_table.selectColumn(col)
+            self.csv_table.scrollTo(self.csv_table.model().index(0, col))
+        elif data_row - 1 < self.csv_table.rowCount():
+            self.csv_table.setCurrentCell(data_row - 1, col)
+            self.csv_table.scrollTo(self.csv_table.model().index(data_row - 1, col))
+    
+    def create_markup_check_panel(self):
+        """Create the dockable Translation Quality panel with markup issues grouped by file"""
+        self.markup_dock = QDockWidget("Translation Quality", self)
+        self.markup_dock.setObjectName("TranslationQualityDock")
+        
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
+        layout.setContentsMargins(4, 4, 4, 4)
+        
+        options_layout = QHBoxLayout()
+        options_layout.addWidget(QLabel("Source:"))
+        self.markup_source_combo = QComboBox()
+        self.markup_source_combo.setEditable(True)
+        self.markup_source_combo.setEditText("English")
+        options_layout.addWidget(self.markup_source_combo)
+        
+        options_layout.addWidget(QLabel("Translations:"))
+        self.markup_targets_input = QLineEdit()
+        self.markup_targets_input.setPlaceholderText("All language columns (or e.g. Korean, Japanese)")
+        self.markup_targets_input.returnPressed.connect(self.start_markup_check)
+        options_layout.addWidget(self.markup_targets_input)
+        
+        check_btn = QPushButton("Check All Files")
+        check_btn.clicked.connect(self.start_markup_check)
+        options_layout.addWidget(check_btn)
+        layout.addLayout(options_layout)
+        
+        self.markup_status = QLabel(
+            "Compares tags, placeholders, numbers and line breaks with the source text, "
+            "and glossary terms when a glossary is loaded."
+        )
+        layout.addWidget(self.markup_status)
+        
+        self.markup_tree = QTreeWidget()
+        self.markup_tree.setHeaderHidden(True)
+        self.markup_tree.itemActivated.connect(self.open_find_in_files_result)
+        self.markup_tree.itemClicked.connect(self.open_find_in_files_result)
+        layout.addWidget(self.markup_tree)
+        
+        self.markup_dock.setWidget(panel)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.markup_dock)
+        self.tabifyDockWidget(self.jobs_dock, self.markup_dock)
+        self.markup_dock.hide()
+        self.settings_menu.addAction(self.markup_dock.toggleViewAction())
+    
+    def show_markup_check_panel(self):
+        # Offer the column names known from files already in memory
+        source = self.markup_source_combo.currentText()
+        self.markup_source_combo.clear()
+        for file_path in self.imported_files:
+            data = self.get_file_data(file_path)
+            for header in (data[0] if data else []):
+                if header and self.markup_source_combo.findText(header) < 0:
+                    self.markup_source_combo.addItem(header)
+        self.markup_source_combo.setEditText(source)
+        
+        self.markup_dock.show()
+        self.markup_dock.raise_()
+    
+    def start_markup_check(self):
+        """Check every imported file on the worker pool; issues stream into the panel"""
+        source = self.markup_source_combo.currentText().strip()
+        if not source:
+            QMessageBox.warning(self, "No Source Column", "Please enter the source column name.")
+            return
+        if not self.imported_files:
+            QMessageBox.warning(self, "No Files", "Please import CSV files first.")
+            return
+        targets = [name.strip() for name in self.markup_targets_input.text().split(",") if name.strip()]
+        
+        self.markup_check_cancel.set()
+        self.markup_check_cancel = threading.Event()
+        self.markup_check_id += 1
+        self.markup_tree.clear()
+        self.markup_check_pending = set(self.imported_files)
+        self.markup_check_issues = 0
+        self.markup_check_started = time.perf_counter()
+        self.markup_status.setText(f"Checking {len(self.imported_files)} file(s)...")
+        
+        self.translation_buffer.flush()
+        for file_path in self.imported_files:
+            rows = self.get_file_data(file_path)
+            self.file_search_pool.start(
+                MarkupCheckTask(
+                    self.markup_check_id, file_path, source, targets, self.markup_check_finished,
+                    self.markup_check_cancel, list(rows) if rows is not None else None, self.glossary
+                )
+            )
+    
+    def on_markup_check_finished(self, check_id, file_path, issues, error):
+        """Add one file's markup issues to the Translation Quality panel"""
+        if check_id != self.markup_check_id:
+            return
+        self.markup_check_pending.discard(file_path)
+        
+        if error:
+            file_item = QTreeWidgetItem([f"{Path(file_path).name} — skipped: {error}"])
+            file_item.setForeground(0, QColor(128, 128, 128))
+            self.markup_tree.addTopLevelItem(file_item)
+        elif issues:
+            self.markup_check_issues += len(issues)
+            file_item = QTreeWidgetItem([f"{Path(file_path).name} ({len(issues)} issues)"])
+            file_item.setToolTip(0, file_path)
+            file_item.setData(0, Qt.ItemDataRole.UserRole, (file_path, None, None))
+            
+            limit = 500
+            for data_row, data_col, column_name, message in issues[:limit]:
+                child = QTreeWidgetItem([f"Row {data_row}, {column_name}: {message}"])
+                child.setData(0, Qt.ItemDataRole.UserRole, (file_path, data_row, data_col))
+                file_item.addChild(child)
+            if len(issues) > limit:
+                file_item.addChild(QTreeWidgetItem([f"... and {len(issues) - limit} more"]))
+            
+            self.markup_tree.addTopLevelItem(file_item)
+            file_item.setExpanded(self.markup_tree.topLevelItemCount() <= 5)
+        
+        if self.markup_check_pending:
+            self.markup_status.setText(
+                f"Checking... {self.markup_check_issues} issues so far, "
+                f"{len(self.markup_check_pending)} file(s) left"
+            )
+        else:
+            elapsed = time.perf_counter() - self.markup_check_started
+            self.markup_status.setText(
+                f"{self.markup_check_issues} issues in {len(self.imported_files)} file(s) ({elapsed:.2f}s)"
+            )
+    
+    def show_consistency_dialog(self):
+        """List source texts translated differently across the imported files and unify them"""
+        if not self.imported_files:
+            QMessageBox.warning(self, "No Files", "Please import CSV files first.")
+            return
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Translation Consistency")
+        dialog.setMinimumWidth(750)
+        dialog.setMinimumHeight(500)
+        
+        layout = QVBoxLayout()
+        form = QFormLayout()
         
-        # Get columns in visual order (respecting drag-and-drop reordering)
-        visual_order = []
-        for visual_pos in range(col_count):
-            logical_pos = header.logicalIndex(visual_pos)
-            visual_order.append(logical_pos)
+        # Column names known from files already in memory
+        known_headers = []
+        for file_path in self.imported_files:
+            data = self.get_file_data(file_path)
+            for header in (data[0] if data else []):
+                if header and header not in known_headers:
+                    known_headers.append(header)
         
-        print(f"Saving with visual order: {visual_order}")
+        source_combo = QComboBox()
+        source_combo.setEditable(True)
+        source_combo.addItems(known_headers)
+        source_combo.setEditText("English" if "English" in known_headers else source_combo.currentText())
+        form.addRow("Source Column:", source_combo)
+        
+        target_combo = QComboBox()
+        target_combo.setEditable(True)
+        target_combo.addItems(known_headers)
+        target_combo.setEditText("Korean" if "Korean" in known_headers else "")
+        form.addRow("Translation Column:", target_combo)
+        layout.addLayout(form)
+        
+        status_label = QLabel(f"{len(self.imported_files)} file(s) will be compared.")
+        status_label.setWordWrap(True)
+        layout.addWidget(status_label)
+        
+        conflict_tree = QTreeWidget()
+        conflict_tree.setHeaderLabels(["Text", "Cells", "Files"])
+        conflict_tree.setColumnWidth(0, 500)
+        layout.addWidget(conflict_tree)
+        
+        hint_label = QLabel(
+            "Tick the translation to keep for each source text. Untick a source text to leave it as it is. "
+            "Double-click a translation to open one of its cells."
+        )
+        hint_label.setWordWrap(True)
+        hint_label.setStyleSheet("color: gray; font-size: 10px;")
+        layout.addWidget(hint_label)
+        
+        button_layout = QHBoxLayout()
+        analyze_btn = QPushButton("Analyze")
+        unify_btn = QPushButton("Unify Ticked")
+        unify_btn.setEnabled(False)
+        close_btn = QPushButton("Close")
+        button_layout.addWidget(analyze_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(unify_btn)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+        
+        dialog.setLayout(layout)
+        
+        # Scan state for the latest run; 'choices' maps a source to its kept translation
+        state = {
+            'id': 0, 'cancel': threading.Event(), 'pending': set(), 'pairs': {}, 'rows_read': {},
+            'errors': [], 'conflicts': [], 'choices': {}, 'skipped': set(), 'started': 0.0
+        }
+        limit = 1000  # Conflicts listed in the tree; the rest keep their most used translation
+        
+        def invalidate():
+            state['cancel'].set()
+            state.update(pending=set(), pairs={}, rows_read={}, errors=[], conflicts=[], choices={}, skipped=set())
+            conflict_tree.clear()
+            unify_btn.setEnabled(False)
+        
+        def start_scan():
+            source = source_combo.currentText().strip()
+            target = target_combo.currentText().strip()
+            if not source or not target:
+                QMessageBox.warning(dialog, "Invalid Input", "Please enter source and translation columns.")
+                return
+            
+            invalidate()
+            self.translation_buffer.flush()
+            state['cancel'] = threading.Event()
+            state['id'] += 1
+            state['pending'] = set(self.imported_files)
+            state['started'] = time.perf_counter()
+            status_label.setText(f"Collecting translations from {len(self.imported_files)} file(s)...")
+            
+            for file_path in self.imported_files:
+                rows = self.get_file_data(file_path)
+                self.file_search_pool.start(ConsistencyScanTask(
+                    state['id'], file_path, source, target, self.consistency_scanned,
+                    state['cancel'], list(rows) if rows is not None else None
+                ))
+        
+        def on_scanned(scan_id, file_path, result, error):
+            if scan_id != state['id'] or file_path not in state['pending']:
+                return
+            state['pending'].discard(file_path)
+            pairs, target_col, rows_read = result
+            if error:
+                state['errors'].append(f"{Path(file_path).name}: {error}")
+            else:
+                state['pairs'][file_path] = (pairs, target_col)
+                if rows_read is not None:
+                    state['rows_read'][file_path] = rows_read
+            
+            if state['pending']:
+                status_label.setText(f"Collecting translations... {len(state['pending'])} file(s) left")
+                return
+            show_conflicts()
+        
+        def show_conflicts():
+            conflicts = find_translation_conflicts(state['pairs'])
+            state['conflicts'] = conflicts
+            state['choices'] = {source: variants[0][0] for source, variants in conflicts}
+            
+            conflict_tree.blockSignals(True)
+            for source, variants in conflicts[:limit]:
+                cell_count = sum(len(cells) for _, cells in variants)
+                source_item = QTreeWidgetItem([
+                    f"{source}  ({len(variants)} translations)", str(cell_count),
+                    str(len({cell[0] for _, cells in variants for cell in cells}))
+                ])
+                source_item.setToolTip(0, source)
+                source_item.setFlags(source_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                source_item.setCheckState(0, Qt.CheckState.Checked)
+                source_item.setData(0, Qt.ItemDataRole.UserRole + 1, source)
+                for index, (translation, cells) in enumerate(variants):
+                    files = sorted({Path(cell[0]).name for cell in cells})
+                    child = QTreeWidgetItem([translation, str(len(cells)), str(len(files))])
+                    child.setToolTip(0, translation)
+                    child.setToolTip(2, "\n".join(files))
+                    child.setFlags(child.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                    child.setCheckState(0, Qt.CheckState.Checked if index == 0 else Qt.CheckState.Unchecked)
+                    child.setData(0, Qt.ItemDataRole.UserRole, cells[0])
+                    child.setData(0, Qt.ItemDataRole.UserRole + 1, translation)
+                    source_item.addChild(child)
+                conflict_tree.addTopLevelItem(source_item)
+            if len(conflicts) > limit:
+                conflict_tree.addTopLevelItem(QTreeWidgetItem([f"... and {len(conflicts) - limit} more"]))
+            conflict_tree.blockSignals(False)
+            
+            elapsed = time.perf_counter() - state['started']
+            source_count = sum(len(pairs) for pairs, _ in state['pairs'].values())
+            text = (
+                f"{len(conflicts)} source text(s) with conflicting translations in {len(state['pairs'])} file(s) "
+                f"({source_count} source texts compared, {elapsed:.2f}s)."
+                if conflicts else f"No conflicting translations in {len(state['pairs'])} file(s) ({elapsed:.2f}s)."
+            )
+            if state['errors']:
+                text += f" Skipped: {'; '.join(state['errors'])}"
+            status_label.setText(text)
+            unify_btn.setEnabled(bool(conflicts))
+        
+        def on_item_changed(item, column):
+            parent = item.parent()
+            if parent is None:
+                source = item.data(0, Qt.ItemDataRole.UserRole + 1)
+                if source is None:
+                    return
+                if item.checkState(0) == Qt.CheckState.Checked:
+                    state['skipped'].discard(source)
+                else:
+                    state['skipped'].add(source)
+                return
+            
+            # Exactly one translation is kept per source text
+            conflict_tree.blockSignals(True)
+            for index in range(parent.childCount()):
+                sibling = parent.child(index)
+                sibling.setCheckState(0, Qt.CheckState.Checked if sibling is item else Qt.CheckState.Unchecked)
+            conflict_tree.blockSignals(False)
+            state['choices'][parent.data(0, Qt.ItemDataRole.UserRole + 1)] = item.data(0, Qt.ItemDataRole.UserRole + 1)
+        
+        def open_variant(item, column):
+            if item.parent() is not None:
+                self.open_find_in_files_result(item)
+        
+        def unify():
+            if state['pending'] or not state['conflicts']:
+                return
+            self.translation_buffer.flush()
+            
+            # Cells holding another translation get the kept one
+            results = {}
+            for source, variants in state['conflicts']:
+                if source in state['skipped']:
+                    continue
+                kept = state['choices'][source]
+                for translation, cells in variants:
+                    if translation == kept:
+                        continue
+                    for file_path, data_row, data_col in cells:
+                        data = self.get_file_data(file_path)
+                        if data is None:
+                            data = state['rows_read'].get(file_path)
+                        # Skip cells that changed since the analysis
+                        if data is None or data_row >= len(data) or data_col >= len(data[data_row]):
+                            continue
+                        old = data[data_row][data_col]
+                        if old.strip() != translation:
+                            continue
+                        results.setdefault(file_path, ([], state['rows_read'].get(file_path)))[0].append(
+                            (data_row, data_col, old, kept)
+                        )
+            
+            total_cells, file_count = self.apply_changes_in_files(results, "Unify translations", "Unify in")
+            self.status_bar.showMessage(f"Unified {total_cells} cell(s) across {file_count} file(s)")
+            invalidate()
+            status_label.setText(
+                f"Unified {total_cells} cell(s) across {file_count} file(s). "
+                "Use Edit > Undo to revert all files in one step."
+            )
         
-        # Collect headers in visual order
-        headers = []
-        for logical_col in visual_order:
-            header_item = self.csv_table.horizontalHeaderItem(logical_col)
-            headers.append(header_item.text() if header_item else f"Column {logical_col}")
+        self.consistency_scanned.connect(on_scanned)
+        analyze_btn.clicked.connect(start_scan)
+        unify_btn.clicked.connect(unify)
+        close_btn.clicked.connect(dialog.close)
+        conflict_tree.itemChanged.connect(on_item_changed)
+        conflict_tree.itemDoubleClicked.connect(open_variant)
         
-        # Collect all rows in visual order
-        data = [headers]
-        for row in range(self.csv_table.rowCount()):
-            row_data = []
-            for logical_col in visual_order:
-                item = self.csv_table.item(row, logical_col)
-                row_data.append(item.text() if item else "")
-            data.append(row_data)
+        # Other columns make the result stale
+        source_combo.currentTextChanged.connect(invalidate)
+        target_combo.currentTextChanged.connect(invalidate)
         
-        # Update csv_data
-        self.csv_data = data
+        dialog.exec()
+        state['cancel'].set()
+        self.consistency_scanned.disconnect(on_scanned)
     
     def show_validation_dialog(self):
-        """Show data validation results"""
+        """Show the live validation issues panel for the displayed file"""
         if not self.current_file:
             QMessageBox.warning(self, "No File", "Please load a CSV file first.")
             return
         
-        # Sync data first
-        self.sync_csv_data_from_table()
-        
-        # Validate
-        issues = self.validate_csv_data()
-        
-        # Show results
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Data Validation")
-        dialog.setMinimumWidth(500)
-        dialog.setMinimumHeight(400)
-        
-        layout = QVBoxLayout()
-        
-        if issues:
-            # Show issues
-            label = QLabel(f"<b>Found {len(issues)} issue(s):</b>")
-            layout.addWidget(label)
-            
-            issues_text = QTextEdit()
-            issues_text.setReadOnly(True)
-            issues_text.setPlainText("\n".join(f"• {issue}" for issue in issues))
-            layout.addWidget(issues_text)
-        else:
-            # No issues
-            label = QLabel("<b>Data validation passed.</b><br><br>No issues found.")
-            label.setStyleSheet("color: green; font-size: 14px;")
-            layout.addWidget(label)
-            
-            info_text = QTextEdit()
-            info_text.setReadOnly(True)
-            info_text.setMaximumHeight(150)
-            info_text.setPlainText(
-                f"Total rows: {len(self.csv_data) - 1}\n"
-                f"Total columns: {len(self.csv_data[0]) if self.csv_data else 0}\n"
-                f"Headers: {', '.join(self.csv_data[0]) if self.csv_data else 'None'}"
-            )
-            layout.addWidget(info_text)
-        
-        # Close button
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(dialog.close)
-        layout.addWidget(close_btn)
-        
-        dialog.setLayout(layout)
-        dialog.exec()
+        self.issues_dock.show()
+        self.issues_dock.raise_()
+        self.refresh_validation_panel()
     
     def save_file(self):
         """Save current CSV file"""
@@ -731,10 +3752,11 @@ class CSVEditorWindow(QMainWindow):
             return
         
         try:
-            # Sync data from table to csv_data
-            self.sync_csv_data_from_table()
+            # csv_data is kept in step with every edit, so only pending
+            # translation results need to land before writing
+            self.translation_buffer.flush()
             
-            # Validate data before saving
+            # Validation state is maintained as the data changes; no full scan here
             issues = self.validate_csv_data()
             if issues:
                 # Show validation warning
@@ -759,7 +3781,7 @@ class CSVEditorWindow(QMainWindow):
                 self.modified_files.remove(self.current_file)
             
             # Update cache
-            self.file_data_cache[self.current_file] = self.csv_data.copy()
+            self.file_data_cache[self.current_file] = self.csv_data
             
             self.update_file_tree_indicators()
             self.status_bar.showMessage(f"Saved: {Path(self.current_file).name}")
@@ -797,10 +3819,10 @@ class CSVEditorWindow(QMainWindow):
             QMessageBox.information(self, "No Changes", "No files have been modified.")
             return
         
-        # Save current file data to cache first
+        # Save current file data to cache first (csv_data is kept in step with every edit)
         if self.current_file and self.csv_data:
-            self.sync_csv_data_from_table()
-            self.file_data_cache[self.current_file] = self.csv_data.copy()
+            self.translation_buffer.flush()
+            self.file_data_cache[self.current_file] = self.csv_data
         
         saved_count = 0
         failed_files = []
@@ -870,22 +3892,11 @@ class CSVEditorWindow(QMainWindow):
         )
         
         if ok and column_name:
-            # Add column to table
+            # Applying the command adds the column to the table and csv_data
             col_count = self.csv_table.columnCount()
-            self.csv_table.insertColumn(col_count)
-            self.csv_table.setHorizontalHeaderItem(col_count, QTableWidgetItem(column_name))
-            
-            # Sync data to ensure consistency
-            self.sync_csv_data_from_table()
-            
-            # Set column width
-            self.csv_table.setColumnWidth(col_count, 150)
-            
-            # Mark as modified
-            if self.current_file:
-                self.modified_files.add(self.current_file)
-                self.file_data_cache[self.current_file] = self.csv_data.copy()
-                self.update_file_tree_indicators()
+            self.undo_stack.push(ColumnsCommand(
+                self, self.current_file, [(col_count, [column_name])], f"Add column '{column_name}'", insert=True
+            ))
             
             self.status_bar.showMessage(f"Added column: {column_name}")
     
@@ -905,21 +3916,11 @@ class CSVEditorWindow(QMainWindow):
         )
         
         if ok and column_name:
-            # Insert column in table
-            self.csv_table.insertColumn(current_col)
-            self.csv_table.setHorizontalHeaderItem(current_col, QTableWidgetItem(column_name))
-            
-            # Sync data to ensure consistency
-            self.sync_csv_data_from_table()
-            
-            # Set column width
-            self.csv_table.setColumnWidth(current_col, 150)
-            
-            # Mark as modified
-            if self.current_file:
-                self.modified_files.add(self.current_file)
-                self.file_data_cache[self.current_file] = self.csv_data.copy()
-                self.update_file_tree_indicators()
+            # Insert before the column as displayed (csv_data is in visual order)
+            data_col = self.csv_table.horizontalHeader().visualIndex(current_col)
+            self.undo_stack.push(ColumnsCommand(
+                self, self.current_file, [(data_col, [column_name])], f"Insert column '{column_name}'", insert=True
+            ))
             
             self.status_bar.showMessage(f"Inserted column: {column_name}")
     
@@ -945,17 +3946,13 @@ class CSVEditorWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # Remove column from table
-            self.csv_table.removeColumn(current_col)
-            
-            # Sync data to ensure consistency
-            self.sync_csv_data_from_table()
-            
-            # Mark as modified
-            if self.current_file:
-                self.modified_files.add(self.current_file)
-                self.file_data_cache[self.current_file] = self.csv_data.copy()
-                self.update_file_tree_indicators()
+            # Keep the column's cells so the deletion can be undone
+            self.translation_buffer.flush()
+            data_col = self.csv_table.horizontalHeader().visualIndex(current_col)
+            values = [row_data[data_col] if data_col < len(row_data) else "" for row_data in self.csv_data]
+            self.undo_stack.push(ColumnsCommand(
+                self, self.current_file, [(data_col, values)], f"Delete column '{column_name}'", insert=False
+            ))
             
             self.status_bar.showMessage(f"Deleted column: {column_name}")
     
@@ -971,28 +3968,11 @@ class CSVEditorWindow(QMainWindow):
             QMessageBox.warning(self, "No Columns", "Cannot add row to a table with no columns.")
             return
         
-        # Temporarily disconnect signal
-        self.csv_table.itemChanged.disconnect(self.on_cell_changed)
-        
-        # Add row to table
+        # Applying the command adds the row to the table and csv_data
         row_position = self.csv_table.rowCount()
-        self.csv_table.insertRow(row_position)
-        
-        # Add empty cells
-        for col in range(col_count):
-            self.csv_table.setItem(row_position, col, QTableWidgetItem(""))
-        
-        # Add to csv_data
-        self.csv_data.append([""] * col_count)
-        
-        # Reconnect signal
-        self.csv_table.itemChanged.connect(self.on_cell_changed)
-        
-        # Mark as modified
-        if self.current_file:
-            self.modified_files.add(self.current_file)
-            self.file_data_cache[self.current_file] = self.csv_data.copy()
-            self.update_file_tree_indicators()
+        self.undo_stack.push(RowsCommand(
+            self, self.current_file, [(row_position + 1, [""] * col_count)], "Add row", insert=True
+        ))
         
         self.status_bar.showMessage(f"Added row {row_position + 1}")
     
@@ -1009,27 +3989,10 @@ class CSVEditorWindow(QMainWindow):
         
         col_count = self.csv_table.columnCount()
         
-        # Temporarily disconnect signal
-        self.csv_table.itemChanged.disconnect(self.on_cell_changed)
-        
-        # Insert row in table
-        self.csv_table.insertRow(current_row)
-        
-        # Add empty cells
-        for col in range(col_count):
-            self.csv_table.setItem(current_row, col, QTableWidgetItem(""))
-        
-        # Insert in csv_data (current_row + 1 because csv_data[0] is headers)
-        self.csv_data.insert(current_row + 1, [""] * col_count)
-        
-        # Reconnect signal
-        self.csv_table.itemChanged.connect(self.on_cell_changed)
-        
-        # Mark as modified
-        if self.current_file:
-            self.modified_files.add(self.current_file)
-            self.file_data_cache[self.current_file] = self.csv_data.copy()
-            self.update_file_tree_indicators()
+        # current_row + 1 because csv_data[0] is headers
+        self.undo_stack.push(RowsCommand(
+            self, self.current_file, [(current_row + 1, [""] * col_count)], "Insert row", insert=True
+        ))
         
         self.status_bar.showMessage(f"Inserted row at position {current_row + 1}")
     
@@ -1039,10 +4002,10 @@ class CSVEditorWindow(QMainWindow):
             QMessageBox.warning(self, "No File", "Please load a CSV file first.")
             return
         
-        # Get selected rows
+        # Get selected rows from the selection ranges (not one item per selected cell)
         selected_rows = set()
-        for item in self.csv_table.selectedItems():
-            selected_rows.add(item.row())
+        for selection_range in self.csv_table.selectedRanges():
+            selected_rows.update(range(selection_range.topRow(), selection_range.bottomRow() + 1))
         
         if not selected_rows:
             current_row = self.csv_table.currentRow()
@@ -1062,28 +4025,104 @@ class CSVEditorWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # Temporarily disconnect signal
-            self.csv_table.itemChanged.disconnect(self.on_cell_changed)
-            
-            # Sort rows in descending order to delete from bottom to top
-            for row in sorted(selected_rows, reverse=True):
-                # Remove from table
-                self.csv_table.removeRow(row)
-                
-                # Remove from csv_data (row + 1 because csv_data[0] is headers)
-                if row + 1 < len(self.csv_data):
-                    del self.csv_data[row + 1]
-            
-            # Reconnect signal
-            self.csv_table.itemChanged.connect(self.on_cell_changed)
+            # Keep the deleted rows so they can be restored in one undo step
+            # (row + 1 because csv_data[0] is headers)
+            self.translation_buffer.flush()
+            rows = [
+                (row + 1, self.csv_data[row + 1])
+                for row in sorted(selected_rows)
+                if row + 1 < len(self.csv_data)
+            ]
+            self.undo_stack.push(RowsCommand(self, self.current_file, rows, f"Delete {row_text}", insert=False))
             
             self.status_bar.showMessage(f"Deleted {row_count} {row_text}")
-            
-            # Mark as modified and update cache
-            if self.current_file:
-                self.modified_files.add(self.current_file)
-                self.file_data_cache[self.current_file] = self.csv_data.copy()
-                self.update_file_tree_indicators()
+    
+    def copy_selection(self):
+        """Copy the selected cells to the clipboard as tab-separated text"""
+        if not self.current_file:
+            return
+        self.translation_buffer.flush()
+        
+        ranges = self.csv_table.selectedRanges()
+        header = self.csv_table.horizontalHeader()
+        if ranges:
+            rows = sorted({row for r in ranges for row in range(r.topRow(), r.bottomRow() + 1)})
+            cols = sorted({header.visualIndex(col) for r in ranges for col in range(r.leftColumn(), r.rightColumn() + 1)})
+        elif self.csv_table.currentRow() >= 0 and self.csv_table.currentColumn() >= 0:
+            rows = [self.csv_table.currentRow()]
+            cols = [header.visualIndex(self.csv_table.currentColumn())]
+        else:
+            return
+        
+        # Read csv_data (visual column order) rather than the table items
+        block = []
+        for row in rows:
+            if row + 1 >= len(self.csv_data):
+                continue
+            row_data = self.csv_data[row + 1]
+            block.append([row_data[col] if col < len(row_data) else "" for col in cols])
+        QApplication.clipboard().setText(rows_to_tsv(block))
+        self.status_bar.showMessage(f"Copied {len(block)} x {len(cols)} cells")
+    
+    def paste_cells(self):
+        """
+        Paste a tab- or comma-separated clipboard block at the current cell as
+        one undo step, adding rows and columns as needed.
+        """
+        if not self.current_file:
+            QMessageBox.warning(self, "No File", "Please load a CSV file first.")
+            return
+        
+        block = parse_clipboard_block(QApplication.clipboard().text())
+        if not block:
+            return
+        self.translation_buffer.flush()
+        
+        header = self.csv_table.horizontalHeader()
+        start_row = max(self.csv_table.currentRow(), 0) + 1  # csv_data[0] is headers
+        current_col = self.csv_table.currentColumn()
+        start_col = header.visualIndex(current_col) if current_col >= 0 else 0
+        width = max(len(values) for values in block)
+        col_count = self.csv_table.columnCount()
+        last_row = len(self.csv_data) - 1
+        
+        command = QUndoCommand(f"Paste {len(block)} x {width} cells")
+        
+        # New columns first, so the appended rows and cell changes can address them
+        if start_col + width > col_count:
+            new_columns = [(col, [f"Column {col + 1}"]) for col in range(col_count, start_col + width)]
+            ColumnsCommand(self, self.current_file, new_columns, "Add columns", insert=True, parent=command)
+            col_count = start_col + width
+        
+        changes = []
+        new_rows = []
+        for offset, values in enumerate(block):
+            data_row = start_row + offset
+            if data_row <= last_row:
+                row_data = self.csv_data[data_row]
+                for i, text in enumerate(values):
+                    data_col = start_col + i
+                    old_text = row_data[data_col] if data_col < len(row_data) else ""
+                    if old_text != text:
+                        changes.append((data_row, data_col, old_text, text))
+            else:
+                row_values = [""] * col_count
+                row_values[start_col:start_col + len(values)] = values
+                new_rows.append((data_row, row_values))
+        
+        if new_rows:
+            RowsCommand(self, self.current_file, new_rows, "Add rows", insert=True, parent=command)
+        if changes:
+            CellChangesCommand(self, self.current_file, changes, "Paste cells", parent=command)
+        
+        if not command.childCount():
+            self.status_bar.showMessage("Paste: nothing changed")
+            return
+        self.undo_stack.push(command)
+        self.status_bar.showMessage(
+            f"Pasted {len(block)} x {width} cells"
+            + (f", added {len(new_rows)} row(s)" if new_rows else "")
+        )
     
     def show_find_dialog(self):
         """Show find dialog"""
@@ -1124,8 +4163,29 @@ class CSVEditorWindow(QMainWindow):
         
         dialog.setLayout(layout)
         
+        # Search as you type, once typing pauses
+        search_timer = QTimer(dialog)
+        search_timer.setSingleShot(True)
+        search_timer.setInterval(250)
+        
+        def search_as_you_type():
+            self.start_incremental_search(
+                search_input.text(),
+                case_sensitive.isChecked(),
+                whole_word.isChecked(),
+                use_regex.isChecked()
+            )
+        
+        search_timer.timeout.connect(search_as_you_type)
+        search_input.textChanged.connect(search_timer.start)
+        case_sensitive.toggled.connect(search_timer.start)
+        whole_word.toggled.connect(search_timer.start)
+        use_regex.toggled.connect(search_timer.start)
+        
         # Connect buttons
         def do_find_all():
+            search_timer.stop()
+            self.cancel_incremental_search()
             self.perform_search(
                 search_input.text(),
                 case_sensitive.isChecked(),
@@ -1134,6 +4194,11 @@ class CSVEditorWindow(QMainWindow):
             )
         
         def do_find_next():
+            if search_timer.isActive() or self.incremental_search_pending:
+                # Results for the text as typed are not in yet; search right away
+                search_timer.stop()
+                self.cancel_incremental_search()
+                self.search_results = []
             if search_input.text():
                 # Only perform search if no results exist yet
                 if not self.search_results:
@@ -1151,6 +4216,8 @@ class CSVEditorWindow(QMainWindow):
         find_next_btn.clicked.connect(do_find_next)
         
         def close_and_clear():
+            search_timer.stop()
+            self.cancel_incremental_search()
             # Clear highlights when closing dialog
             if self.search_results:
                 self.clear_search_highlights()
@@ -1164,6 +4231,8 @@ class CSVEditorWindow(QMainWindow):
         search_input.returnPressed.connect(do_find_next)
         
         # Clear highlights when dialog is closed (X button)
+        dialog.finished.connect(search_timer.stop)
+        dialog.finished.connect(self.cancel_incremental_search)
         dialog.finished.connect(lambda: self.clear_search_highlights() if self.search_results else None)
         
         dialog.exec()
@@ -1183,36 +4252,27 @@ class CSVEditorWindow(QMainWindow):
             return
         
         # Prepare search pattern
-        if use_regex:
-            try:
-                if case_sensitive:
-                    pattern = re.compile(search_text)
-                else:
-                    pattern = re.compile(search_text, re.IGNORECASE)
-            except re.error as e:
-                QMessageBox.warning(self, "Invalid Regex", f"Invalid regular expression:\n{str(e)}")
-                return
-        else:
-            # Escape special regex characters
-            search_text_escaped = re.escape(search_text)
-            if whole_word:
-                search_text_escaped = r'\b' + search_text_escaped + r'\b'
-            if case_sensitive:
-                pattern = re.compile(search_text_escaped)
-            else:
-                pattern = re.compile(search_text_escaped, re.IGNORECASE)
-        
-        # Search through all cells
-        for row in range(self.csv_table.rowCount()):
-            for col in range(self.csv_table.columnCount()):
-                item = self.csv_table.item(row, col)
-                if item and item.text() and pattern.search(item.text()):
-                    self.search_results.append((row, col))
-                    # Highlight matching cell
-                    try:
-                        item.setBackground(QColor(255, 255, 0, 100))  # Light yellow
-                    except Exception as e:
-                        print(f"Error highlighting cell [{row}, {col}]: {e}")
+        try:
+            pattern = self.compile_search_pattern(search_text, case_sensitive, whole_word, use_regex)
+        except re.error as e:
+            QMessageBox.warning(self, "Invalid Regex", f"Invalid regular expression:\n{str(e)}")
+            return
+        
+        # Only rows containing the query's literal text need checking
+        literal = regex_literal_prefix(search_text) if use_regex else search_text
+        results = self.find_matching_cells(pattern, literal, sandboxed=use_regex)
+        if results is None:
+            return  # Timed out or canceled
+        self.show_search_results(results)
+        
+        if not self.search_results:
+            QMessageBox.information(self, "No Results", f"No matches found for '{search_text}'")
+    
+    def show_search_results(self, results):
+        """Replace the current search results with results (table cells) and highlight them"""
+        self.search_results = results
+        self.current_search_index = -1
+        self.search_highlighter.set_matches(results)
         
         # Show results
         if self.search_results:
@@ -1221,19 +4281,174 @@ class CSVEditorWindow(QMainWindow):
             self.status_bar.showMessage(f"Found {len(self.search_results)} matches")
         else:
             self.status_bar.showMessage("No matches found")
-            QMessageBox.information(self, "No Results", f"No matches found for '{search_text}'")
     
-    def clear_search_highlights(self):
-        """Clear search highlights only from previously highlighted cells"""
+    def start_incremental_search(self, search_text, case_sensitive, whole_word, use_regex):
+        """
+        Search the displayed file on the search pool for search-as-you-type.
+        A scan still running for an older query is canceled.
+        """
+        self.cancel_incremental_search()
+        if not search_text or not self.current_file:
+            self.show_search_results([])
+            self.status_bar.clearMessage()
+            return
+        
         try:
-            # Only clear highlights from cells that were in search results
-            for row, col in self.search_results:
-                item = self.csv_table.item(row, col)
-                if item:
-                    # Reset to default (transparent/no background)
-                    item.setData(Qt.ItemDataRole.BackgroundRole, None)
-        except Exception as e:
-            print(f"Error clearing highlights: {e}")
+            pattern = self.compile_search_pattern(search_text, case_sensitive, whole_word, use_regex)
+        except re.error as e:
+            self.status_bar.showMessage(f"Invalid regular expression: {e}")
+            return
+        
+        # Pending translation results must be in csv_data before it is searched
+        self.translation_buffer.flush()
+        rows = list(self.csv_data)  # Snapshot; edits during the scan don't shift rows under it
+        candidate_rows = None
+        literal = regex_literal_prefix(search_text) if use_regex else search_text
+        index = self.search_indexes.get(self.current_file)
+        if literal and index is not None and not index.is_stale(rows):
+            candidate_rows = index.candidates(literal)
+        
+        self.incremental_search_cancel = threading.Event()
+        self.incremental_search_id += 1
+        self.incremental_search_pending = True
+        self.status_bar.showMessage("Searching...")
+        self.file_search_pool.start(FileSearchTask(
+            self.incremental_search_id, self.current_file, pattern, self.incremental_search_finished,
+            self.incremental_search_cancel, rows, candidate_rows,
+            self.regex_sandbox if use_regex else None, self.config['regex_time_budget']
+        ))
+    
+    def cancel_incremental_search(self):
+        self.incremental_search_cancel.set()
+        self.incremental_search_pending = False
+    
+    def on_incremental_search_finished(self, search_id, file_path, matches, error):
+        """Show search-as-you-type results if they are still for the current query and file"""
+        if search_id != self.incremental_search_id or file_path != self.current_file:
+            return
+        self.incremental_search_pending = False
+        if error:
+            self.status_bar.showMessage(f"Search failed: {error}")
+            return
+        
+        self.show_search_results(self.matches_to_table_cells(matches))
+    
+    def matches_to_table_cells(self, matches):
+        """Table cells (row, col) of search_file_rows matches in the displayed file, row-major"""
+        # csv_data is in visual column order, results are in table (logical) order
+        header = self.csv_table.horizontalHeader()
+        row_count = self.csv_table.rowCount()
+        results = sorted(
+            (data_row - 1, header.logicalIndex(data_col))
+            for data_row, data_col, _, _ in matches
+            if data_row <= row_count
+        )
+        return [(row, col) for row, col in results if col >= 0]
+    
+    def run_sandboxed_regex(self, func, *args, rows=None, key=None):
+        """
+        Run func(*args) in the regex sandbox while the GUI keeps repainting;
+        with rows, func(rows, *args) (see RegexSandbox.run). Returns None if
+        the user cancels or regex_time_budget runs out, after telling them why.
+        """
+        budget = self.config['regex_time_budget']
+        progress = QProgressDialog("Evaluating regular expression...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Regular Expression")
+        progress.setWindowModality(Qt.WindowModality.ApplicationModal)
+        progress.setMinimumDuration(500)
+        
+        def poll():
+            # User input is only handled once the (modal) progress dialog is up
+            if progress.isVisible():
+                QApplication.processEvents()
+            else:
+                QApplication.processEvents(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
+        
+        try:
+            return self.regex_sandbox.run(func, args, budget, progress.wasCanceled, poll, rows, key)
+        except RegexTimeout:
+            QMessageBox.warning(
+                self, "Regular Expression Timed Out",
+                f"The regular expression did not finish within {budget:g} seconds and was stopped.\n\n"
+                "This usually means catastrophic backtracking, e.g. nested quantifiers such as (a+)+ "
+                "or (.*)*. Simplify the pattern, or raise regex_time_budget in ~/.csv_editor/config.json."
+            )
+            return None
+        finally:
+            progress.close()
+    
+    def compute_current_file_replacements(self, pattern, replacement, literal="", sandboxed=False):
+        """
+        Cell changes replacing pattern in the displayed file, narrowed by the
+        search index. With sandboxed, None if the regex timed out or was canceled.
+        """
+        # Pending translation results must be in csv_data first
+        self.translation_buffer.flush()
+        candidate_rows = None
+        index = self.search_indexes.get(self.current_file)
+        if literal and index is not None and not index.is_stale(self.csv_data):
+            # Use the index if Find already built it; one full pass is cheaper than building it
+            candidate_rows = index.candidates(literal)
+        if sandboxed:
+            return self.run_sandboxed_regex(
+                compute_replacements, pattern, replacement, candidate_rows,
+                rows=self.csv_data, key=self.current_file
+            )
+        return compute_replacements(self.csv_data, pattern, replacement, candidate_rows)
+    
+    def compile_search_pattern(self, search_text, case_sensitive, whole_word, use_regex):
+        """Build the regex for a search; raises re.error for an invalid regular expression"""
+        return compile_search_regex(search_text, case_sensitive, whole_word, use_regex)
+    
+    def find_matching_cells(self, pattern, literal="", sandboxed=False):
+        """
+        Table cells (row, col) of the displayed file whose text matches pattern,
+        in row-major order. literal is text every match contains; it lets the
+        trigram index narrow the rows that are checked. With sandboxed the
+        matching runs in the regex sandbox; None if it timed out or was canceled.
+        """
+        # Pending translation results must be in csv_data before it is searched
+        self.translation_buffer.flush()
+        if not self.current_file or len(self.csv_data) < 2:
+            return []
+        
+        candidate_rows = None
+        if literal:
+            candidate_rows = self.get_search_index(self.current_file).candidates(literal)
+        
+        if sandboxed:
+            matches = self.run_sandboxed_regex(
+                search_file_rows, pattern, candidate_rows, rows=self.csv_data, key=self.current_file
+            )
+            if matches is None:
+                return None
+        else:
+            matches = search_file_rows(self.csv_data, pattern, candidate_rows)
+        return self.matches_to_table_cells(matches)
+    
+    def get_search_index(self, file_path):
+        """Trigram index for a file's rows, built on first use"""
+        rows = self.get_file_data(file_path) or []
+        index = self.search_indexes.get(file_path)
+        if index is None or index.is_stale(rows):
+            index = TrigramIndex(rows)
+            self.search_indexes[file_path] = index
+        return index
+    
+    def update_search_index(self, file_path, data_row, text):
+        """Fold an edited cell into the file's search index, if it has one"""
+        index = self.search_indexes.get(file_path)
+        if index is not None and text:
+            index.update_cell(data_row, str(text))
+    
+    def invalidate_search_index(self, file_path):
+        """Drop a file's search index (and sandbox copies of its rows) after rows were inserted, removed or reloaded"""
+        self.search_indexes.pop(file_path, None)
+        self.regex_sandbox.forget(file_path)
+    
+    def clear_search_highlights(self):
+        """Clear search highlights (search_results is kept for F3)"""
+        self.search_highlighter.clear()
     
     def highlight_current_result(self):
         """Highlight the current search result"""
@@ -1244,19 +4459,15 @@ class CSVEditorWindow(QMainWindow):
             # Set flag to prevent clearing during navigation
             self.search_active = True
             
-            # Reset all search results to light yellow
-            for idx, (row, col) in enumerate(self.search_results):
-                item = self.csv_table.item(row, col)
-                if item:
-                    if idx == self.current_search_index:
-                        # Current result: Orange
-                        item.setBackground(QColor(255, 165, 0, 150))
-                    else:
-                        # Other results: Light yellow
-                        item.setBackground(QColor(255, 255, 0, 100))
+            # Highlights were cleared (e.g. dialog closed) or belong to older results
+            if self.search_highlighter.source is not self.search_results:
+                self.search_highlighter.set_matches(self.search_results)
             
-            # Scroll to current result
+            # Current result in orange, the others stay light yellow
             row, col = self.search_results[self.current_search_index]
+            self.search_highlighter.set_current((row, col))
+            
+            # Scroll to current result
             self.csv_table.setCurrentCell(row, col)
             item = self.csv_table.item(row, col)
             if item:
@@ -1293,6 +4504,158 @@ class CSVEditorWindow(QMainWindow):
         self.current_search_index = (self.current_search_index - 1) % len(self.search_results)
         self.highlight_current_result()
     
+    def create_find_in_files_panel(self):
+        """Create the dockable Find in Files panel with results grouped by file"""
+        self.find_dock = QDockWidget("Find in Files", self)
+        self.find_dock.setObjectName("FindInFilesDock")
+        
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
+        layout.setContentsMargins(4, 4, 4, 4)
+        
+        query_layout = QHBoxLayout()
+        self.find_files_input = QLineEdit()
+        self.find_files_input.setPlaceholderText("Find in all imported files...")
+        self.find_files_input.returnPressed.connect(self.start_find_in_files)
+        query_layout.addWidget(self.find_files_input)
+        
+        self.find_files_case = QCheckBox("Case sensitive")
+        query_layout.addWidget(self.find_files_case)
+        self.find_files_whole_word = QCheckBox("Whole word")
+        query_layout.addWidget(self.find_files_whole_word)
+        self.find_files_regex = QCheckBox("Regular expression")
+        query_layout.addWidget(self.find_files_regex)
+        
+        search_btn = QPushButton("Search")
+        search_btn.clicked.connect(self.start_find_in_files)
+        query_layout.addWidget(search_btn)
+        layout.addLayout(query_layout)
+        
+        self.find_files_status = QLabel("")
+        layout.addWidget(self.find_files_status)
+        
+        self.find_files_tree = QTreeWidget()
+        self.find_files_tree.setHeaderHidden(True)
+        self.find_files_tree.itemActivated.connect(self.open_find_in_files_result)
+        self.find_files_tree.itemClicked.connect(self.open_find_in_files_result)
+        layout.addWidget(self.find_files_tree)
+        
+        self.find_dock.setWidget(panel)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.find_dock)
+        self.tabifyDockWidget(self.jobs_dock, self.find_dock)
+        self.find_dock.hide()
+        self.settings_menu.addAction(self.find_dock.toggleViewAction())
+    
+    def show_find_in_files(self):
+        self.find_dock.show()
+        self.find_dock.raise_()
+        self.find_files_input.setFocus()
+        self.find_files_input.selectAll()
+    
+    def start_find_in_files(self):
+        """Search every imported file on the worker pool; results stream into the panel"""
+        search_text = self.find_files_input.text()
+        if not search_text:
+            return
+        if not self.imported_files:
+            QMessageBox.warning(self, "No Files", "Please import CSV files first.")
+            return
+        
+        use_regex = self.find_files_regex.isChecked()
+        try:
+            pattern = self.compile_search_pattern(
+                search_text, self.find_files_case.isChecked(), self.find_files_whole_word.isChecked(), use_regex
+            )
+        except re.error as e:
+            QMessageBox.warning(self, "Invalid Regex", f"Invalid regular expression:\n{str(e)}")
+            return
+        
+        # A new search supersedes the one in flight; its tasks notice and stop
+        self.file_search_cancel.set()
+        self.file_search_cancel = threading.Event()
+        self.file_search_id += 1
+        self.find_files_tree.clear()
+        self.file_search_pending = set(self.imported_files)
+        self.file_search_matches = 0
+        self.file_search_started = time.perf_counter()
+        self.find_files_status.setText(f"Searching {len(self.imported_files)} file(s)...")
+        
+        # Pending translation results must be in the in-memory data first
+        self.translation_buffer.flush()
+        literal = regex_literal_prefix(search_text) if use_regex else search_text
+        for file_path in self.imported_files:
+            rows = self.get_file_data(file_path)
+            candidate_rows = None
+            if rows is not None:
+                # Snapshot the row list so edits during the search don't shift rows
+                rows = list(rows)
+                index = self.search_indexes.get(file_path)
+                if literal and index is not None and not index.is_stale(rows):
+                    candidate_rows = index.candidates(literal)
+            self.file_search_pool.start(
+                FileSearchTask(
+                    self.file_search_id, file_path, pattern, self.file_search_finished,
+                    self.file_search_cancel, rows, candidate_rows,
+                    self.regex_sandbox if use_regex else None, self.config['regex_time_budget']
+                )
+            )
+    
+    def on_file_search_finished(self, search_id, file_path, matches, error):
+        """Add one file's Find in Files results to the panel"""
+        if search_id != self.file_search_id:
+            return
+        self.file_search_pending.discard(file_path)
+        
+        if error:
+            file_item = QTreeWidgetItem([f"{Path(file_path).name} — error: {error}"])
+            file_item.setForeground(0, QColor(200, 0, 0))
+            self.find_files_tree.addTopLevelItem(file_item)
+        elif matches:
+            self.file_search_matches += len(matches)
+            file_item = QTreeWidgetItem([f"{Path(file_path).name} ({len(matches)} matches)"])
+            file_item.setToolTip(0, file_path)
+            file_item.setData(0, Qt.ItemDataRole.UserRole, (file_path, None, None))
+            
+            limit = 500  # Keep the tree responsive for very common queries
+            for data_row, data_col, column_name, text in matches[:limit]:
+                preview = text if len(text) <= 100 else text[:100] + "..."
+                child = QTreeWidgetItem([f"Row {data_row}, {column_name}: {preview}"])
+                child.setData(0, Qt.ItemDataRole.UserRole, (file_path, data_row, data_col))
+                file_item.addChild(child)
+            if len(matches) > limit:
+                file_item.addChild(QTreeWidgetItem([f"... and {len(matches) - limit} more"]))
+            
+            self.find_files_tree.addTopLevelItem(file_item)
+            file_item.setExpanded(self.find_files_tree.topLevelItemCount() <= 5)
+        
+        if self.file_search_pending:
+            self.find_files_status.setText(
+                f"Searching... {self.file_search_matches} matches so far, "
+                f"{len(self.file_search_pending)} file(s) left"
+            )
+        else:
+            elapsed = time.perf_counter() - self.file_search_started
+            files_with_matches = self.find_files_tree.topLevelItemCount()
+            self.find_files_status.setText(
+                f"{self.file_search_matches} matches in {files_with_matches} file(s) ({elapsed:.2f}s)"
+            )
+    
+    def open_find_in_files_result(self, item, column=0):
+        """Open the file of a Find in Files result and select the matching cell"""
+        target = item.data(0, Qt.ItemDataRole.UserRole)
+        if not target:
+            return
+        file_path, data_row, data_col = target
+        if not self.open_file(file_path) or data_row is None:
+            return
+        
+        # csv_data is in visual column order; the table is addressed by logical column
+        col = self.csv_table.horizontalHeader().logicalIndex(data_col)
+        row = data_row - 1
+        if 0 <= row < self.csv_table.rowCount() and col >= 0:
+            self.csv_table.setCurrentCell(row, col)
+            self.csv_table.scrollTo(self.csv_table.model().index(row, col))
+    
     def show_replace_dialog(self):
         """Show find and replace dialog"""
         if not self.current_file:
@@ -1357,14 +4720,16 @@ class CSVEditorWindow(QMainWindow):
                 old_text = item.text()
                 if use_regex:
                     try:
-                        if case_sensitive.isChecked():
-                            pattern = re.compile(find_input.text())
+                        pattern = self.compile_search_pattern(find_input.text(), case_sensitive.isChecked(), False, True)
+                        if len(old_text) <= INLINE_REGEX_MAX_LENGTH:
+                            new_text = substitute_text(pattern, replace_input.text(), old_text)
                         else:
-                            pattern = re.compile(find_input.text(), re.IGNORECASE)
-                        new_text = pattern.sub(replace_input.text(), old_text)
+                            new_text = self.run_sandboxed_regex(substitute_text, pattern, replace_input.text(), old_text)
                     except re.error as e:
                         QMessageBox.warning(dialog, "Invalid Regex", f"Invalid regular expression:\n{str(e)}")
                         return
+                    if new_text is None:
+                        return
                 else:
                     if case_sensitive.isChecked():
                         new_text = old_text.replace(find_input.text(), replace_input.text())
@@ -1385,53 +4750,52 @@ class CSVEditorWindow(QMainWindow):
             if not find_text:
                 return
             
-            # Perform search
-            self.perform_search(
-                find_text,
-                case_sensitive.isChecked(),
-                whole_word.isChecked(),
-                use_regex.isChecked()
-            )
+            # One compiled pattern for the whole run, applied to csv_data directly
+            try:
+                pattern = self.compile_search_pattern(
+                    find_text, case_sensitive.isChecked(), whole_word.isChecked(), use_regex.isChecked()
+                )
+            except re.error as e:
+                QMessageBox.warning(dialog, "Invalid Regex", f"Invalid regular expression:\n{str(e)}")
+                return
+            
+            # Regex replacements may use group references; plain text is inserted as-is
+            replacement = replace_text if use_regex.isChecked() else literal_replacement(replace_text)
+            try:
+                computed = self.compute_current_file_replacements(
+                    pattern, replacement, regex_literal_prefix(find_text) if use_regex.isChecked() else find_text,
+                    sandboxed=use_regex.isChecked()
+                )
+            except (re.error, IndexError) as e:
+                QMessageBox.warning(dialog, "Invalid Replacement", f"Invalid replacement text:\n{str(e)}")
+                return
+            if computed is None:
+                return  # Timed out or canceled
+            changes, occurrences = computed
             
-            if not self.search_results:
+            if not changes:
+                self.status_bar.showMessage("No matches found")
+                QMessageBox.information(dialog, "No Results", f"No matches found for '{find_text}'")
                 return
             
             # Confirm
             reply = QMessageBox.question(
                 dialog, "Replace All",
-                f"Replace {len(self.search_results)} occurrences?",
+                f"Replace {occurrences} occurrences in {len(changes)} cells?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                replaced_count = 0
-                for row, col in self.search_results:
-                    item = self.csv_table.item(row, col)
-                    if item:
-                        old_text = item.text()
-                        if use_regex.isChecked():
-                            try:
-                                if case_sensitive.isChecked():
-                                    pattern = re.compile(find_text)
-                                else:
-                                    pattern = re.compile(find_text, re.IGNORECASE)
-                                new_text = pattern.sub(replace_text, old_text)
-                            except re.error:
-                                continue
-                        else:
-                            if case_sensitive.isChecked():
-                                new_text = old_text.replace(find_text, replace_text)
-                            else:
-                                pattern = re.compile(re.escape(find_text), re.IGNORECASE)
-                                new_text = pattern.sub(replace_text, old_text)
-                        
-                        item.setText(new_text)
-                        replaced_count += 1
-                
                 self.clear_search_highlights()
                 self.search_results = []
-                self.status_bar.showMessage(f"Replaced {replaced_count} occurrences")
-                QMessageBox.information(dialog, "Replace Complete", f"Replaced {replaced_count} occurrences")
+                self.current_search_index = -1
+                
+                # A single undo step; applying it updates the table in one batch
+                self.undo_stack.push(CellChangesCommand(
+                    self, self.current_file, changes, f"Replace All '{find_text}' ({len(changes)} cells)"
+                ))
+                self.status_bar.showMessage(f"Replaced {occurrences} occurrences in {len(changes)} cells")
+                QMessageBox.information(dialog, "Replace Complete", f"Replaced {occurrences} occurrences")
         
         replace_btn.clicked.connect(do_replace)
         replace_all_btn.clicked.connect(do_replace_all)
@@ -1444,14 +4808,215 @@ class CSVEditorWindow(QMainWindow):
                 self.current_search_index = -1
             dialog.close()
         
-        close_btn.clicked.connect(close_and_clear)
+        close_btn.clicked.connect(close_and_clear)
+        
+        # Clear highlights when dialog is closed (X button)
+        dialog.finished.connect(lambda: self.clear_search_highlights() if self.search_results else None)
+        
+        dialog.exec()
+    
+
+    
+    def show_replace_in_files_dialog(self):
+        """Replace across all imported files, with a per-file preview before applying"""
+        if not self.imported_files:
+            QMessageBox.warning(self, "No Files", "Please import CSV files first.")
+            return
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Replace in All Files")
+        dialog.setMinimumWidth(700)
+        dialog.setMinimumHeight(500)
+        
+        layout = QVBoxLayout()
+        form = QFormLayout()
+        
+        find_input = QLineEdit()
+        find_input.setPlaceholderText("Enter text to find...")
+        form.addRow("Find:", find_input)
+        
+        replace_input = QLineEdit()
+        replace_input.setPlaceholderText("Enter replacement text...")
+        form.addRow("Replace with:", replace_input)
+        
+        options_layout = QHBoxLayout()
+        case_sensitive = QCheckBox("Case sensitive")
+        options_layout.addWidget(case_sensitive)
+        whole_word = QCheckBox("Whole word")
+        options_layout.addWidget(whole_word)
+        use_regex = QCheckBox("Regular expression")
+        options_layout.addWidget(use_regex)
+        options_layout.addStretch()
+        form.addRow(options_layout)
+        layout.addLayout(form)
+        
+        status_label = QLabel(f"{len(self.imported_files)} file(s) will be searched.")
+        layout.addWidget(status_label)
+        
+        preview_tree = QTreeWidget()
+        preview_tree.setHeaderLabels(["Change"])
+        layout.addWidget(preview_tree)
+        
+        button_layout = QHBoxLayout()
+        preview_btn = QPushButton("Preview")
+        apply_btn = QPushButton("Replace All")
+        apply_btn.setEnabled(False)
+        close_btn = QPushButton("Close")
+        button_layout.addWidget(preview_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(apply_btn)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+        
+        dialog.setLayout(layout)
+        
+        # Preview state for the latest run
+        state = {'id': 0, 'cancel': threading.Event(), 'pending': set(), 'results': {}, 'label': ""}
+        
+        def invalidate_preview():
+            state['cancel'].set()
+            state['pending'] = set()
+            state['results'] = {}
+            preview_tree.clear()
+            apply_btn.setEnabled(False)
+        
+        def start_preview():
+            find_text = find_input.text()
+            if not find_text:
+                return
+            try:
+                pattern = self.compile_search_pattern(
+                    find_text, case_sensitive.isChecked(), whole_word.isChecked(), use_regex.isChecked()
+                )
+            except re.error as e:
+                QMessageBox.warning(dialog, "Invalid Regex", f"Invalid regular expression:\n{str(e)}")
+                return
+            replace_text = replace_input.text()
+            # Regex replacements may use group references; plain text is inserted as-is
+            replacement = replace_text if use_regex.isChecked() else literal_replacement(replace_text)
+            
+            invalidate_preview()
+            self.translation_buffer.flush()
+            state['cancel'] = threading.Event()
+            state['id'] += 1
+            state['pending'] = set(self.imported_files)
+            state['label'] = f"Replace '{find_text}' in all files"
+            status_label.setText(f"Computing changes in {len(self.imported_files)} file(s)...")
+            
+            for file_path in self.imported_files:
+                rows = self.get_file_data(file_path)
+                self.file_search_pool.start(FileReplaceTask(
+                    state['id'], file_path, pattern, replacement, self.file_replace_computed,
+                    state['cancel'], list(rows) if rows is not None else None,
+                    self.regex_sandbox if use_regex.isChecked() else None, self.config['regex_time_budget']
+                ))
+        
+        def on_computed(search_id, file_path, result, error):
+            if search_id != state['id'] or file_path not in state['pending']:
+                return
+            state['pending'].discard(file_path)
+            changes, occurrences, rows_read = result
+            
+            if error:
+                file_item = QTreeWidgetItem([f"{Path(file_path).name} — error: {error}"])
+                file_item.setForeground(0, QColor(200, 0, 0))
+                preview_tree.addTopLevelItem(file_item)
+            elif changes:
+                state['results'][file_path] = (changes, occurrences, rows_read)
+                headers = (rows_read or self.get_file_data(file_path) or [[]])[0]
+                file_item = QTreeWidgetItem([
+                    f"{Path(file_path).name}: {occurrences} replacement(s) in {len(changes)} cell(s)"
+                ])
+                file_item.setToolTip(0, file_path)
+                limit = 200
+                for data_row, data_col, old, new in changes[:limit]:
+                    column_name = headers[data_col] if data_col < len(headers) else f"Column {data_col + 1}"
+                    child = QTreeWidgetItem([f"Row {data_row}, {column_name}:  {old}  →  {new}"])
+                    child.setToolTip(0, f"{old}\n→\n{new}")
+                    file_item.addChild(child)
+                if len(changes) > limit:
+                    file_item.addChild(QTreeWidgetItem([f"... and {len(changes) - limit} more"]))
+                preview_tree.addTopLevelItem(file_item)
+            
+            if state['pending']:
+                status_label.setText(f"Computing changes... {len(state['pending'])} file(s) left")
+                return
+            
+            total_cells = sum(len(r[0]) for r in state['results'].values())
+            total_occurrences = sum(r[1] for r in state['results'].values())
+            status_label.setText(
+                f"{total_occurrences} replacement(s) in {total_cells} cell(s) across "
+                f"{len(state['results'])} file(s). Review the changes, then click Replace All."
+                if state['results'] else "No matches found."
+            )
+            apply_btn.setEnabled(bool(state['results']))
+        
+        def apply_changes():
+            if state['pending'] or not state['results']:
+                return
+            self.apply_replace_in_files(state['results'], state['label'])
+            status_label.setText("Replaced. Use Edit > Undo to revert all files in one step.")
+            invalidate_preview()
+        
+        self.file_replace_computed.connect(on_computed)
+        preview_btn.clicked.connect(start_preview)
+        find_input.returnPressed.connect(start_preview)
+        apply_btn.clicked.connect(apply_changes)
+        close_btn.clicked.connect(dialog.close)
         
-        # Clear highlights when dialog is closed (X button)
-        dialog.finished.connect(lambda: self.clear_search_highlights() if self.search_results else None)
+        # Changing the query makes the preview stale
+        find_input.textChanged.connect(invalidate_preview)
+        replace_input.textChanged.connect(invalidate_preview)
+        for checkbox in (case_sensitive, whole_word, use_regex):
+            checkbox.toggled.connect(invalidate_preview)
         
         dialog.exec()
+        state['cancel'].set()
+        self.file_replace_computed.disconnect(on_computed)
     
-
+    def apply_replace_in_files(self, results, label):
+        """Apply previewed replacements {file_path: (changes, occurrences, rows_read)} as one undo step"""
+        total_cells, file_count = self.apply_changes_in_files(
+            {file_path: (changes, rows_read) for file_path, (changes, _, rows_read) in results.items()},
+            label, "Replace in"
+        )
+        if total_cells:
+            self.clear_search_highlights()
+            self.search_results = []
+            self.current_search_index = -1
+        self.status_bar.showMessage(f"Replaced text in {total_cells} cell(s) across {file_count} file(s)")
+    
+    def apply_changes_in_files(self, results, label, file_label):
+        """
+        Apply cell changes {file_path: (changes, rows_read)} computed in the
+        background as one undo step, with one child command per file. Files that
+        are not loaded get their rows into the data store (not the table) and are
+        marked modified for Save All. Returns (cells changed, files changed).
+        """
+        self.translation_buffer.flush()
+        command = QUndoCommand(label)
+        total_cells = 0
+        for file_path, (changes, rows_read) in results.items():
+            data = self.get_file_data(file_path)
+            if data is None:
+                if rows_read is None:
+                    continue
+                self.file_data_cache[file_path] = data = rows_read
+            
+            # Skip cells that changed since the preview was computed
+            current = [
+                change for change in changes
+                if change[0] < len(data) and change[1] < len(data[change[0]])
+                and data[change[0]][change[1]] == change[2]
+            ]
+            if current:
+                CellChangesCommand(self, file_path, current, f"{file_label} {Path(file_path).name}", parent=command)
+                total_cells += len(current)
+        
+        if command.childCount():
+            command.setText(f"{label} ({total_cells} cells)")
+            self.undo_stack.push(command)
+        return total_cells, command.childCount()
     
     def translate_with_google(self, text, source_lang, target_lang):
         if not DEEP_TRANSLATOR_AVAILABLE:
@@ -1497,219 +5062,1108 @@ class CSVEditorWindow(QMainWindow):
             'he': 'he-IL',
         }
         
-        # Convert to lowercase and get first 2 letters
-        source_code = source_lang.lower()[:2]
-        target_code = target_lang.lower()[:2]
+        # Convert to lowercase and get first 2 letters
+        source_code = source_lang.lower()[:2]
+        target_code = target_lang.lower()[:2]
+        
+        # Map to full locale codes
+        source = lang_map.get(source_code, f"{source_code}-{source_code.upper()}")
+        target = lang_map.get(target_code, f"{target_code}-{target_code.upper()}")
+        
+        translator = MyMemoryTranslator(source=source, target=target)
+        return translator.translate(text)
+    
+    def call_translation_service(self, service, text, source_lang, target_lang):
+        """Translate with one specific service"""
+        if service == 'google':
+            return self.translate_with_google(text, source_lang, target_lang)
+        elif service == 'mymemory':
+            return self.translate_with_mymemory(text, source_lang, target_lang)
+        raise Exception(f"Unknown translation service: {service}")
+    
+    def translate_text(self, text, source_lang, target_lang, attempts=None, services=None, first_attempt=1):
+        """
+        Translate text using available services with centralized retry logic.
+        Returns tuple of (translated_text, service_used).
+        
+        If tenacity is available, retries are handled by the decorator.
+        Otherwise, falls back to simple retry logic.
+        
+        attempts overrides the configured retry count; translation jobs pass 1
+        and retry failed segments later through their DeferredRetryQueue.
+        services is the ordered list of services to try (defaults to the
+        enabled services in priority order). first_attempt numbers the first
+        attempt in the translation log, e.g. for a job's deferred retries.
+        
+        Identical (text, source, target) requests that are already in flight,
+        e.g. from another translation job, wait for that request's result
+        instead of calling the service again.
+        
+        With a glossary loaded, its terms are protected or substituted before
+        the services see the text (see Glossary.protect).
+        """
+        if attempts is None:
+            attempts = self.config['retry_count']
+        if services is None:
+            services = self.get_active_services()
+        
+        glossary = self.glossary
+        protected = []
+        if glossary is not None and self.config['glossary_mode'] != "off":
+            text, protected = glossary.protect(text, source_lang, target_lang, self.config['glossary_mode'])
+        
+        def run():
+            if TENACITY_AVAILABLE:
+                return self._translate_text_with_retry(text, source_lang, target_lang, attempts, services, first_attempt)
+            else:
+                return self._translate_text_simple_retry(text, source_lang, target_lang, attempts, services, first_attempt)
+        
+        key = (text, source_lang.upper(), target_lang.upper())
+        result, service_used = self.translation_flight.do(key, run)
+        if protected:
+            result = glossary.restore(result, protected)
+        return result, service_used
+    
+    def choose_glossary(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Load Glossary", "", "CSV Files (*.csv);;All Files (*)"
+        )
+        if file_path:
+            self.load_glossary(file_path)
+    
+    def load_glossary(self, file_path, quiet=False):
+        """Load a glossary CSV and remember it for the next start"""
+        try:
+            glossary = Glossary.load(file_path)
+        except Exception as e:
+            if quiet:
+                print(f"Could not load glossary {file_path}: {e}")
+            else:
+                QMessageBox.critical(self, "Error", f"Failed to load glossary:\n{str(e)}")
+            return False
+        
+        self.glossary = glossary
+        self.unload_glossary_action.setEnabled(True)
+        self.config['glossary_path'] = file_path
+        self.save_config()
+        self.status_bar.showMessage(
+            f"Loaded glossary {Path(file_path).name}: {len(glossary)} terms ({', '.join(glossary.languages())})"
+        )
+        return True
+    
+    def unload_glossary(self):
+        self.glossary = None
+        self.unload_glossary_action.setEnabled(False)
+        self.config['glossary_path'] = ""
+        self.save_config()
+        self.status_bar.showMessage("Glossary unloaded")
+    
+    def set_glossary_mode(self, mode):
+        self.config['glossary_mode'] = mode
+        self.save_config()
+    
+    def get_active_services(self):
+        """Enabled services in priority order"""
+        return [s for s in self.config['priority_order'] if s in self.config['enabled_services']]
+    
+    def _translate_text_core(self, text, source_lang, target_lang, services, attempt=1):
+        """Core translation logic that tries each service in priority order."""
+        last_exception = None
+        
+        # Skip endpoints whose circuit breaker is open
+        services = [s for s in services if not self.is_endpoint_disabled(s)]
+        if not services:
+            raise Exception("All translation services are paused by the circuit breaker")
+        
+        # Services the prober currently reports as down are tried last
+        services = self.rank_services(services)
+        
+        for service in services:
+            if not self.claim_endpoint(service):
+                continue  # Another request is already the trial of this half-open endpoint
+            started = time.perf_counter()
+            try:
+                result = self.call_translation_service(service, text, source_lang, target_lang)
+                latency = time.perf_counter() - started
+                self.log_translation(text, result, service, True, "", latency, attempt)
+                with self.circuit_lock:
+                    self.circuit_breaker.pop(service, None)
+                    self.circuit_trials.discard(service)
+                self.record_endpoint_status(service, True, latency, "", traffic=True)
+                return (result, service)
+            except Exception as e:
+                latency = time.perf_counter() - started
+                self.log_translation(text, '', service, False, str(e), latency, attempt)
+                self.record_endpoint_failure(service)
+                self.record_endpoint_status(service, False, latency, type(e).__name__, traffic=True)
+                last_exception = e
+                continue
+        
+        # All services failed
+        raise last_exception if last_exception else Exception("All translation services failed")
+    
+    def _translate_text_with_retry(self, text, source_lang, target_lang, attempts, services, first_attempt=1):
+        """Translation with tenacity retry decorator."""
+        # Create a retry decorator dynamically based on config
+        retry_decorator = retry(
+            stop=stop_after_attempt(attempts),
+            wait=wait_exponential(multiplier=1, min=1, max=10),
+            reraise=True
+        )
+        
+        # Apply decorator to core translation function, numbering each attempt for the log
+        attempt = [first_attempt - 1]
+        def numbered_attempt():
+            attempt[0] += 1
+            return self._translate_text_core(text, source_lang, target_lang, services, attempt[0])
+        
+        retrying_translate = retry_decorator(numbered_attempt)
+        return retrying_translate()
+    
+    def _translate_text_simple_retry(self, text, source_lang, target_lang, attempts, services, first_attempt=1):
+        """Fallback translation with simple retry logic when tenacity is not available."""
+        max_retries = attempts
+        last_exception = None
+        
+        for attempt in range(max_retries):
+            try:
+                return self._translate_text_core(text, source_lang, target_lang, services, first_attempt + attempt)
+            except Exception as e:
+                last_exception = e
+                if attempt < max_retries - 1:
+                    # Simple exponential backoff
+                    wait_time = min(10, 2 ** attempt)
+                    time.sleep(wait_time)
+                continue
+        
+        # All retries exhausted
+        raise last_exception if last_exception else Exception("All translation services failed")
+    
+    def log_translation(self, source_text, target_text, service, success, error_msg, latency=None, attempt=1):
+        entry = {
+            'timestamp': time.time(),
+            'source': source_text,
+            'target': target_text,
+            'service': service,
+            'success': success,
+            'error': error_msg,
+            'latency': latency,
+            'attempt': attempt,
+            'chars': len(source_text)
+        }
+        self.translation_log.append(entry)
+        self.translation_log_store.append(entry)
+    
+    def check_endpoint_health(self):
+        """
+        Return cached availability per enabled service without blocking.
+        
+        Stale entries are refreshed by background probes; a service that has
+        not been probed yet counts as available if deep-translator is installed.
+        """
+        self.probe_endpoints()
+        with self.endpoint_lock:
+            status = dict(self.endpoint_status)
+        return {
+            service: status[service]['available'] if service in status else DEEP_TRANSLATOR_AVAILABLE
+            for service in self.config['enabled_services']
+        }
+    
+    def probe_endpoints(self, force=False):
+        """
+        Start background probes for enabled services whose status is missing
+        or stale. force probes again even if the last probe is recent, but
+        services with recent real traffic and services whose circuit is open
+        (until its cooldown expires) are never probed.
+        """
+        now = time.time()
+        for service in self.config['enabled_services']:
+            if self.endpoint_cooldown_remaining(service) > 0:
+                continue
+            with self.endpoint_lock:
+                if service in self.probes_in_flight:
+                    continue
+                status = self.endpoint_status.get(service)
+                if (status and now - status['checked_at'] < self.config['health_check_interval']
+                        and (not force or status['traffic'])):
+                    continue
+                self.probes_in_flight.add(service)
+            self.probe_pool.start(EndpointProbe(self, service))
+    
+    def record_probe_result(self, service, available, latency, error_class):
+        """Store a probe result; called from probe threads"""
+        with self.endpoint_lock:
+            self.probes_in_flight.discard(service)
+        # Probes only inform the ranking; the circuit breaker is driven by real requests
+        self.record_endpoint_status(service, available, latency, error_class)
+    
+    def record_endpoint_status(self, service, available, latency, error_class, traffic=False):
+        """Store the latest health observation of a service, from a probe or a real request"""
+        with self.endpoint_lock:
+            self.endpoint_status[service] = {
+                'available': available,
+                'latency': latency,
+                'error': error_class,
+                'checked_at': time.time(),
+                'traffic': traffic
+            }
+        self.endpoint_status_changed.emit()
+    
+    def rank_services(self, services):
+        """Order services so the ones probes report as down come last (order otherwise kept)"""
+        with self.endpoint_lock:
+            down = {s for s, status in self.endpoint_status.items() if not status['available']}
+        return sorted(services, key=lambda s: s in down)
+    
+    def describe_endpoint_status(self, label):
+        """Render cached probe results into a dialog's status label"""
+        health = self.check_endpoint_health()
+        with self.endpoint_lock:
+            status = dict(self.endpoint_status)
+        
+        available = []
+        unavailable = []
+        for service, is_up in health.items():
+            probe = status.get(service)
+            if probe is None:
+                detail = "checking..."
+            elif probe['available']:
+                detail = f"{probe['latency'] * 1000:.0f} ms"
+            else:
+                detail = probe['error'] or "error"
+            (available if is_up else unavailable).append(f"{service} ({detail})")
+        
+        if available:
+            text = f"Available services: {', '.join(available)}"
+            if unavailable:
+                text += f"<br>Unavailable: {', '.join(unavailable)}"
+            label.setText(text)
+            label.setStyleSheet("color: green; font-size: 10px;")
+        else:
+            label.setText(f"No translation services available: {', '.join(unavailable)}")
+            label.setStyleSheet("color: red; font-size: 10px;")
+    
+    def watch_endpoint_status(self, dialog, label):
+        """Keep a dialog's status label current while the dialog is open"""
+        update = lambda: self.describe_endpoint_status(label)
+        update()
+        self.endpoint_status_changed.connect(update)
+        dialog.finished.connect(lambda: self.endpoint_status_changed.disconnect(update))
+    
+    def is_endpoint_disabled(self, endpoint):
+        """
+        Whether requests to endpoint are held back by its circuit breaker. Once
+        the cooldown of an open circuit expires it is half-open: a single trial
+        request is let through, and its outcome closes or reopens the circuit.
+        """
+        with self.circuit_lock:
+            if endpoint not in self.circuit_breaker:
+                return False
+            failures, last_failure = self.circuit_breaker[endpoint]
+            if failures >= self.config['circuit_breaker_threshold']:
+                if time.time() - last_failure < self.config['circuit_breaker_timeout']:
+                    return True
+                return endpoint in self.circuit_trials
+            return False
+    
+    def claim_endpoint(self, endpoint):
+        """Reserve the trial request of a half-open endpoint; False if another request holds it"""
+        with self.circuit_lock:
+            failures, _ = self.circuit_breaker.get(endpoint, (0, 0))
+            if failures < self.config['circuit_breaker_threshold']:
+                return True
+            if endpoint in self.circuit_trials:
+                return False
+            self.circuit_trials.add(endpoint)
+            return True
+    
+    def endpoint_cooldown_remaining(self, endpoint):
+        """Seconds until an open circuit becomes half-open; 0 if the circuit is not open"""
+        with self.circuit_lock:
+            failures, last_failure = self.circuit_breaker.get(endpoint, (0, 0))
+            if failures < self.config['circuit_breaker_threshold']:
+                return 0.0
+            return max(0.0, self.config['circuit_breaker_timeout'] - (time.time() - last_failure))
+    
+    def record_endpoint_failure(self, endpoint):
+        with self.circuit_lock:
+            if endpoint not in self.circuit_breaker:
+                self.circuit_breaker[endpoint] = [0, 0]
+            self.circuit_breaker[endpoint][0] += 1
+            self.circuit_breaker[endpoint][1] = time.time()
+            # A failed trial reopens the circuit for a full cooldown
+            self.circuit_trials.discard(endpoint)
+    
+    def is_circuit_open(self, services=None):
+        """True when every given service (default: all enabled) is disabled by the circuit breaker"""
+        if services is None:
+            services = self.get_active_services()
+        return bool(services) and all(self.is_endpoint_disabled(s) for s in services)
+    
+    def circuit_reopen_delay(self):
+        """Seconds until the first tripped endpoint is allowed to be tried again"""
+        with self.circuit_lock:
+            remaining = [
+                self.config['circuit_breaker_timeout'] - (time.time() - last_failure)
+                for failures, last_failure in self.circuit_breaker.values()
+                if failures >= self.config['circuit_breaker_threshold']
+            ]
+        return max(0.0, min(remaining)) if remaining else 0.0
+    
+    def validate_translation_readiness(self):
+        available = any(self.check_endpoint_health().values())
+        if not available:
+            if not DEEP_TRANSLATOR_AVAILABLE:
+                QMessageBox.warning(
+                    self, 
+                    "No Translation Services", 
+                    "No translation services are available.\n\n"
+                    "The 'deep-translator' package is not installed, so Google Translate "
+                    "and MyMemory are unavailable.\n\n"
+                    "Please install deep-translator: pip install deep-translator"
+                )
+            else:
+                QMessageBox.warning(
+                    self, 
+                    "No Translation Services", 
+                    "No translation services are available. Please check your internet connection or configure alternative services."
+                )
+            return False
+        return True
+    
+
+    
+
+    
+    def translate_selected_cells(self, selected_items, source_lang, target_lang, services=None):
+        """Queue a background job translating the selected cells in place"""
+        if not self.validate_translation_readiness():
+            return
+        
+        # Address cells by (row, data column) so results land correctly even
+        # if the user switches to another file while the job runs
+        header = self.csv_table.horizontalHeader()
+        segments = []
+        for item in selected_items:
+            cell_text = item.text().strip()
+            if cell_text:
+                segments.append(((item.row(), header.visualIndex(item.column())), cell_text))
+        
+        self.enqueue_translation_job(TranslationJob(
+            self.current_file, source_lang, target_lang,
+            services if services is not None else self.get_active_services(),
+            f"{len(segments)} selected cells", segments=segments, unit="cell", notify=True
+        ))
+    
+    def enqueue_translation_job(self, job):
+        """Add a job to the translation queue and start it when a slot is free"""
+        self.translation_jobs.append(job)
+        self.refresh_translation_jobs_panel()
+        self.jobs_dock.show()
+        self.start_queued_translation_jobs()
+    
+    def start_queued_translation_jobs(self):
+        """Start queued jobs up to the configured number of concurrent jobs"""
+        # Paused jobs keep their worker but give their slot to queued jobs
+        running = sum(1 for job in self.translation_jobs if job.status == "Running")
+        for job in self.translation_jobs:
+            if running >= self.config['max_concurrent_jobs']:
+                break
+            if job.status != "Queued":
+                continue
+            
+            # Files already in memory are read from the data store; the worker
+            # reads everything else from disk itself
+            if job.segments is None:
+                data = self.get_file_data(job.file_path)
+                if data is not None:
+                    try:
+                        job.build_segments(data)
+                    except ValueError as e:
+                        job.status = "Skipped"
+                        job.message = str(e)
+                        self.update_translation_job_row(job)
+                        continue
+            
+            self.start_translation_worker(job)
+            running += 1
+    
+    def start_translation_worker(self, job):
+        """Run a job on a TranslationWorker thread"""
+        worker = TranslationWorker(self, job, self)
+        job.worker = worker
+        job.status = "Running"
+        
+        def on_data_loaded(rows):
+            # If the file was opened while the worker read it, the segments must
+            # address the in-memory rows; otherwise keep what the worker read so
+            # results and later edits share one copy
+            if worker.is_canceled():
+                return  # The worker stops without segments
+            data = self.get_file_data(job.file_path)
+            if data is None:
+                self.file_data_cache[job.file_path] = rows
+                data = rows
+            try:
+                job.build_segments(data)
+            except ValueError as e:
+                worker.set_segments_ready(str(e))
+                return
+            worker.set_segments_ready()
+            self.update_translation_job_row(job)
+        
+        def on_result(index, result):
+            key = job.keys[index]
+            if key is None:
+                return  # Its row or column was deleted while the job ran
+            
+            # Remember what each cell held before the job first wrote it, for undo
+            if key in job.changes:
+                job.changes[key] = (job.changes[key][0], result)
+            else:
+                data = self.get_file_data(job.file_path)
+                old = ""
+                if data is not None and key[0] + 1 < len(data) and key[1] < len(data[key[0] + 1]):
+                    old = data[key[0] + 1][key[1]]
+                job.changes[key] = (old, result)
+            self.translation_buffer.add(job.file_path, key[0], key[1], result)
+        
+        def on_progress(snapshot):
+            job.position = snapshot['position']
+            job.message = snapshot['message']
+            job.translated = snapshot['network'] + snapshot['cached']
+            job.cached = snapshot['cached']
+            job.failed = snapshot['failed']
+            job.rate = snapshot['rate']
+            job.eta = snapshot['eta']
+            self.update_translation_job_row(job)
+        
+        def on_error(message):
+            job.status = "Failed"
+            job.message = message
+            self.finish_translation_worker(job)
+        
+        def on_finished(translated_count, failed_count):
+            job.status = "Canceled" if worker.is_canceled() else "Done"
+            job.translated = translated_count
+            job.failed = failed_count
+            job.position = job.total
+            job.eta = None
+            job.message = f"{translated_count} translated, {failed_count} failed"
+            self.finish_translation_worker(job)
+            if job.notify and job.status == "Done":
+                self.show_translation_summary(job.unit, translated_count, failed_count)
+        
+        worker.data_loaded.connect(on_data_loaded)
+        worker.result_ready.connect(on_result)
+        worker.progress_changed.connect(on_progress)
+        worker.job_error.connect(on_error)
+        worker.job_finished.connect(on_finished)
+        worker.finished.connect(worker.deleteLater)
+        
+        self.translation_workers.append(worker)
+        self.update_translation_job_row(job)
+        worker.start()
+    
+    def finish_translation_worker(self, job):
+        """Flush a finished job's results and hand its slot to the next queued job"""
+        self.translation_buffer.flush()
+        
+        # Everything the job wrote is undone in one step
+        changes = [
+            (row + 1, data_col, old, new)
+            for (row, data_col), (old, new) in job.changes.items()
+            if old != new
+        ]
+        job.changes = {}
+        if changes:
+            self.undo_stack.push(CellChangesCommand(
+                self, job.file_path, changes, f"Translate {job.label} ({len(changes)} cells)", done=True
+            ))
+        if job.worker in self.translation_workers:
+            self.translation_workers.remove(job.worker)
+        job.worker = None
+        self.update_translation_job_row(job)
+        self.status_bar.showMessage(f"Translation job {job.status.lower()}: {Path(job.file_path).name} ({job.label})")
+        self.start_queued_translation_jobs()
+    
+    def release_translation_job_cells(self, file_path, cells):
+        """
+        Leave cells changed by another undo command out of pending jobs' undo
+        steps, and drop results not yet written to them, so the job's step
+        (pushed when it finishes) never undoes over a later edit.
+        """
+        jobs = [job for job in self.translation_jobs if job.file_path == file_path and not job.is_finished()]
+        if not jobs:
+            return
+        self.translation_buffer.discard(file_path, cells)
+        for job in jobs:
+            if job.changes:
+                for cell in cells:
+                    job.changes.pop(cell, None)
+    
+    def remap_translation_jobs(self, file_path, map_key):
+        """Follow a structural edit of a file in the keys of its pending translation jobs"""
+        for job in self.translation_jobs:
+            if job.file_path == file_path and not job.is_finished():
+                job.remap(map_key)
+    
+    def cancel_translation_job(self, job):
+        if job.worker:
+            job.message = "Canceling..."
+            job.worker.cancel()
+            self.update_translation_job_row(job)
+        elif not job.is_finished():
+            job.status = "Canceled"
+            self.update_translation_job_row(job)
+    
+    def pause_translation_job(self, job):
+        """Hold a job after its current request; a queued job is not started until resumed"""
+        if job.status == "Running" and job.worker:
+            job.worker.pause()
+        elif job.status != "Queued":
+            return
+        job.status = "Paused"
+        self.update_translation_job_row(job)
+        self.start_queued_translation_jobs()
+    
+    def resume_translation_job(self, job):
+        if job.status != "Paused":
+            return
+        if job.worker:
+            job.worker.resume()
+            job.status = "Running"
+            self.update_translation_job_row(job)
+        else:
+            job.status = "Queued"
+            self.update_translation_job_row(job)
+            self.start_queued_translation_jobs()
+    
+    def get_file_data(self, file_path):
+        """Return the in-memory rows of a file (csv_data if displayed), or None if not loaded"""
+        if file_path == self.current_file:
+            return self.csv_data
+        return self.file_data_cache.get(file_path)
+    
+    def create_translation_jobs_panel(self):
+        """Create the dockable panel listing queued and running translation jobs"""
+        self.jobs_dock = QDockWidget("Translation Jobs", self)
+        self.jobs_dock.setObjectName("TranslationJobsDock")
+        
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
+        layout.setContentsMargins(4, 4, 4, 4)
+        
+        self.jobs_table = QTableWidget(0, 9)
+        self.jobs_table.setHorizontalHeaderLabels(
+            ["File", "Job", "Status", "Progress", "Translated", "Cached", "Failed", "Speed", "ETA"]
+        )
+        self.jobs_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.jobs_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.jobs_table.verticalHeader().setVisible(False)
+        self.jobs_table.horizontalHeader().setStretchLastSection(True)
+        self.jobs_table.setColumnWidth(0, 180)
+        self.jobs_table.setColumnWidth(1, 160)
+        self.jobs_table.setColumnWidth(2, 260)
+        self.jobs_table.setColumnWidth(3, 140)
+        self.jobs_table.cellDoubleClicked.connect(
+            lambda row, col: self.open_file(self.translation_jobs[row].file_path)
+        )
+        layout.addWidget(self.jobs_table)
+        
+        button_layout = QHBoxLayout()
+        pause_btn = QPushButton("Pause Selected")
+        pause_btn.clicked.connect(self.pause_selected_translation_jobs)
+        button_layout.addWidget(pause_btn)
+        
+        resume_btn = QPushButton("Resume Selected")
+        resume_btn.clicked.connect(self.resume_selected_translation_jobs)
+        button_layout.addWidget(resume_btn)
+        
+        cancel_btn = QPushButton("Cancel Selected")
+        cancel_btn.clicked.connect(self.cancel_selected_translation_jobs)
+        button_layout.addWidget(cancel_btn)
+        
+        clear_btn = QPushButton("Clear Finished")
+        clear_btn.clicked.connect(self.clear_finished_translation_jobs)
+        button_layout.addWidget(clear_btn)
+        button_layout.addStretch()
+        layout.addLayout(button_layout)
+        
+        self.jobs_dock.setWidget(panel)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.jobs_dock)
+        self.jobs_dock.hide()
+    
+    def refresh_translation_jobs_panel(self):
+        """Rebuild the job panel rows from self.translation_jobs"""
+        self.jobs_table.setRowCount(len(self.translation_jobs))
+        for row, job in enumerate(self.translation_jobs):
+            self.jobs_table.setItem(row, 0, QTableWidgetItem(Path(job.file_path).name))
+            self.jobs_table.setItem(row, 1, QTableWidgetItem(job.label))
+            for col in (2, 4, 5, 6, 7, 8):
+                self.jobs_table.setItem(row, col, QTableWidgetItem(""))
+            self.jobs_table.setCellWidget(row, 3, QProgressBar())
+            self.update_translation_job_row(job)
+    
+    def update_translation_job_row(self, job):
+        """Refresh one job's status, progress and counts in the panel"""
+        if job not in self.translation_jobs:
+            return
+        row = self.translation_jobs.index(job)
+        if row >= self.jobs_table.rowCount():
+            return
+        
+        status = job.status if not job.message else f"{job.status}: {job.message}"
+        self.jobs_table.item(row, 2).setText(status)
+        self.jobs_table.item(row, 2).setToolTip(status)
+        self.jobs_table.item(row, 4).setText(str(job.translated))
+        self.jobs_table.item(row, 4).setToolTip(
+            f"{job.translated - job.cached} from translation services, {job.cached} reused within the job"
+        )
+        self.jobs_table.item(row, 5).setText(str(job.cached))
+        self.jobs_table.item(row, 6).setText(str(job.failed))
+        self.jobs_table.item(row, 7).setText(
+            f"{job.rate * 60:.1f}/min" if job.rate and job.status == "Running" else ""
+        )
+        self.jobs_table.item(row, 8).setText(
+            self.format_duration(job.eta) if job.eta is not None and job.status == "Running" else ""
+        )
+        
+        progress_bar = self.jobs_table.cellWidget(row, 3)
+        progress_bar.setMaximum(max(job.total, 1))
+        progress_bar.setValue(min(job.position, job.total) if job.total else (1 if job.is_finished() else 0))
+    
+    def format_duration(self, seconds):
+        """Format seconds as e.g. '45s', '12m 05s' or '3h 20m'"""
+        seconds = int(seconds)
+        if seconds < 60:
+            return f"{seconds}s"
+        if seconds < 3600:
+            return f"{seconds // 60}m {seconds % 60:02d}s"
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    
+    def cancel_selected_translation_jobs(self):
+        rows = {index.row() for index in self.jobs_table.selectionModel().selectedRows()}
+        for row in sorted(rows):
+            self.cancel_translation_job(self.translation_jobs[row])
+    
+    def pause_selected_translation_jobs(self):
+        rows = {index.row() for index in self.jobs_table.selectionModel().selectedRows()}
+        for row in sorted(rows):
+            self.pause_translation_job(self.translation_jobs[row])
+    
+    def resume_selected_translation_jobs(self):
+        rows = {index.row() for index in self.jobs_table.selectionModel().selectedRows()}
+        for row in sorted(rows):
+            self.resume_translation_job(self.translation_jobs[row])
+    
+    def clear_finished_translation_jobs(self):
+        self.translation_jobs = [job for job in self.translation_jobs if not job.is_finished()]
+        self.refresh_translation_jobs_panel()
+    
+    def open_file(self, file_path):
+        """Select a file in the tree and display it"""
+        for i in range(self.file_tree.topLevelItemCount()):
+            item = self.file_tree.topLevelItem(i)
+            if item.data(0, Qt.ItemDataRole.UserRole) == file_path:
+                self.file_tree.setCurrentItem(item)
+                if file_path != self.current_file:
+                    self.on_file_selected(item, 0)
+                return True
+        return False
+    
+    def show_translate_files_dialog(self):
+        """Queue background translation of a column across several imported files"""
+        if not self.imported_files:
+            QMessageBox.warning(self, "No Files", "Please import CSV files first.")
+            return
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Translate Files in Background")
+        dialog.setMinimumWidth(500)
+        
+        layout = QFormLayout()
+        
+        # Files to translate
+        file_list = QListWidget()
+        for file_path in self.imported_files:
+            item = QListWidgetItem(Path(file_path).name)
+            item.setData(Qt.ItemDataRole.UserRole, file_path)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked)
+            file_list.addItem(item)
+        layout.addRow("Files:", file_list)
+        
+        # Column names known from files already in memory
+        known_headers = []
+        for file_path in self.imported_files:
+            data = self.get_file_data(file_path)
+            for header in (data[0] if data else []):
+                if header and header not in known_headers:
+                    known_headers.append(header)
+        
+        source_combo = QComboBox()
+        source_combo.setEditable(True)
+        source_combo.addItems(known_headers)
+        source_combo.setEditText("English" if "English" in known_headers else source_combo.currentText())
+        layout.addRow("Source Column:", source_combo)
+        
+        target_combo = QComboBox()
+        target_combo.setEditable(True)
+        target_combo.addItems(known_headers)
+        target_combo.setEditText("Korean" if "Korean" in known_headers else "")
+        layout.addRow("Target Column:", target_combo)
+        
+        source_lang = QLineEdit(detect_lang_code(source_combo.currentText()) or "EN")
+        source_lang.setPlaceholderText("e.g., EN, ZH, JA, KO")
+        layout.addRow("Source Language:", source_lang)
+        
+        target_lang = QLineEdit(detect_lang_code(target_combo.currentText()) or "KO")
+        target_lang.setPlaceholderText("e.g., EN, ZH, JA, KO")
+        layout.addRow("Target Language:", target_lang)
+        
+        source_combo.currentTextChanged.connect(
+            lambda text: source_lang.setText(detect_lang_code(text) or source_lang.text())
+        )
+        target_combo.currentTextChanged.connect(
+            lambda text: target_lang.setText(detect_lang_code(text) or target_lang.text())
+        )
+        
+        # Translation service
+        service_combo = QComboBox()
+        for service in TranslationService:
+            service_combo.addItem(service.value.capitalize(), service.value)
+        service_combo.setCurrentText(self.config['preferred_service'].capitalize())
+        layout.addRow("Translation Service:", service_combo)
+        
+        use_fallback = QCheckBox("Use all available services as fallback")
+        use_fallback.setChecked(True)
+        layout.addRow(use_fallback)
+        
+        info_label = QLabel(
+            f"Files are translated in the background, up to {self.config['max_concurrent_jobs']} at a time. "
+            "Progress is shown in the Translation Jobs panel."
+        )
+        info_label.setWordWrap(True)
+        info_label.setStyleSheet("color: gray; font-size: 10px;")
+        layout.addRow(info_label)
         
-        # Map to full locale codes
-        source = lang_map.get(source_code, f"{source_code}-{source_code.upper()}")
-        target = lang_map.get(target_code, f"{target_code}-{target_code.upper()}")
+        button_layout = QHBoxLayout()
+        translate_btn = QPushButton("Queue")
+        cancel_btn = QPushButton("Cancel")
+        button_layout.addWidget(translate_btn)
+        button_layout.addWidget(cancel_btn)
+        layout.addRow(button_layout)
         
-        translator = MyMemoryTranslator(source=source, target=target)
-        return translator.translate(text)
+        dialog.setLayout(layout)
+        
+        translate_btn.clicked.connect(dialog.accept)
+        cancel_btn.clicked.connect(dialog.reject)
+        
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            source_name = source_combo.currentText().strip()
+            target_name = target_combo.currentText().strip()
+            src_lang = source_lang.text().strip().upper()
+            tgt_lang = target_lang.text().strip().upper()
+            service = service_combo.currentData()
+            
+            if not source_name or not target_name or not src_lang or not tgt_lang:
+                QMessageBox.warning(self, "Invalid Input", "Please enter source and target columns and languages.")
+                return
+            if not self.validate_translation_readiness():
+                return
+            
+            if use_fallback.isChecked():
+                services = [service] + [s for s in self.get_active_services() if s != service]
+            else:
+                services = [service]
+            
+            selected_files = [
+                file_list.item(i).data(Qt.ItemDataRole.UserRole)
+                for i in range(file_list.count())
+                if file_list.item(i).checkState() == Qt.CheckState.Checked
+            ]
+            
+            # Pending translation results of the displayed file must be in csv_data first
+            if self.current_file in selected_files:
+                self.translation_buffer.flush()
+            
+            for file_path in selected_files:
+                self.translation_jobs.append(TranslationJob(
+                    file_path, src_lang, tgt_lang, services, f"{source_name} → {target_name}",
+                    source_column=source_name, target_column=target_name
+                ))
+            
+            self.refresh_translation_jobs_panel()
+            self.jobs_dock.show()
+            self.start_queued_translation_jobs()
+            self.status_bar.showMessage(f"Queued translation of {len(selected_files)} file(s)")
     
-    def translate_text(self, text, source_lang, target_lang):
+    def mark_file_modified(self, file_path):
+        """Flag a file as unsaved after its data changed (and refresh the cache of the displayed file)"""
+        if file_path == self.current_file:
+            self.file_data_cache[file_path] = self.csv_data
+            self.schedule_validation_refresh()
+        self.modified_files.add(file_path)
+        self.update_file_tree_indicators()
+    
+    def insert_data_rows(self, file_path, rows):
         """
-        Translate text using available services with centralized retry logic.
-        Returns tuple of (translated_text, service_used).
-        
-        If tenacity is available, retries are handled by the decorator.
-        Otherwise, falls back to simple retry logic.
+        Insert [(data_row, values)] (ascending) into a file's data, and the table
+        if it is displayed. Each contiguous block is inserted in one operation.
         """
-        if TENACITY_AVAILABLE:
-            return self._translate_text_with_retry(text, source_lang, target_lang)
-        else:
-            return self._translate_text_simple_retry(text, source_lang, target_lang)
-    
-    def _translate_text_core(self, text, source_lang, target_lang):
-        """Core translation logic that tries each service in priority order."""
-        services = self.config['priority_order']
-        last_exception = None
+        self.translation_buffer.flush()
+        data = self.get_file_data(file_path)
+        if data is None:
+            return
         
-        for service in services:
-            if service not in self.config['enabled_services']:
-                continue
-            try:
-                if service == 'google':
-                    result = self.translate_with_google(text, source_lang, target_lang)
-                elif service == 'mymemory':
-                    result = self.translate_with_mymemory(text, source_lang, target_lang)
-                else:
-                    continue
-                self.log_translation(text, result, service, True, "")
-                return (result, service)
-            except Exception as e:
-                self.log_translation(text, '', service, False, str(e))
-                last_exception = e
-                continue
+        values_by_row = dict(rows)
+        blocks = index_blocks([data_row for data_row, _ in rows])
         
-        # All services failed
-        raise last_exception if last_exception else Exception("All translation services failed")
+        if file_path == self.current_file:
+            header = self.csv_table.horizontalHeader()
+            model = self.csv_table.model()
+            col_count = self.csv_table.columnCount()
+            table_cols = [header.logicalIndex(data_col) for data_col in range(col_count)]
+            self.csv_table.itemChanged.disconnect(self.on_cell_changed)
+            try:
+                for first, count in blocks:
+                    model.insertRows(first - 1, count)
+                    for data_row in range(first, first + count):
+                        values = values_by_row[data_row]
+                        for data_col in range(col_count):
+                            text = values[data_col] if data_col < len(values) else ""
+                            self.csv_table.setItem(data_row - 1, table_cols[data_col], QTableWidgetItem(text))
+            finally:
+                self.csv_table.itemChanged.connect(self.on_cell_changed)
+        
+        validator = self.get_current_validator(file_path)
+        for first, count in blocks:
+            data[first:first] = [list(values_by_row[data_row]) for data_row in range(first, first + count)]
+            if validator is not None:
+                validator.rows_inserted(first, count)
+        
+        inserted = [data_row - 1 for data_row, _ in rows]
+        self.remap_translation_jobs(file_path, lambda key: (index_after_insert(key[0], inserted), key[1]))
+        self.invalidate_search_index(file_path)
+        self.mark_file_modified(file_path)
     
-    def _translate_text_with_retry(self, text, source_lang, target_lang):
-        """Translation with tenacity retry decorator."""
-        # Create a retry decorator dynamically based on config
-        retry_decorator = retry(
-            stop=stop_after_attempt(self.config['retry_count']),
-            wait=wait_exponential(multiplier=1, min=1, max=10),
-            reraise=True
-        )
+    def remove_data_rows(self, file_path, data_rows):
+        """
+        Remove rows by data row index from a file's data, and the table if it
+        is displayed. Each contiguous block is removed in one operation.
+        """
+        self.translation_buffer.flush()
+        data = self.get_file_data(file_path)
+        if data is None:
+            return
         
-        # Apply decorator to core translation function
-        retrying_translate = retry_decorator(self._translate_text_core)
-        return retrying_translate(text, source_lang, target_lang)
+        displayed = file_path == self.current_file
+        model = self.csv_table.model()
+        validator = self.get_current_validator(file_path)
+        if displayed:
+            self.csv_table.itemChanged.disconnect(self.on_cell_changed)
+        try:
+            # Bottom block first, so earlier removals don't shift later ones
+            for first, count in reversed(index_blocks(sorted(set(data_rows)))):
+                if displayed:
+                    model.removeRows(first - 1, count)
+                del data[first:first + count]
+                if validator is not None:
+                    validator.rows_removed(first, count)
+        finally:
+            if displayed:
+                self.csv_table.itemChanged.connect(self.on_cell_changed)
+        
+        removed = sorted({data_row - 1 for data_row in data_rows})
+        
+        def map_key(key):
+            row = index_after_remove(key[0], removed)
+            return (row, key[1]) if row is not None else None
+        self.remap_translation_jobs(file_path, map_key)
+        self.invalidate_search_index(file_path)
+        self.mark_file_modified(file_path)
     
-    def _translate_text_simple_retry(self, text, source_lang, target_lang):
-        """Fallback translation with simple retry logic when tenacity is not available."""
-        max_retries = self.config['retry_count']
-        last_exception = None
+    def insert_data_columns(self, file_path, columns):
+        """
+        Insert [(data_col, values)] (ascending; values[0] is the header) into a
+        file's data, and the table if it is displayed. Missing values are empty.
+        """
+        self.translation_buffer.flush()
+        data = self.get_file_data(file_path)
+        if data is None:
+            return
         
-        for attempt in range(max_retries):
-            try:
-                return self._translate_text_core(text, source_lang, target_lang)
-            except Exception as e:
-                last_exception = e
-                if attempt < max_retries - 1:
-                    # Simple exponential backoff
-                    wait_time = min(10, 2 ** attempt)
-                    time.sleep(wait_time)
-                continue
+        for data_col, values in columns:
+            for data_row, row_data in enumerate(data):
+                if len(row_data) < data_col:
+                    row_data.extend([""] * (data_col - len(row_data)))
+                row_data.insert(data_col, values[data_row] if data_row < len(values) else "")
         
-        # All retries exhausted
-        raise last_exception if last_exception else Exception("All translation services failed")
-    
-    def log_translation(self, source_text, target_text, service, success, error_msg):
-        self.translation_log.append({
-            'timestamp': time.time(),
-            'source': source_text,
-            'target': target_text,
-            'service': service,
-            'success': success,
-            'error': error_msg
-        })
-        if len(self.translation_log) > 1000:
-            self.translation_log = self.translation_log[-1000:]
-    
-
+        if file_path == self.current_file:
+            header = self.csv_table.horizontalHeader()
+            self.csv_table.itemChanged.disconnect(self.on_cell_changed)
+            header.blockSignals(True)  # The move below is not a user reorder
+            try:
+                for data_col, values in columns:
+                    # Append a table column, then show it at its data (visual) position
+                    logical = self.csv_table.columnCount()
+                    self.csv_table.insertColumn(logical)
+                    self.csv_table.setHorizontalHeaderItem(logical, QTableWidgetItem(values[0] if values else ""))
+                    for row in range(self.csv_table.rowCount()):
+                        text = values[row + 1] if row + 1 < len(values) else ""
+                        self.csv_table.setItem(row, logical, QTableWidgetItem(text))
+                    header.moveSection(header.visualIndex(logical), data_col)
+                    self.csv_table.setColumnWidth(logical, 150)
+            finally:
+                header.blockSignals(False)
+                self.csv_table.itemChanged.connect(self.on_cell_changed)
+        
+        inserted = [data_col for data_col, _ in columns]
+        self.remap_translation_jobs(file_path, lambda key: (key[0], index_after_insert(key[1], inserted)))
+        self.invalidate_search_index(file_path)
+        self.revalidate_all(file_path)
+        self.mark_file_modified(file_path)
     
-    def check_endpoint_health(self):
-        self.endpoint_status = {}
+    def remove_data_columns(self, file_path, data_cols):
+        """Remove columns by data (visual) index from a file's data, and the table if it is displayed"""
+        self.translation_buffer.flush()
+        data = self.get_file_data(file_path)
+        if data is None:
+            return
         
-        # Only mark Google/MyMemory as available if deep-translator is installed
-        if DEEP_TRANSLATOR_AVAILABLE:
-            self.endpoint_status['google'] = True
-            self.endpoint_status['mymemory'] = True
-        else:
-            self.endpoint_status['google'] = False
-            self.endpoint_status['mymemory'] = False
-    
-    def is_endpoint_disabled(self, endpoint):
-        if endpoint not in self.circuit_breaker:
-            return False
-        failures, last_failure = self.circuit_breaker[endpoint]
-        if failures >= self.config['circuit_breaker_threshold']:
-            if time.time() - last_failure < self.config['circuit_breaker_timeout']:
-                return True
-            else:
-                del self.circuit_breaker[endpoint]
-        return False
-    
-    def record_endpoint_failure(self, endpoint):
-        if endpoint not in self.circuit_breaker:
-            self.circuit_breaker[endpoint] = [0, 0]
-        self.circuit_breaker[endpoint][0] += 1
-        self.circuit_breaker[endpoint][1] = time.time()
-    
-    def validate_translation_readiness(self):
-        self.check_endpoint_health()
-        available = any(self.endpoint_status.values())
-        if not available:
-            if not DEEP_TRANSLATOR_AVAILABLE:
-                QMessageBox.warning(
-                    self, 
-                    "No Translation Services", 
-                    "No translation services are available.\n\n"
-                    "The 'deep-translator' package is not installed, so Google Translate "
-                    "and MyMemory are unavailable.\n\n"
-                    "Please install deep-translator: pip install deep-translator"
-                )
-            else:
-                QMessageBox.warning(
-                    self, 
-                    "No Translation Services", 
-                    "No translation services are available. Please check your internet connection or configure alternative services."
-                )
-            return False
-        return True
-    
-
-    
-
+        header = self.csv_table.horizontalHeader()
+        for data_col in sorted(data_cols, reverse=True):
+            if file_path == self.current_file:
+                self.csv_table.removeColumn(header.logicalIndex(data_col))
+            for row_data in data:
+                if data_col < len(row_data):
+                    del row_data[data_col]
+        
+        removed = sorted(set(data_cols))
+        
+        def map_key(key):
+            data_col = index_after_remove(key[1], removed)
+            return (key[0], data_col) if data_col is not None else None
+        self.remap_translation_jobs(file_path, map_key)
+        self.invalidate_search_index(file_path)
+        self.revalidate_all(file_path)
+        self.mark_file_modified(file_path)
     
-    def translate_selected_cells(self, selected_items, source_lang, target_lang):
-        """Translate selected cells"""
-        if not self.validate_translation_readiness():
+    def move_data_column(self, file_path, from_col, to_col):
+        """Move a column of a file's data, and its table section if the file is displayed"""
+        self.translation_buffer.flush()
+        data = self.get_file_data(file_path)
+        if data is None:
             return
         
-        total_cells = len(selected_items)
+        move_column(data, from_col, to_col)
+        if file_path == self.current_file:
+            header = self.csv_table.horizontalHeader()
+            header.blockSignals(True)  # on_column_moved would record it as a new move
+            try:
+                header.moveSection(from_col, to_col)
+            finally:
+                header.blockSignals(False)
+        
+        self.remap_translation_jobs(file_path, lambda key: (key[0], index_after_move(key[1], from_col, to_col)))
+        self.invalidate_search_index(file_path)
+        self.revalidate_all(file_path)
+        self.mark_file_modified(file_path)
+    
+    def apply_cell_updates(self, file_path, updates):
+        """
+        Write a batch of (row, data_col, text) updates into a file's data.
         
-        # Create progress dialog
-        progress = QProgressDialog("Translating selected cells...", "Cancel", 0, total_cells, self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setMinimumDuration(0)
+        For the displayed file the table items are updated with model signals
+        blocked, followed by a single dataChanged for the touched range, so
+        on_cell_changed does not run per cell; csv_data, the cache and the
+        modified marker are each updated once per batch. Files that are not
+        displayed only have their cached data updated.
+        """
+        if not updates:
+            return
         
-        translated_count = 0
-        failed_count = 0
-        consecutive_failures = 0
-        base_delay = self.config['base_delay']
-        max_delay = 60.0
-        current_delay = base_delay
-        current_service = ""
+        search_index = self.search_indexes.get(file_path)
         
-        for idx, item in enumerate(selected_items):
-            if progress.wasCanceled():
-                break
+        if file_path == self.current_file:
+            header = self.csv_table.horizontalHeader()
+            model = self.csv_table.model()
+            row_count = self.csv_table.rowCount()
+            table_cols = [header.logicalIndex(data_col) for data_col in range(self.csv_table.columnCount())]
+            touched = None  # (top, left, bottom, right)
             
-            progress.setValue(idx)
-            cell_text = item.text().strip()
-            if not cell_text:
-                continue
+            model.blockSignals(True)
+            try:
+                for row, data_col, text in updates:
+                    col = table_cols[data_col] if data_col < len(table_cols) else -1
+                    if row >= row_count or col < 0:
+                        continue
+                    item = self.csv_table.item(row, col)
+                    if item:
+                        item.setText(text)
+                    else:
+                        self.csv_table.setItem(row, col, QTableWidgetItem(text))
+                    
+                    # Keep csv_data in step (row + 1 because csv_data[0] is headers)
+                    if row + 1 < len(self.csv_data):
+                        row_data = self.csv_data[row + 1]
+                        while len(row_data) <= data_col:
+                            row_data.append("")
+                        row_data[data_col] = text
+                        if search_index is not None and text:
+                            search_index.update_cell(row + 1, text)
+                    if touched is None:
+                        touched = (row, col, row, col)
+                    else:
+                        touched = (min(touched[0], row), min(touched[1], col),
+                                   max(touched[2], row), max(touched[3], col))
+            finally:
+                model.blockSignals(False)
             
-            # Translate (retry logic is now centralized in translate_text)
+            if touched is None:
+                return
+            
+            # One range-change notification for the whole batch; the table's own
+            # itemChanged is muted so on_cell_changed does not re-handle it
+            self.csv_table.blockSignals(True)
             try:
-                result, service_used = self.translate_text(cell_text, source_lang, target_lang)
-                current_service = service_used
-                
-                item.setText(result)
-                translated_count += 1
-                consecutive_failures = 0
-                current_delay = max(base_delay, current_delay * 0.9)
-                progress.setLabelText(f"Translating cell {idx + 1} of {total_cells}... (service: {current_service}, delay: {current_delay:.1f}s)")
-                
-                # Rate limiting with jitter
-                time.sleep(current_delay + random.uniform(0, current_delay * 0.1))
-            except Exception as e:
-                failed_count += 1
-                consecutive_failures += 1
-                # Adaptive backoff for consecutive failures
-                wait_time = min(max_delay, base_delay * (2 ** min(consecutive_failures - 1, 4)))
-                current_delay = min(max_delay, current_delay * 1.5)
-                progress.setLabelText(f"⚠️ Failed cell {idx + 1}. Waiting {wait_time:.1f}s...")
-                time.sleep(wait_time)
-        
-        progress.setValue(total_cells)
-        
-        # Show summary
+                model.dataChanged.emit(model.index(touched[0], touched[1]), model.index(touched[2], touched[3]))
+            finally:
+                self.csv_table.blockSignals(False)
+            self.file_data_cache[file_path] = self.csv_data
+        else:
+            data = self.file_data_cache.get(file_path)
+            if not data:
+                return
+            for row, data_col, text in updates:
+                if row + 1 >= len(data):
+                    continue
+                row_data = data[row + 1]
+                while len(row_data) <= data_col:
+                    row_data.append("")
+                row_data[data_col] = text
+                if search_index is not None and text:
+                    search_index.update_cell(row + 1, text)
+        
+        data_rows = {row + 1 for row, _, _ in updates}
+        self.regex_sandbox.rows_changed(file_path, data_rows)
+        self.revalidate_rows(file_path, data_rows)
+        self.modified_files.add(file_path)
+        self.update_file_tree_indicators()
+    
+    def show_translation_summary(self, unit, translated_count, failed_count):
+        """Report the outcome of a finished translation job"""
         if translated_count > 0:
-            message = f"Translation complete!\n\nTranslated: {translated_count} cells"
+            message = f"Translation complete!\n\nTranslated: {translated_count} {unit}s"
             if failed_count > 0:
-                message += f"\nFailed: {failed_count} cells"
+                message += f"\nFailed: {failed_count} {unit}s"
             QMessageBox.information(self, "Translation Complete", message)
-            self.status_bar.showMessage(f"Translated {translated_count} cells")
+            self.status_bar.showMessage(f"Translated {translated_count} {unit}s")
         else:
             QMessageBox.warning(
                 self, "Translation Failed",
-                "No cells were translated.\n\n"
+                f"No {unit}s were translated.\n\n"
                 "Possible causes:\n"
                 "• All translation services are unavailable\n"
                 "• Network connection issues\n"
@@ -1743,6 +6197,9 @@ class CSVEditorWindow(QMainWindow):
             return
         
         menu = QMenu()
+        menu.addAction(self.copy_action)
+        menu.addAction(self.paste_action)
+        menu.addSeparator()
         
         # Translate selected cells
         translate_action = QAction(f"Translate Selected Cells ({len(selected_items)})...", self)
@@ -1776,20 +6233,7 @@ class CSVEditorWindow(QMainWindow):
                 source_combo.addItem(header.text() if header else f"Column {col}", col)
         layout.addRow("Source Column:", source_combo)
         
-        # Auto-detect languages from column names
-        def detect_lang_code(name):
-            name_lower = name.lower()
-            if "english" in name_lower or name_lower == "en":
-                return "EN"
-            elif "chinese" in name_lower or name_lower == "zh":
-                return "ZH"
-            elif "japanese" in name_lower or name_lower == "ja":
-                return "JA"
-            elif "korean" in name_lower or name_lower == "ko":
-                return "KO"
-            return ""
-        
-        # Source language
+        # Source language (auto-detected from column names)
         default_source = detect_lang_code(source_combo.currentText()) or "EN"
         source_lang = QLineEdit(default_source)
         source_lang.setPlaceholderText("e.g., EN, ZH, JA, KO")
@@ -1826,17 +6270,7 @@ class CSVEditorWindow(QMainWindow):
         info_label.setStyleSheet("color: gray; font-size: 10px;")
         layout.addRow(info_label)
         
-        def update_info():
-            self.check_endpoint_health()
-            available = [s for s in self.endpoint_status if self.endpoint_status[s]]
-            if available:
-                info_label.setText(f"Available services: {', '.join(available)}")
-                info_label.setStyleSheet("color: green; font-size: 10px;")
-            else:
-                info_label.setText("No translation services available")
-                info_label.setStyleSheet("color: red; font-size: 10px;")
-        
-        update_info()
+        self.watch_endpoint_status(dialog, info_label)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -1867,33 +6301,14 @@ class CSVEditorWindow(QMainWindow):
             self.config['preferred_service'] = service
             self.save_config()
             
-            # Temporarily adjust priority for this translation only
-            if not fallback:
-                # Save original priority order
-                original_priority = self.config['priority_order'].copy()
-                original_enabled = self.config['enabled_services'].copy()
-                
-                # Temporarily set to single service
-                self.config['priority_order'] = [service]
-                self.config['enabled_services'] = [service]
-                
-                # Start translation
-                self.translate_column(source_col, target_column, src_lang, tgt_lang)
-                
-                # Restore original settings
-                self.config['priority_order'] = original_priority
-                self.config['enabled_services'] = original_enabled
-            else:
+            if fallback:
                 # Use fallback - put selected service first
-                temp_priority = [service] + [s for s in self.config['priority_order'] if s != service]
-                original_priority = self.config['priority_order'].copy()
-                self.config['priority_order'] = temp_priority
-                
-                # Start translation
-                self.translate_column(source_col, target_column, src_lang, tgt_lang)
-                
-                # Restore original priority
-                self.config['priority_order'] = original_priority
+                services = [service] + [s for s in self.get_active_services() if s != service]
+            else:
+                services = [service]
+            
+            # Start translation
+            self.translate_column(source_col, target_column, src_lang, tgt_lang, services)
     
     def show_translate_cells_dialog(self):
         """Show dialog to translate selected cells"""
@@ -1939,17 +6354,7 @@ class CSVEditorWindow(QMainWindow):
         status_label.setStyleSheet("color: gray; font-size: 10px;")
         layout.addRow(status_label)
         
-        def update_status():
-            self.check_endpoint_health()
-            available = [s for s in self.endpoint_status if self.endpoint_status[s]]
-            if available:
-                status_label.setText(f"Available services: {', '.join(available)}")
-                status_label.setStyleSheet("color: green; font-size: 10px;")
-            else:
-                status_label.setText("No translation services available")
-                status_label.setStyleSheet("color: red; font-size: 10px;")
-        
-        update_status()
+        self.watch_endpoint_status(dialog, status_label)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -1984,97 +6389,29 @@ class CSVEditorWindow(QMainWindow):
             self.save_config()
             
             # Start translation
-            self.translate_selected_cells(selected_items, src_lang, tgt_lang)
+            services = self.config['priority_order'] if fallback else [service]
+            self.translate_selected_cells(selected_items, src_lang, tgt_lang, list(services))
     
-    def translate_column(self, source_col, target_col, source_lang, target_lang):
-        """Translate all cells from source column to target column"""
+    def translate_column(self, source_col, target_col, source_lang, target_lang, services=None):
+        """Queue a background job translating source column into target column"""
         if not self.validate_translation_readiness():
             return
         
-        row_count = self.csv_table.rowCount()
-        
-        # Create progress dialog
-        progress = QProgressDialog("Translating...", "Cancel", 0, row_count, self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setMinimumDuration(0)
-        
-        translated_count = 0
-        failed_count = 0
-        consecutive_failures = 0
-        base_delay = self.config['base_delay']
-        max_delay = 60.0
-        current_delay = base_delay
-        current_service = ""
-        paused = False
-        
-        pause_btn = QPushButton("Pause")
-        progress.setCancelButton(pause_btn)
-        pause_btn.clicked.connect(lambda: setattr(progress, 'paused', not getattr(progress, 'paused', False)))
-        
-        for row in range(row_count):
-            if progress.wasCanceled():
-                break
-            
-            while getattr(progress, 'paused', False):
-                QApplication.processEvents()
-                time.sleep(0.1)
-            
-            progress.setValue(row)
-            
-            # Get source text
-            source_item = self.csv_table.item(row, source_col)
-            if not source_item or not source_item.text().strip():
-                continue
-            
-            source_text = source_item.text()
-            
-            # Translate (retry logic is now centralized in translate_text)
-            try:
-                result, service_used = self.translate_text(source_text, source_lang, target_lang)
-                current_service = service_used
-                
-                # Update target cell
-                target_item = self.csv_table.item(row, target_col)
-                if target_item:
-                    target_item.setText(result)
-                else:
-                    self.csv_table.setItem(row, target_col, QTableWidgetItem(result))
-                
-                translated_count += 1
-                consecutive_failures = 0
-                current_delay = max(base_delay, current_delay * 0.9)
-                progress.setLabelText(f"Translating row {row + 1} of {row_count}... (service: {current_service}, delay: {current_delay:.1f}s)")
-                
-                # Rate limiting with jitter
-                time.sleep(current_delay + random.uniform(0, current_delay * 0.1))
-            except Exception as e:
-                failed_count += 1
-                consecutive_failures += 1
-                # Adaptive backoff for consecutive failures
-                wait_time = min(max_delay, base_delay * (2 ** min(consecutive_failures - 1, 4)))
-                current_delay = min(max_delay, current_delay * 1.5)
-                progress.setLabelText(f"⚠️ Failed row {row + 1}. Waiting {wait_time:.1f}s...")
-                time.sleep(wait_time)
-        
-        progress.setValue(row_count)
+        header = self.csv_table.horizontalHeader()
+        source_name = self.csv_table.horizontalHeaderItem(source_col)
+        target_name = self.csv_table.horizontalHeaderItem(target_col)
+        label = (
+            f"{source_name.text() if source_name else f'Column {source_col}'} → "
+            f"{target_name.text() if target_name else f'Column {target_col}'}"
+        )
         
-        # Show summary
-        if translated_count > 0:
-            message = f"Translation complete!\n\nTranslated: {translated_count} rows"
-            if failed_count > 0:
-                message += f"\nFailed: {failed_count} rows"
-            QMessageBox.information(self, "Translation Complete", message)
-            self.status_bar.showMessage(f"Translated {translated_count} rows")
-        else:
-            QMessageBox.warning(
-                self, "Translation Failed", 
-                "No rows were translated.\n\n"
-                "Possible causes:\n"
-                "• All translation services are unavailable\n"
-                "• Network connection issues\n"
-                "• Rate limiting on all services\n\n"
-                "Check Settings > Translation Services Configuration."
-            )
+        # The job reads source cells from csv_data, which is kept in visual column order
+        self.enqueue_translation_job(TranslationJob(
+            self.current_file, source_lang, target_lang,
+            services if services is not None else self.get_active_services(), label,
+            source_column=header.visualIndex(source_col), target_column=header.visualIndex(target_col),
+            notify=True
+        ))
     
     def show_translation_config_dialog(self):
         dialog = QDialog(self)
@@ -2132,6 +6469,22 @@ class CSVEditorWindow(QMainWindow):
         retry_spin.setValue(self.config['retry_count'])
         settings_layout.addRow("Retry Count:", retry_spin)
         
+        retry_budget_spin = QSpinBox()
+        retry_budget_spin.setRange(0, 10000)
+        retry_budget_spin.setValue(self.config['retry_budget'])
+        retry_budget_spin.setToolTip("Deferred retries allowed per translation job before failed segments are given up")
+        settings_layout.addRow("Retry Budget per Job:", retry_budget_spin)
+        
+        jobs_spin = QSpinBox()
+        jobs_spin.setRange(1, 8)
+        jobs_spin.setValue(self.config['max_concurrent_jobs'])
+        settings_layout.addRow("Concurrent Translation Jobs:", jobs_spin)
+        
+        health_spin = QSpinBox()
+        health_spin.setRange(30, 3600)
+        health_spin.setValue(self.config['health_check_interval'])
+        settings_layout.addRow("Health Check Interval (s):", health_spin)
+        
         delay_spin = QDoubleSpinBox()
         delay_spin.setRange(0.1, 30.0)
         delay_spin.setValue(self.config['base_delay'])
@@ -2159,8 +6512,13 @@ class CSVEditorWindow(QMainWindow):
             self.config['priority_order'] = [priority_list.item(i).data(Qt.ItemDataRole.UserRole) for i in range(priority_list.count())]
             self.config['request_timeout'] = timeout_spin.value()
             self.config['retry_count'] = retry_spin.value()
+            self.config['retry_budget'] = retry_budget_spin.value()
+            self.config['max_concurrent_jobs'] = jobs_spin.value()
+            self.config['health_check_interval'] = health_spin.value()
+            self.health_timer.start(self.config['health_check_interval'] * 1000)
             self.config['base_delay'] = delay_spin.value()
             self.save_config()
+            self.probe_endpoints(force=True)
     
     def show_translation_log(self):
         dialog = QDialog(self)
@@ -2178,53 +6536,133 @@ class CSVEditorWindow(QMainWindow):
         overall_stats = QLabel(
             f"<b>Overall:</b> {stats['total']} translations | "
             f"Success: {stats['successful']} ({stats['success_rate']:.1f}%) | "
-            f"Failed: {stats['failed']}"
+            f"Failed: {stats['failed']} | "
+            f"Coalesced: {stats['coalesced']} | "
+            f"{stats['segments_per_minute']:.1f} segments/min | "
+            f"{stats['chars']} chars sent"
         )
+        overall_stats.setToolTip("Coalesced: requests that reused an identical translation already in flight")
         stats_layout.addWidget(overall_stats)
         
         # Per-service statistics
         if stats['by_service']:
             service_stats_text = "<b>By Service:</b><br>"
             for service, service_data in stats['by_service'].items():
+                latency_text = ""
+                if service_data['avg_latency'] is not None:
+                    latency_text = (
+                        f", avg {service_data['avg_latency'] * 1000:.0f} ms, "
+                        f"p50/p95/p99 {service_data['p50'] * 1000:.0f}/"
+                        f"{service_data['p95'] * 1000:.0f}/{service_data['p99'] * 1000:.0f} ms"
+                    )
                 service_stats_text += (
                     f"&nbsp;&nbsp;• {service}: {service_data['total']} total, "
                     f"{service_data['successful']} success, "
                     f"{service_data['failed']} failed "
-                    f"({service_data['success_rate']:.1f}%)<br>"
+                    f"({service_data['success_rate']:.1f}%){latency_text}, "
+                    f"{service_data['segments_per_minute']:.1f} segments/min, "
+                    f"avg attempt {service_data['avg_attempt']:.2f}<br>"
                 )
             service_stats_label = QLabel(service_stats_text)
             stats_layout.addWidget(service_stats_label)
         
+        stored_label = QLabel(f"Stored on disk: {self.translation_log_store.count()} entries")
+        stats_layout.addWidget(stored_label)
+        
         stats_group.setLayout(stats_layout)
         layout.addWidget(stats_group)
         
-        # Log entries list
-        log_label = QLabel("Recent Translations (last 100):")
+        # Filters applied to the list below and to exports
+        filter_group = QGroupBox("Filters")
+        filter_layout = QHBoxLayout()
+        
+        range_check = QCheckBox("Time range:")
+        filter_layout.addWidget(range_check)
+        from_edit = QDateTimeEdit(QDateTime.currentDateTime().addDays(-1))
+        from_edit.setCalendarPopup(True)
+        from_edit.setDisplayFormat("yyyy-MM-dd HH:mm")
+        filter_layout.addWidget(from_edit)
+        filter_layout.addWidget(QLabel("to"))
+        to_edit = QDateTimeEdit(QDateTime.currentDateTime().addSecs(3600))
+        to_edit.setCalendarPopup(True)
+        to_edit.setDisplayFormat("yyyy-MM-dd HH:mm")
+        filter_layout.addWidget(to_edit)
+        
+        filter_layout.addWidget(QLabel("Service:"))
+        service_combo = QComboBox()
+        service_combo.addItem("All")
+        for service in sorted(set(self.translation_log_store.services()) | {s.value for s in TranslationService}):
+            service_combo.addItem(service)
+        filter_layout.addWidget(service_combo)
+        
+        filter_layout.addWidget(QLabel("Status:"))
+        status_combo = QComboBox()
+        status_combo.addItem("All", None)
+        status_combo.addItem("Success", 'success')
+        status_combo.addItem("Failed", 'failed')
+        filter_layout.addWidget(status_combo)
+        
+        filter_layout.addWidget(QLabel("Text:"))
+        text_filter = QLineEdit()
+        text_filter.setPlaceholderText("Source, target or error contains...")
+        filter_layout.addWidget(text_filter)
+        
+        filter_group.setLayout(filter_layout)
+        layout.addWidget(filter_group)
+        
+        def current_filters():
+            filters = {}
+            if range_check.isChecked():
+                filters['start_ts'] = from_edit.dateTime().toSecsSinceEpoch()
+                filters['end_ts'] = to_edit.dateTime().toSecsSinceEpoch()
+            if service_combo.currentText() != "All":
+                filters['services'] = [service_combo.currentText()]
+            filters['status'] = status_combo.currentData()
+            filters['text'] = text_filter.text().strip()
+            return filters
+        
+        # Log entries, read lazily from the persisted log
+        log_label = QLabel()
         layout.addWidget(log_label)
         
-        log_list = QListWidget()
-        log_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
-        
-        # Populate log list with recent entries
-        for entry in reversed(self.translation_log[-100:]):
-            time_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['timestamp']))
-            status = "✓" if entry['success'] else "✗"
-            source_preview = entry['source'][:40] + "..." if len(entry['source']) > 40 else entry['source']
-            target_preview = entry['target'][:40] + "..." if len(entry['target']) > 40 else entry['target']
-            
-            item_text = f"{status} {time_str} [{entry['service']}] {source_preview} → {target_preview}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, entry)  # Store full entry data
-            
-            # Color code by status
-            if entry['success']:
-                item.setForeground(QColor(0, 128, 0))  # Green for success
-            else:
-                item.setForeground(QColor(200, 0, 0))  # Red for failure
-            
-            log_list.addItem(item)
-        
-        layout.addWidget(log_list)
+        log_model = TranslationLogModel(self.translation_log_store, dialog)
+        log_view = QTableView()
+        log_view.setModel(log_model)
+        log_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        log_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        log_view.verticalHeader().setVisible(False)
+        log_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        log_view.horizontalHeader().setStretchLastSection(True)
+        log_view.setColumnWidth(0, 140)
+        log_view.setColumnWidth(1, 50)
+        log_view.setColumnWidth(2, 80)
+        log_view.setColumnWidth(3, 250)
+        
+        def apply_filters():
+            log_model.set_filters(**current_filters())
+            update_log_label()
+            update_details()
+        
+        def update_log_label(finished=True):
+            searching = " — searching..." if log_model.scanning else ""
+            log_label.setText(f"Translations ({log_model.rowCount()} shown, newest first){searching}:")
+        
+        log_model.scan_progress.connect(update_log_label)
+        
+        # Text filter rescans the log, so wait until typing pauses
+        text_timer = QTimer(dialog)
+        text_timer.setSingleShot(True)
+        text_timer.setInterval(300)
+        text_timer.timeout.connect(apply_filters)
+        text_filter.textChanged.connect(text_timer.start)
+        
+        range_check.toggled.connect(apply_filters)
+        from_edit.dateTimeChanged.connect(lambda: range_check.isChecked() and apply_filters())
+        to_edit.dateTimeChanged.connect(lambda: range_check.isChecked() and apply_filters())
+        service_combo.currentIndexChanged.connect(apply_filters)
+        status_combo.currentIndexChanged.connect(apply_filters)
+        
+        layout.addWidget(log_view)
         
         # Details section
         details_group = QGroupBox("Selected Entry Details")
@@ -2237,15 +6675,20 @@ class CSVEditorWindow(QMainWindow):
         details_group.setLayout(details_layout)
         layout.addWidget(details_group)
         
+        def selected_entry():
+            rows = log_view.selectionModel().selectedRows()
+            return log_model.entry(rows[0].row()) if rows else None
+        
         # Update details when selection changes
         def update_details():
-            selected_items = log_list.selectedItems()
-            if selected_items:
-                entry = selected_items[0].data(Qt.ItemDataRole.UserRole)
+            entry = selected_entry()
+            if entry:
                 time_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['timestamp']))
                 details = f"Timestamp: {time_str}\n"
                 details += f"Service: {entry['service']}\n"
                 details += f"Status: {'SUCCESS' if entry['success'] else 'FAILED'}\n"
+                if entry.get('latency') is not None:
+                    details += f"Latency: {entry['latency'] * 1000:.0f} ms (attempt {entry.get('attempt', 1)})\n"
                 details += f"Source Text: {entry['source']}\n"
                 details += f"Target Text: {entry['target']}\n"
                 if not entry['success'] and entry['error']:
@@ -2254,7 +6697,8 @@ class CSVEditorWindow(QMainWindow):
             else:
                 details_text.setPlainText("Select an entry to view details...")
         
-        log_list.itemSelectionChanged.connect(update_details)
+        log_view.selectionModel().selectionChanged.connect(update_details)
+        apply_filters()
         
         # Button layout
         button_layout = QHBoxLayout()
@@ -2262,9 +6706,8 @@ class CSVEditorWindow(QMainWindow):
         copy_details_btn = QPushButton("Copy Error Details")
         copy_details_btn.setToolTip("Copy error details of selected failed entry to clipboard")
         def copy_error_details():
-            selected_items = log_list.selectedItems()
-            if selected_items:
-                entry = selected_items[0].data(Qt.ItemDataRole.UserRole)
+            entry = selected_entry()
+            if entry:
                 if not entry['success']:
                     time_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['timestamp']))
                     error_info = f"Translation Error Report\n"
@@ -2289,15 +6732,20 @@ class CSVEditorWindow(QMainWindow):
         button_layout.addWidget(copy_details_btn)
         
         export_json_btn = QPushButton("Export to JSON")
-        export_json_btn.setToolTip("Export full log to JSON file")
-        export_json_btn.clicked.connect(lambda: self.export_translation_log('json'))
+        export_json_btn.setToolTip("Export the filtered log to a JSON file")
+        export_json_btn.clicked.connect(lambda: self.export_translation_log('json', **current_filters()))
         button_layout.addWidget(export_json_btn)
         
         export_csv_btn = QPushButton("Export to CSV")
-        export_csv_btn.setToolTip("Export log to CSV file")
-        export_csv_btn.clicked.connect(lambda: self.export_translation_log('csv'))
+        export_csv_btn.setToolTip("Export the filtered log to a CSV file")
+        export_csv_btn.clicked.connect(lambda: self.export_translation_log('csv', **current_filters()))
         button_layout.addWidget(export_csv_btn)
         
+        export_metrics_btn = QPushButton("Export Metrics")
+        export_metrics_btn.setToolTip("Export a snapshot of the per-service latency and throughput metrics")
+        export_metrics_btn.clicked.connect(self.export_translation_metrics)
+        button_layout.addWidget(export_metrics_btn)
+        
         clear_btn = QPushButton("Clear Log")
         clear_btn.clicked.connect(lambda: self.clear_translation_log() or dialog.close())
         button_layout.addWidget(clear_btn)
@@ -2310,43 +6758,18 @@ class CSVEditorWindow(QMainWindow):
         
         dialog.setLayout(layout)
         dialog.exec()
+        log_model.stop()
     
     def get_translation_stats(self):
-        """Calculate detailed translation statistics including per-service breakdown"""
-        total = len(self.translation_log)
-        successful = sum(1 for e in self.translation_log if e['success'])
-        failed = total - successful
-        success_rate = (successful / total * 100) if total > 0 else 0
-        
-        # Per-service statistics
-        by_service = {}
-        for entry in self.translation_log:
-            service = entry['service']
-            if service not in by_service:
-                by_service[service] = {'total': 0, 'successful': 0, 'failed': 0}
-            
-            by_service[service]['total'] += 1
-            if entry['success']:
-                by_service[service]['successful'] += 1
-            else:
-                by_service[service]['failed'] += 1
-        
-        # Calculate success rate per service
-        for service in by_service:
-            service_total = by_service[service]['total']
-            service_successful = by_service[service]['successful']
-            by_service[service]['success_rate'] = (service_successful / service_total * 100) if service_total > 0 else 0
-        
-        return {
-            'total': total,
-            'successful': successful,
-            'failed': failed,
-            'success_rate': success_rate,
-            'by_service': by_service
-        }
+        """Detailed translation statistics including per-service breakdown"""
+        stats = self.translation_log.stats()
+        stats['coalesced'] = self.translation_flight.coalesced
+        return stats
     
-    def export_translation_log(self, format_type='json'):
-        """Export translation log to JSON or CSV format"""
+    def export_translation_log(self, format_type='json', start_ts=None, end_ts=None, services=None,
+                               status=None, text=""):
+        """Export the persisted translation log to JSON or CSV, streaming from disk"""
+        entries = self.translation_log_store.iter_entries(start_ts, end_ts, services, status, text)
         if format_type == 'json':
             file_path, _ = QFileDialog.getSaveFileName(
                 self, "Export Translation Log", "", "JSON Files (*.json);;All Files (*)"
@@ -2354,7 +6777,12 @@ class CSVEditorWindow(QMainWindow):
             if file_path:
                 try:
                     with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(self.translation_log, f, indent=2, ensure_ascii=False)
+                        # Written entry by entry so memory use does not grow with the log
+                        f.write("[")
+                        for count, entry in enumerate(entries):
+                            f.write(",\n  " if count else "\n  ")
+                            f.write(json.dumps(entry, ensure_ascii=False))
+                        f.write("\n]\n")
                     QMessageBox.information(self, "Export Success", f"Log exported to {file_path}")
                 except Exception as e:
                     QMessageBox.critical(self, "Export Failed", f"Failed to export log:\n{str(e)}")
@@ -2368,10 +6796,11 @@ class CSVEditorWindow(QMainWindow):
                     with open(file_path, 'w', encoding='utf-8', newline='') as f:
                         writer = csv.writer(f)
                         # Write header
-                        writer.writerow(['Timestamp', 'Service', 'Status', 'Source Text', 'Target Text', 'Error'])
+                        writer.writerow(['Timestamp', 'Service', 'Status', 'Source Text', 'Target Text', 'Error',
+                                         'Latency (ms)', 'Attempt', 'Chars'])
                         
                         # Write data
-                        for entry in self.translation_log:
+                        for entry in entries:
                             time_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['timestamp']))
                             status = 'SUCCESS' if entry['success'] else 'FAILED'
                             writer.writerow([
@@ -2380,19 +6809,47 @@ class CSVEditorWindow(QMainWindow):
                                 status,
                                 entry['source'],
                                 entry['target'],
-                                entry.get('error', '')
+                                entry.get('error', ''),
+                                f"{entry['latency'] * 1000:.0f}" if entry.get('latency') is not None else '',
+                                entry.get('attempt', ''),
+                                entry.get('chars', len(entry['source']))
                             ])
                     QMessageBox.information(self, "Export Success", f"Log exported to {file_path}")
                 except Exception as e:
                     QMessageBox.critical(self, "Export Failed", f"Failed to export log:\n{str(e)}")
     
+    def export_translation_metrics(self):
+        """Export per-service latency percentiles, histograms and throughput to JSON"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export Translation Metrics", "", "JSON Files (*.json);;All Files (*)"
+        )
+        if not file_path:
+            return
+        
+        stats = self.get_translation_stats()
+        snapshot = {
+            'generated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'latency_bucket_bounds': TranslationLog.LATENCY_BUCKETS,
+            'throughput_window_seconds': TranslationLog.THROUGHPUT_WINDOW,
+            **stats
+        }
+        try:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, indent=2)
+            QMessageBox.information(self, "Export Success", f"Metrics exported to {file_path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Export Failed", f"Failed to export metrics:\n{str(e)}")
+    
     def clear_translation_log(self):
-        self.translation_log = []
+        self.translation_log.clear()
+        self.translation_log_store.clear()
+        self.translation_flight.reset_coalesced()
         QMessageBox.information(self, "Log Cleared", "Translation log has been cleared.")
 
 
 
 def main():
+    multiprocessing.freeze_support()  # Regex sandbox workers re-run the frozen executable
     app = QApplication(sys.argv)
     window = CSVEditorWindow()
     window.show()
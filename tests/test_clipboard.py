@@ -0,0 +1,27 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+from csv_editor import parse_clipboard_block, rows_to_tsv
+
+
+@pytest.mark.parametrize("rows", [
+    [["a\nb"]],
+    [["a,b\nc"]],
+    [["a,b"], ["x\ny"]],
+    [["Key", "Text"], ["k1", "Line one\nLine two"]],
+    [['He said "hi"'], ["ok"]],
+    [["tab\there"]],
+])
+def test_copy_paste_round_trip(rows):
+    assert parse_clipboard_block(rows_to_tsv(rows)) == rows
+
+
+def test_prose_with_commas_is_one_cell_per_line():
+    assert parse_clipboard_block("Hello, world\nBye, moon") == [["Hello, world"], ["Bye, moon"]]
+
+
+def test_quoted_csv_is_split_on_commas():
+    assert parse_clipboard_block('"a","b"\n"c","d"\n') == [["a", "b"], ["c", "d"]]